@@ -45,24 +45,42 @@ testing has 100% coverage with unit tests and hours of stress.
 
 """
 
+from .frozen import FrozenSortedDict, FrozenSortedList, FrozenSortedSet
+from .mappedsortedlist import MappedSortedList
+from .priorityqueue import SortedPriorityQueue
 from .sorteddict import (
+    SortedColocatedDict,
     SortedDict,
     SortedItemsView,
     SortedKeysView,
     SortedValuesView,
 )
-from .sortedlist import SortedKeyList, SortedList, SortedListWithKey
+from .sortedlist import (
+    SortedAggregateList,
+    SortedArrayList,
+    SortedKeyList,
+    SortedList,
+    SortedListWithKey,
+)
 from .sortedset import SortedSet
 
 __all__ = [
     'SortedList',
     'SortedKeyList',
     'SortedListWithKey',
+    'SortedAggregateList',
+    'SortedArrayList',
+    'MappedSortedList',
     'SortedDict',
+    'SortedColocatedDict',
     'SortedKeysView',
     'SortedItemsView',
     'SortedValuesView',
     'SortedSet',
+    'SortedPriorityQueue',
+    'FrozenSortedList',
+    'FrozenSortedSet',
+    'FrozenSortedDict',
 ]
 
 __title__ = 'sortedcontainers'
@@ -0,0 +1,520 @@
+"""Asyncio Sorted Containers
+==========================
+
+:doc:`Sorted Containers<index>` is an Apache2 licensed Python sorted
+collections library, written in pure-Python, and fast as C-extensions. The
+:doc:`introduction<introduction>` is the best way to get started.
+
+Sorted container implementations with awaitable waits for asyncio:
+
+.. currentmodule:: sortedcontainers.aio
+
+* :class:`AsyncSortedList`
+* :class:`AsyncSortedDict`
+
+"""
+
+import asyncio
+from operator import itemgetter
+
+from .sorteddict import SortedDict
+from .sortedlist import SortedKeyList, SortedList, identity, recursive_repr
+
+
+def _wake(futures):
+    "Set result of pending `futures` so their waiters run."
+    for future in futures:
+        if not future.done():
+            future.set_result(None)
+
+
+def _make_reader(name, doc):
+    "Make method that calls `name` of the wrapped sorted container."
+
+    def method(self, *args, **kwargs):
+        return getattr(self._container, name)(*args, **kwargs)
+
+    method.__name__ = name
+    method.__doc__ = doc
+    return method
+
+
+class _AsyncSorted:
+    """Base of asyncio sorted containers.
+
+    Subtypes set `_container` to the wrapped sorted container and `_list` to
+    its sorted list, and call `_inserted` and `_removed` after mutations.
+    Subtypes also define `_first` to return the first value and first entry
+    of the sorted container and `_pop_first` to remove and return the first
+    entry.
+
+    Waiters are futures kept in sorted lists keyed by the bound they wait
+    for. An insertion bisects the waiters to find those it satisfies so it
+    costs `O(log(w))` plus the waiters woken rather than waking every waiter.
+
+    """
+
+    def __init__(self):
+        self._bound_waiters = SortedKeyList(key=itemgetter(0))
+        self._front_waiters = []
+        self._range_waiters = SortedKeyList(key=itemgetter(0))
+        self._open_waiters = []
+
+    @property
+    def key(self):
+        "Function used to extract comparison key from values."
+        return self._list.key
+
+    def _sort_key(self, value):
+        return (self._list.key or identity)(value)
+
+    def _inserted(self, value):
+        """Wake waiters satisfied by inserting `value`.
+
+        Bound waiters with bounds at least the key of `value` are woken. Front
+        waiters are woken when `value` is inserted at index zero. Range
+        waiters receive `value` when it is in their range.
+
+        """
+        sort_key = self._sort_key(value)
+        _bound_waiters = self._bound_waiters
+
+        if _bound_waiters:
+            pos = _bound_waiters.bisect_key_left(sort_key)
+            woken = _bound_waiters[pos:]
+            del _bound_waiters[pos:]
+            _wake(future for _, future in woken)
+
+        if self._front_waiters and not self._list.bisect_left(value):
+            self._wake_front()
+
+        for watcher in self._open_waiters:
+            watcher(sort_key, value)
+
+        for _, watcher in self._range_waiters.irange_key(max_key=sort_key):
+            watcher(sort_key, value)
+
+    def _removed(self, index):
+        "Wake front waiters when the value at `index` was removed."
+        if not index:
+            self._wake_front()
+
+    def _wake_front(self):
+        futures = self._front_waiters
+        self._front_waiters = []
+        _wake(futures)
+
+    async def wait_for_key_le(self, bound):
+        """Wait until the first key is less than or equal to `bound`.
+
+        Returns the first entry without removing it. Waiters are kept sorted
+        by `bound` and woken by insertions of keys less than or equal to it.
+
+        Runtime complexity: `O(log(n))` -- approximate.
+
+        :param bound: maximum key
+        :return: first entry
+
+        """
+        loop = asyncio.get_running_loop()
+        sort_bound = self._sort_key(bound)
+        _bound_waiters = self._bound_waiters
+
+        while True:
+            if self._list:
+                first, entry = self._first()
+
+                if not sort_bound < self._sort_key(first):
+                    return entry
+
+            waiter = (sort_bound, loop.create_future())
+            _bound_waiters.add(waiter)
+
+            try:
+                await waiter[1]
+            finally:
+                if waiter in _bound_waiters:
+                    _bound_waiters.remove(waiter)
+
+    async def pop_when(self, pred):
+        """Wait until `pred` is true for the first value then remove it.
+
+        The predicate is called with the first value, or the first key of a
+        sorted dict. It is called again each time a value is inserted at or
+        removed from the front, not on a timer.
+
+        :param pred: callable of first value
+        :return: removed first entry
+
+        """
+        loop = asyncio.get_running_loop()
+
+        while True:
+            if self._list:
+                first, _ = self._first()
+
+                if pred(first):
+                    return self._pop_first()
+
+            future = loop.create_future()
+            self._front_waiters.append(future)
+
+            try:
+                await future
+            finally:
+                if future in self._front_waiters:
+                    self._front_waiters.remove(future)
+
+    async def airange(self, minimum=None, maximum=None, inclusive=(True, True)):
+        """Asynchronously iterate values between `minimum` and `maximum`.
+
+        Values present when iteration starts are yielded in sorted order.
+        Afterwards values inserted in the range are yielded in order of
+        insertion until the iterator is closed with ``aclose()``.
+
+        :param minimum: minimum value to start iterating
+        :param maximum: maximum value to stop iterating
+        :param inclusive: pair of booleans
+        :return: asynchronous iterator
+
+        """
+        queue = asyncio.Queue()
+        min_key = None if minimum is None else self._sort_key(minimum)
+        max_key = None if maximum is None else self._sort_key(maximum)
+        lo_inclusive, hi_inclusive = inclusive
+
+        def watcher(sort_key, value):
+            if min_key is not None and not lo_inclusive and sort_key == min_key:
+                return
+            if max_key is not None and (
+                max_key < sort_key or (not hi_inclusive and sort_key == max_key)
+            ):
+                return
+            queue.put_nowait(value)
+
+        present = list(self._list.irange(minimum, maximum, inclusive))
+
+        if min_key is None:
+            self._open_waiters.append(watcher)
+        else:
+            self._range_waiters.add((min_key, watcher))
+
+        try:
+            for value in present:
+                yield value
+
+            while True:
+                yield await queue.get()
+        finally:
+            if min_key is None:
+                self._open_waiters.remove(watcher)
+            else:
+                self._range_waiters.remove((min_key, watcher))
+
+    def __len__(self):
+        """Return the size of the sorted container.
+
+        ``len(c)``
+
+        """
+        return len(self._container)
+
+    def __contains__(self, value):
+        """Return true if `value` is an element of the sorted container.
+
+        ``value in c``
+
+        """
+        return value in self._container
+
+    def __iter__(self):
+        "Return an iterator over the sorted container."
+        return iter(self._container)
+
+    def __reversed__(self):
+        "Return a reverse iterator over the sorted container."
+        return reversed(self._container)
+
+    bisect_left = _make_reader('bisect_left', 'See :func:`SortedList.bisect_left`.')
+    bisect_right = _make_reader('bisect_right', 'See :func:`SortedList.bisect_right`.')
+    bisect = bisect_right
+    index = _make_reader('index', 'See :func:`SortedList.index`.')
+    irange = _make_reader('irange', 'See :func:`SortedList.irange`.')
+    islice = _make_reader('islice', 'See :func:`SortedList.islice`.')
+
+    def clear(self):
+        "Remove all values from sorted container."
+        self._container.clear()
+        self._removed(0)
+
+    @recursive_repr()
+    def __repr__(self):
+        """Return string representation of asyncio sorted container.
+
+        ``c.__repr__()`` <==> ``repr(c)``
+
+        :return: string representation
+
+        """
+        return f'{type(self).__name__}({self._container!r})'
+
+    def _check(self):
+        """Check invariants of asyncio sorted container.
+
+        Runtime complexity: `O(n)`
+
+        """
+        self._container._check()
+        self._bound_waiters._check()
+        self._range_waiters._check()
+
+
+class AsyncSortedList(_AsyncSorted):
+    """Asyncio sorted list is a sorted list with awaitable waits.
+
+    Coroutines may wait for values to be inserted rather than polling:
+
+    * :func:`AsyncSortedList.wait_for_key_le` waits for a small enough value.
+    * :func:`AsyncSortedList.pop_when` waits for the first value to satisfy a
+      predicate and removes it.
+    * :func:`AsyncSortedList.airange` yields values in a range as they are
+      inserted.
+
+    Methods are not thread-safe and must be called from the event loop.
+
+    >>> import asyncio
+    >>> async def main():
+    ...     asl = AsyncSortedList([5])
+    ...     waiter = asyncio.ensure_future(asl.pop_when(lambda value: value < 3))
+    ...     await asyncio.sleep(0)
+    ...     asl.add(1)
+    ...     return await waiter, list(asl)
+    >>> asyncio.run(main())
+    (1, [5])
+
+    """
+
+    def __init__(self, iterable=None, key=None):
+        """Initialize asyncio sorted list instance.
+
+        See :func:`SortedList.__init__` for details of arguments.
+
+        :param iterable: initial values (optional)
+        :param key: function used to extract comparison key (optional)
+
+        """
+        _AsyncSorted.__init__(self)
+        self._list = self._container = SortedList(iterable, key=key)
+
+    def _first(self):
+        "Return first value twice. Values are the entries of sorted lists."
+        value = self._list[0]
+        return value, value
+
+    def _pop_first(self):
+        "Remove and return first value."
+        return self.pop(0)
+
+    def __getitem__(self, index):
+        """Lookup value at `index` in sorted list.
+
+        See :func:`SortedList.__getitem__` for details.
+
+        """
+        return self._list[index]
+
+    def __delitem__(self, index):
+        """Remove value at `index` from sorted list.
+
+        See :func:`SortedList.__delitem__` for details.
+
+        """
+        del self._list[index]
+        self._wake_front()
+
+    def add(self, value):
+        """Add `value` to sorted list and wake waiters it satisfies.
+
+        Runtime complexity: `O(log(n) + log(w))` -- approximate.
+
+        :param value: value to add
+
+        """
+        self._list.add(value)
+        self._inserted(value)
+
+    def update(self, iterable):
+        """Update sorted list with values from `iterable` and wake waiters.
+
+        :param iterable: iterable of values to add
+
+        """
+        values = list(iterable)
+        self._list.update(values)
+
+        for value in values:
+            self._inserted(value)
+
+    def discard(self, value):
+        """Remove `value` from sorted list if it is a member.
+
+        :param value: value to discard
+
+        """
+        if value in self._list:
+            self.remove(value)
+
+    def remove(self, value):
+        """Remove `value` from sorted list.
+
+        :param value: value to remove
+        :raises ValueError: if `value` is not in sorted list
+
+        """
+        index = self._list.index(value)
+        del self._list[index]
+        self._removed(index)
+
+    def pop(self, index=-1):
+        """Remove and return value at `index` in sorted list.
+
+        See :func:`SortedList.pop` for details.
+
+        """
+        value = self._list.pop(index)
+        self._removed(index if index >= 0 else index + len(self._list) + 1)
+        return value
+
+    count = _make_reader('count', 'See :func:`SortedList.count`.')
+
+
+class AsyncSortedDict(_AsyncSorted):
+    """Asyncio sorted dict is a sorted dict with awaitable waits.
+
+    Useful as a time-ordered scheduler: a coroutine awaiting
+    :func:`AsyncSortedDict.wait_for_key_le` is woken when an item with a
+    small enough key is stored instead of polling
+    :func:`SortedDict.peekitem`. Waits and iterators see keys. See
+    :class:`AsyncSortedList` for the waiting methods.
+
+    Methods are not thread-safe and must be called from the event loop.
+
+    >>> import asyncio
+    >>> async def main():
+    ...     asd = AsyncSortedDict({10: 'later'})
+    ...     waiter = asyncio.ensure_future(asd.wait_for_key_le(5))
+    ...     await asyncio.sleep(0)
+    ...     asd[3] = 'soon'
+    ...     return await waiter
+    >>> asyncio.run(main())
+    (3, 'soon')
+
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize asyncio sorted dict instance.
+
+        See :func:`SortedDict.__init__` for details of arguments.
+
+        """
+        _AsyncSorted.__init__(self)
+        self._container = SortedDict(*args, **kwargs)
+        self._list = self._container._list
+
+    def _first(self):
+        "Return first key and first item. Items are the entries of sorted dicts."
+        item = self._container.peekitem(0)
+        return item[0], item
+
+    def _pop_first(self):
+        "Remove and return first item."
+        return self.popitem(0)
+
+    def __getitem__(self, key):
+        """Return value for item identified by `key`.
+
+        ``asd.__getitem__(key)`` <==> ``asd[key]``
+
+        :raises KeyError: if key not found
+
+        """
+        return self._container[key]
+
+    def __setitem__(self, key, value):
+        """Store item with `key` and `value` and wake waiters new keys satisfy.
+
+        ``asd.__setitem__(key, value)`` <==> ``asd[key] = value``
+
+        """
+        _container = self._container
+        inserted = key not in _container
+        _container[key] = value
+
+        if inserted:
+            self._inserted(key)
+
+    def __delitem__(self, key):
+        """Remove item identified by `key`.
+
+        ``asd.__delitem__(key)`` <==> ``del asd[key]``
+
+        :raises KeyError: if key not found
+
+        """
+        if key not in self._container:
+            raise KeyError(key)
+
+        index = self._list.index(key)
+        del self._container[key]
+        self._removed(index)
+
+    get = _make_reader('get', 'See :meth:`dict.get`.')
+    peekitem = _make_reader('peekitem', 'See :func:`SortedDict.peekitem`.')
+    keys = _make_reader('keys', 'See :func:`SortedDict.keys`.')
+    items = _make_reader('items', 'See :func:`SortedDict.items`.')
+    values = _make_reader('values', 'See :func:`SortedDict.values`.')
+
+    def setdefault(self, key, default=None):
+        """Return value for item identified by `key`, storing `default` if
+        missing.
+
+        See :func:`SortedDict.setdefault` for details.
+
+        """
+        if key in self._container:
+            return self._container[key]
+
+        self[key] = default
+        return default
+
+    def update(self, *args, **kwargs):
+        """Update sorted dict with items from `args` and `kwargs`.
+
+        Each new key wakes the waiters it satisfies.
+
+        """
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def pop(self, key, *default):
+        """Remove and return value for item identified by `key`.
+
+        See :func:`SortedDict.pop` for details.
+
+        """
+        if key not in self._container:
+            return self._container.pop(key, *default)
+
+        value = self._container[key]
+        del self[key]
+        return value
+
+    def popitem(self, index=-1):
+        """Remove and return `(key, value)` pair at `index` from sorted dict.
+
+        See :func:`SortedDict.popitem` for details.
+
+        """
+        item = self._container.popitem(index)
+        self._removed(index if index >= 0 else index + len(self._list) + 1)
+        return item
@@ -0,0 +1,661 @@
+"""Concurrent Sorted Containers
+==============================
+
+:doc:`Sorted Containers<index>` is an Apache2 licensed Python sorted
+collections library, written in pure-Python, and fast as C-extensions. The
+:doc:`introduction<introduction>` is the best way to get started.
+
+Concurrent sorted container implementations:
+
+.. currentmodule:: sortedcontainers.concurrent
+
+* :class:`RWLock`
+* :class:`ConcurrentSortedList`
+* :class:`ConcurrentSortedDict`
+
+"""
+
+from contextlib import contextmanager
+from itertools import chain
+from operator import itemgetter
+from threading import Condition, Lock, get_ident
+
+from .sorteddict import (
+    SortedDict,
+    SortedItemsView,
+    SortedKeysView,
+    SortedKeyValueList,
+    SortedValuesView,
+)
+from .sortedlist import SortedList, recursive_repr
+
+
+class RWLock:
+    """Readers-writer lock.
+
+    Many threads may hold the read lock at once while the write lock is held
+    by one thread and excludes all readers. Waiting writers block new readers
+    so a steady stream of readers cannot starve writers.
+
+    The write lock is reentrant and the thread holding it may also acquire
+    the read lock. The read lock is not reentrant and may not be upgraded to
+    the write lock.
+
+    >>> lock = RWLock()
+    >>> with lock.read():
+    ...     pass
+    >>> with lock.write():
+    ...     pass
+
+    """
+
+    def __init__(self):
+        """Initialize readers-writer lock instance."""
+        self._cond = Condition(Lock())
+        self._readers = 0
+        self._writers = 0
+        self._owner = None
+        self._depth = 0
+
+    def acquire_read(self):
+        """Acquire the read lock, blocking while a writer holds or waits."""
+        ident = get_ident()
+
+        with self._cond:
+            if self._owner == ident:
+                self._depth += 1
+                return
+
+            while self._owner is not None or self._writers:
+                self._cond.wait()
+
+            self._readers += 1
+
+    def release_read(self):
+        """Release the read lock.
+
+        :raises RuntimeError: if the read lock is not held
+
+        """
+        with self._cond:
+            if self._owner == get_ident():
+                self._depth -= 1
+                return
+
+            if not self._readers:
+                raise RuntimeError('release unlocked lock')
+
+            self._readers -= 1
+
+            if not self._readers:
+                self._cond.notify_all()
+
+    def acquire_write(self):
+        """Acquire the write lock, blocking while any other thread holds it."""
+        ident = get_ident()
+
+        with self._cond:
+            if self._owner == ident:
+                self._depth += 1
+                return
+
+            self._writers += 1
+
+            try:
+                while self._owner is not None or self._readers:
+                    self._cond.wait()
+            finally:
+                self._writers -= 1
+
+            self._owner = ident
+            self._depth = 1
+
+    def release_write(self):
+        """Release the write lock.
+
+        :raises RuntimeError: if the write lock is not held by this thread
+
+        """
+        with self._cond:
+            if self._owner != get_ident():
+                raise RuntimeError('release unlocked lock')
+
+            self._depth -= 1
+
+            if not self._depth:
+                self._owner = None
+                self._cond.notify_all()
+
+    @contextmanager
+    def read(self):
+        """Return context manager that holds the read lock."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self):
+        """Return context manager that holds the write lock."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+def _make_reader(name, doc):
+    "Make method that calls `name` holding the read lock."
+
+    def method(self, *args, **kwargs):
+        with self._read():
+            return getattr(self._container, name)(*args, **kwargs)
+
+    method.__name__ = name
+    method.__doc__ = doc
+    return method
+
+
+def _make_snapshot_iterator(name, doc):
+    "Make method that returns an iterator `name` of a sorted list snapshot."
+
+    def method(self, *args, **kwargs):
+        with self._read():
+            _list = self._list.snapshot()
+        return getattr(_list, name)(*args, **kwargs)
+
+    method.__name__ = name
+    method.__doc__ = doc
+    return method
+
+
+def _make_range_iterator(name, doc):
+    "Make method that returns an iterator of `name` collected holding the lock."
+
+    def method(self, *args, **kwargs):
+        with self._read():
+            return iter(list(getattr(self._container, name)(*args, **kwargs)))
+
+    method.__name__ = name
+    method.__doc__ = doc
+    return method
+
+
+def _make_writer(name, doc):
+    "Make method that calls `name` holding the write lock."
+
+    def method(self, *args, **kwargs):
+        with self._lock.write():
+            return getattr(self._container, name)(*args, **kwargs)
+
+    method.__name__ = name
+    method.__doc__ = doc
+    return method
+
+
+class _ConcurrentSorted:
+    """Base of concurrent sorted containers.
+
+    Subtypes set `_container` to the wrapped sorted container and `_list` to
+    its sorted list. Iterators are created from a copy-on-write snapshot of
+    the sorted list. See :func:`SortedList.snapshot`.
+
+    """
+
+    def __init__(self):
+        self._lock = RWLock()
+
+    @contextmanager
+    def _read(self):
+        """Return context manager that holds the read lock.
+
+        Sorted lists build their positional index lazily while reading. The
+        index is built holding the write lock so readers never build it
+        concurrently.
+
+        """
+        _lock = self._lock
+        _list = self._list
+
+        while True:
+            _lock.acquire_read()
+
+            if _list._index or not _list._lists:
+                break
+
+            _lock.release_read()
+
+            with _lock.write():
+                if not _list._index and _list._lists:
+                    _list._build_index()
+
+        try:
+            yield
+        finally:
+            _lock.release_read()
+
+    @contextmanager
+    def read(self):
+        """Return context manager that holds the read lock and yields the
+        wrapped sorted container.
+
+        Use the context manager to batch several reads. The wrapped container
+        must not be mutated within the context.
+
+        """
+        with self._read():
+            yield self._container
+
+    @contextmanager
+    def write(self):
+        """Return context manager that holds the write lock and yields the
+        wrapped sorted container.
+
+        Use the context manager to batch several mutations under one
+        acquisition of the lock.
+
+        """
+        with self._lock.write():
+            yield self._container
+
+    @property
+    def key(self):
+        "Function used to extract comparison key from values."
+        return self._container.key
+
+    def __len__(self):
+        """Return the size of the sorted container.
+
+        ``len(c)``
+
+        """
+        return len(self._container)
+
+    def __contains__(self, value):
+        """Return true if `value` is an element of the sorted container.
+
+        ``value in c``
+
+        """
+        with self._read():
+            return value in self._container
+
+    def copy(self):
+        """Return a shallow copy of the wrapped sorted container.
+
+        Runtime complexity: `O(n)`
+
+        :return: new sorted container
+
+        """
+        with self._read():
+            return self._container.copy()
+
+    __iter__ = _make_snapshot_iterator(
+        '__iter__', 'Return an iterator over a snapshot of the sorted list.'
+    )
+    __reversed__ = _make_snapshot_iterator(
+        '__reversed__', 'Return a reverse iterator over a snapshot.'
+    )
+    bisect_left = _make_reader('bisect_left', 'See :func:`SortedList.bisect_left`.')
+    bisect_right = _make_reader('bisect_right', 'See :func:`SortedList.bisect_right`.')
+    bisect = bisect_right
+    index = _make_reader('index', 'See :func:`SortedList.index`.')
+    irange = _make_snapshot_iterator(
+        'irange', 'Return :func:`SortedList.irange` of a snapshot.'
+    )
+    islice = _make_snapshot_iterator(
+        'islice', 'Return :func:`SortedList.islice` of a snapshot.'
+    )
+    clear = _make_writer('clear', 'Remove all values holding the write lock.')
+    pop = _make_writer('pop', 'See :func:`SortedList.pop`.')
+
+    @recursive_repr()
+    def __repr__(self):
+        """Return string representation of concurrent sorted container.
+
+        ``c.__repr__()`` <==> ``repr(c)``
+
+        :return: string representation
+
+        """
+        with self._read():
+            return f'{type(self).__name__}({self._container!r})'
+
+
+class ConcurrentSortedList(_ConcurrentSorted):
+    """Concurrent sorted list is a thread-safe wrapper of a sorted list.
+
+    Methods hold a readers-writer lock so many threads may read the sorted
+    list at once while mutations hold the lock exclusively. See
+    :class:`RWLock` for details.
+
+    Iterators are created from a snapshot taken holding the read lock. Later
+    mutations do not affect them. See :func:`SortedList.snapshot`.
+
+    Use :func:`ConcurrentSortedList.read` and
+    :func:`ConcurrentSortedList.write` to batch several operations under one
+    acquisition of the lock.
+
+    >>> csl = ConcurrentSortedList([3, 1, 2])
+    >>> csl.add(0)
+    >>> csl.bisect_left(2)
+    2
+    >>> with csl.write() as sl:
+    ...     sl.update([5, 4])
+    >>> list(csl.irange(2, 4))
+    [2, 3, 4]
+
+    """
+
+    def __init__(self, iterable=None, key=None):
+        """Initialize concurrent sorted list instance.
+
+        See :func:`SortedList.__init__` for details of arguments.
+
+        :param iterable: initial values (optional)
+        :param key: function used to extract comparison key (optional)
+
+        """
+        _ConcurrentSorted.__init__(self)
+        self._list = self._container = SortedList(iterable, key=key)
+
+    def __getitem__(self, index):
+        """Lookup value at `index` in sorted list.
+
+        See :func:`SortedList.__getitem__` for details.
+
+        """
+        with self._read():
+            return self._list[index]
+
+    def __delitem__(self, index):
+        """Remove value at `index` from sorted list.
+
+        See :func:`SortedList.__delitem__` for details.
+
+        """
+        with self._lock.write():
+            del self._list[index]
+
+    def snapshot(self):
+        """Return a copy-on-write snapshot of the sorted list.
+
+        See :func:`SortedList.snapshot` for details.
+
+        Runtime complexity: `O(n/m)` where `m` is the load-factor
+
+        :return: new sorted list
+
+        """
+        with self._read():
+            return self._list.snapshot()
+
+    count = _make_reader('count', 'See :func:`SortedList.count`.')
+    bisect_key_left = _make_reader(
+        'bisect_key_left', 'See :func:`SortedKeyList.bisect_key_left`.'
+    )
+    bisect_key_right = _make_reader(
+        'bisect_key_right', 'See :func:`SortedKeyList.bisect_key_right`.'
+    )
+    bisect_key = bisect_key_right
+    irange_key = _make_snapshot_iterator(
+        'irange_key', 'Return :func:`SortedKeyList.irange_key` of a snapshot.'
+    )
+    add = _make_writer('add', 'See :func:`SortedList.add`.')
+    update = _make_writer('update', 'See :func:`SortedList.update`.')
+    discard = _make_writer('discard', 'See :func:`SortedList.discard`.')
+    remove = _make_writer('remove', 'See :func:`SortedList.remove`.')
+
+    def _check(self):
+        """Check invariants of concurrent sorted list.
+
+        Runtime complexity: `O(n)`
+
+        """
+        with self._lock.write():
+            self._list._check()
+
+
+class ConcurrentSortedDict(_ConcurrentSorted):
+    """Concurrent sorted dict is a thread-safe wrapper of a sorted dict.
+
+    Methods hold a readers-writer lock so many threads may read the sorted
+    dict at once while mutations hold the lock exclusively. See
+    :class:`RWLock` for details.
+
+    Iterators over all keys are created from a copy-on-write snapshot of the
+    sorted keys taken holding the read lock. See :func:`SortedList.snapshot`.
+    Iterators over a range or slice collect their keys, items or values
+    holding the read lock. Later mutations do not affect either.
+
+    The views returned by :func:`ConcurrentSortedDict.keys`,
+    :func:`ConcurrentSortedDict.items` and :func:`ConcurrentSortedDict.values`
+    are dynamic and hold the lock for each operation. Iterators over items and
+    values snapshot the sorted keys. Values are shared copy-on-write with the
+    snapshot when the wrapped sorted dict is a :class:`SortedColocatedDict`.
+    Otherwise they are looked up holding the read lock as each sublist of keys
+    is iterated and items deleted since the snapshot are skipped.
+
+    >>> csd = ConcurrentSortedDict({'b': 2, 'a': 1})
+    >>> csd['c'] = 3
+    >>> csd.peekitem(0)
+    ('a', 1)
+    >>> list(csd.items())
+    [('a', 1), ('b', 2), ('c', 3)]
+
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize concurrent sorted dict instance.
+
+        See :func:`SortedDict.__init__` for details of arguments.
+
+        """
+        _ConcurrentSorted.__init__(self)
+        self._container = self._new_dict(*args, **kwargs)
+        self._list = self._container._list
+
+    def _new_dict(self, *args, **kwargs):
+        """Return new sorted dict to wrap.
+
+        Subtypes may return a :class:`SortedColocatedDict` instead.
+
+        """
+        return SortedDict(*args, **kwargs)
+
+    def __getitem__(self, key):
+        """Return value for item identified by `key`.
+
+        ``csd.__getitem__(key)`` <==> ``csd[key]``
+
+        :raises KeyError: if key not found
+
+        """
+        with self._read():
+            return self._container[key]
+
+    def __setitem__(self, key, value):
+        """Store item with `key` and corresponding `value`.
+
+        ``csd.__setitem__(key, value)`` <==> ``csd[key] = value``
+
+        """
+        with self._lock.write():
+            self._container[key] = value
+
+    def __delitem__(self, key):
+        """Remove item identified by `key`.
+
+        ``csd.__delitem__(key)`` <==> ``del csd[key]``
+
+        :raises KeyError: if key not found
+
+        """
+        with self._lock.write():
+            del self._container[key]
+
+    get = _make_reader('get', 'See :meth:`dict.get`.')
+    peekitem = _make_reader('peekitem', 'See :func:`SortedDict.peekitem`.')
+    irange = _make_range_iterator(
+        'irange', 'Return iterator of :func:`SortedDict.irange` keys.'
+    )
+    islice = _make_range_iterator(
+        'islice', 'Return iterator of :func:`SortedDict.islice` keys.'
+    )
+    irange_items = _make_range_iterator(
+        'irange_items', 'Return iterator of :func:`SortedDict.irange_items`.'
+    )
+    irange_values = _make_range_iterator(
+        'irange_values', 'Return iterator of :func:`SortedDict.irange_values`.'
+    )
+    islice_items = _make_range_iterator(
+        'islice_items', 'Return iterator of :func:`SortedDict.islice_items`.'
+    )
+    islice_values = _make_range_iterator(
+        'islice_values', 'Return iterator of :func:`SortedDict.islice_values`.'
+    )
+    setdefault = _make_writer('setdefault', 'See :func:`SortedDict.setdefault`.')
+    update = _make_writer('update', 'See :func:`SortedDict.update`.')
+    popitem = _make_writer('popitem', 'See :func:`SortedDict.popitem`.')
+    delete_range = _make_writer('delete_range', 'See :func:`SortedDict.delete_range`.')
+    pop_range = _make_writer('pop_range', 'See :func:`SortedDict.pop_range`.')
+
+    def snapshot(self):
+        """Return a snapshot of the sorted dict.
+
+        See :func:`SortedDict.snapshot` for details.
+
+        Runtime complexity: `O(n)` -- copying the dict's items only
+
+        :return: new sorted dict
+
+        """
+        with self._read():
+            return self._container.snapshot()
+
+    def keys(self):
+        """Return sorted keys view of the concurrent sorted dict."""
+        return _ConcurrentKeysView(self)
+
+    def items(self):
+        """Return sorted items view of the concurrent sorted dict."""
+        return _ConcurrentItemsView(self)
+
+    def values(self):
+        """Return sorted values view of the concurrent sorted dict."""
+        return _ConcurrentValuesView(self)
+
+    def _iter_items(self, reverse=False):
+        """Return iterator of items of a snapshot of the sorted keys.
+
+        Runtime complexity: `O(n/m)` where `m` is the load-factor -- to start
+
+        :param bool reverse: yield items in reverse order
+        :return: iterator
+
+        """
+        with self._read():
+            _list = self._list.snapshot()
+
+        _lists = _list._lists
+
+        if isinstance(_list, SortedKeyValueList):
+            _values = _list._values
+
+            if reverse:
+                _lists = map(reversed, reversed(_lists))
+                _values = map(reversed, reversed(_values))
+
+            return zip(chain.from_iterable(_lists), chain.from_iterable(_values))
+
+        if reverse:
+            _lists = map(reversed, reversed(_lists))
+
+        return chain.from_iterable(map(self._items_of, _lists))
+
+    def _items_of(self, keys):
+        """Return list of items with `keys` holding the read lock.
+
+        Keys no longer in the sorted dict are skipped.
+
+        """
+        _container = self._container
+
+        with self._lock.read():
+            return [(key, _container[key]) for key in keys if key in _container]
+
+    def _check(self):
+        """Check invariants of concurrent sorted dict.
+
+        Runtime complexity: `O(n)`
+
+        """
+        with self._lock.write():
+            self._container._check()
+
+
+class _ConcurrentView:
+    """Mixin of sorted views of a concurrent sorted dict.
+
+    Indexing holds the read lock and deleting holds the write lock on the
+    concurrent sorted dict in `_mapping`. Subtypes set `_view` to the sorted
+    view of the wrapped sorted dict.
+
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, index):
+        """Lookup at `index` holding the read lock. Supports slicing."""
+        _mapping = self._mapping
+
+        with _mapping._read():
+            return self._view(_mapping._container)[index]
+
+    def __delitem__(self, index):
+        """Remove at `index` holding the write lock. Supports slicing."""
+        _mapping = self._mapping
+
+        with _mapping._lock.write():
+            del self._view(_mapping._container)[index]
+
+
+class _ConcurrentKeysView(_ConcurrentView, SortedKeysView):
+    "Sorted keys view of a concurrent sorted dict."
+
+    __slots__ = ()
+    _view = SortedKeysView
+
+    def __iter__(self):
+        return iter(self._mapping)
+
+    def __reversed__(self):
+        return reversed(self._mapping)
+
+
+class _ConcurrentItemsView(_ConcurrentView, SortedItemsView):
+    "Sorted items view of a concurrent sorted dict."
+
+    __slots__ = ()
+    _view = SortedItemsView
+
+    def __iter__(self):
+        return self._mapping._iter_items()
+
+    def __reversed__(self):
+        return self._mapping._iter_items(reverse=True)
+
+
+class _ConcurrentValuesView(_ConcurrentView, SortedValuesView):
+    "Sorted values view of a concurrent sorted dict."
+
+    __slots__ = ()
+    _view = SortedValuesView
+
+    def __iter__(self):
+        return map(itemgetter(1), self._mapping._iter_items())
+
+    def __reversed__(self):
+        return map(itemgetter(1), self._mapping._iter_items(reverse=True))
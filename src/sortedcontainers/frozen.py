@@ -0,0 +1,794 @@
+"""Frozen Sorted Containers
+=========================
+
+:doc:`Sorted Containers<index>` is an Apache2 licensed Python sorted
+collections library, written in pure-Python, and fast as C-extensions. The
+:doc:`introduction<introduction>` is the best way to get started.
+
+Persistent sorted container implementations:
+
+.. currentmodule:: sortedcontainers
+
+* :class:`FrozenSortedList`
+* :class:`FrozenSortedSet`
+* :class:`FrozenSortedDict`
+
+"""
+
+from collections.abc import ItemsView, Mapping, Sequence, Set, ValuesView
+from itertools import chain
+from operator import eq, methodcaller
+
+from .sorteddict import SortedKeyValueList
+from .sortedlist import SortedList, identity, recursive_repr
+
+
+def _evolve(sorted_list, change):
+    """Return new version of `sorted_list` changed by calling `change`.
+
+    The new version is a snapshot of `sorted_list` so only the sublists that
+    `change` modifies are copied and all others are shared. The snapshot
+    bookkeeping is discarded afterwards because shared sublists are never
+    changed in place: every later version starts from a new snapshot.
+
+    :param sorted_list: sorted list to change
+    :param change: callable applied to new version
+    :return: new sorted list
+
+    """
+    result = sorted_list.snapshot()
+    del sorted_list._shared
+    change(result)
+    del result._shared
+    return result
+
+
+class FrozenSortedList(Sequence):
+    """Frozen sorted list is an immutable, persistent sorted sequence.
+
+    Frozen sorted list values are maintained in sorted order. Methods that
+    would change a sorted list instead return a new version and leave the
+    frozen sorted list unchanged. Versions share all the sublists they do not
+    change so a new version costs `O(n/m)` pointers plus one sublist rather
+    than a full copy.
+
+    Frozen sorted list values must be comparable and hashable if the frozen
+    sorted list is hashed. The total ordering of values must not change
+    while they are stored in the frozen sorted list.
+
+    Methods for adding and removing values:
+
+    * :func:`FrozenSortedList.add`
+    * :func:`FrozenSortedList.update`
+    * :func:`FrozenSortedList.discard`
+    * :func:`FrozenSortedList.remove`
+
+    Methods for looking up values:
+
+    * :func:`FrozenSortedList.bisect_left`
+    * :func:`FrozenSortedList.bisect_right`
+    * :func:`FrozenSortedList.count`
+    * :func:`FrozenSortedList.index`
+
+    Methods for iterating values:
+
+    * :func:`FrozenSortedList.irange`
+    * :func:`FrozenSortedList.islice`
+    * :func:`FrozenSortedList.__iter__`
+    * :func:`FrozenSortedList.__reversed__`
+
+    >>> fsl = FrozenSortedList([3, 1, 2])
+    >>> fsl.add(0)
+    FrozenSortedList([0, 1, 2, 3])
+    >>> fsl
+    FrozenSortedList([1, 2, 3])
+
+    """
+
+    def __init__(self, iterable=None, key=None):
+        """Initialize frozen sorted list instance.
+
+        Optional `iterable` argument provides an initial iterable of values to
+        initialize the frozen sorted list.
+
+        Optional `key` argument defines a callable that, like the `key`
+        argument to Python's `sorted` function, extracts a comparison key from
+        each value.
+
+        Runtime complexity: `O(n*log(n))`
+
+        :param iterable: initial values (optional)
+        :param key: function used to extract comparison key (optional)
+
+        """
+        self._list = SortedList(iterable, key=key)
+
+    @classmethod
+    def _fromlist(cls, sorted_list):
+        """Initialize frozen sorted list from existing sorted list.
+
+        Used internally by methods that return a new version.
+
+        """
+        result = object.__new__(cls)
+        result._list = sorted_list
+        return result
+
+    def _evolve(self, change):
+        return self._fromlist(_evolve(self._list, change))
+
+    @property
+    def key(self):
+        """Function used to extract comparison key from values."""
+        return self._list.key
+
+    def add(self, value):
+        """Return new version with `value` added.
+
+        Runtime complexity: `O(log(n))` -- approximate.
+
+        >>> FrozenSortedList([1, 3]).add(2)
+        FrozenSortedList([1, 2, 3])
+
+        :param value: value to add
+        :return: new frozen sorted list
+
+        """
+        return self._evolve(methodcaller('add', value))
+
+    def update(self, iterable):
+        """Return new version with values from `iterable` added.
+
+        Runtime complexity: `O(k*log(n))` -- approximate.
+
+        >>> FrozenSortedList([1, 3]).update([4, 2])
+        FrozenSortedList([1, 2, 3, 4])
+
+        :param iterable: iterable of values to add
+        :return: new frozen sorted list
+
+        """
+        values = list(iterable)
+
+        if not values:
+            return self
+
+        return self._evolve(methodcaller('update', values))
+
+    def discard(self, value):
+        """Return new version with `value` removed.
+
+        If `value` is not a member then return the frozen sorted list itself.
+
+        Runtime complexity: `O(log(n))` -- approximate.
+
+        >>> FrozenSortedList([1, 2, 3]).discard(2)
+        FrozenSortedList([1, 3])
+
+        :param value: value to discard
+        :return: new frozen sorted list
+
+        """
+        if value not in self._list:
+            return self
+
+        return self._evolve(methodcaller('discard', value))
+
+    def remove(self, value):
+        """Return new version with `value` removed.
+
+        If `value` is not a member then raise :exc:`ValueError`.
+
+        Runtime complexity: `O(log(n))` -- approximate.
+
+        :param value: value to remove
+        :return: new frozen sorted list
+        :raises ValueError: if `value` is not a member
+
+        """
+        if value not in self._list:
+            raise ValueError(f'{value!r} not in list')
+
+        return self._evolve(methodcaller('discard', value))
+
+    def __len__(self):
+        """Return the size of the frozen sorted list.
+
+        ``fsl.__len__()`` <==> ``len(fsl)``
+
+        :return: size of frozen sorted list
+
+        """
+        return len(self._list)
+
+    def __contains__(self, value):
+        """Return true if `value` is an element of the frozen sorted list.
+
+        ``fsl.__contains__(value)`` <==> ``value in fsl``
+
+        Runtime complexity: `O(log(n))`
+
+        :param value: search for value in frozen sorted list
+        :return: true if `value` in frozen sorted list
+
+        """
+        return value in self._list
+
+    def __getitem__(self, index):
+        """Lookup value at `index` in frozen sorted list.
+
+        ``fsl.__getitem__(index)`` <==> ``fsl[index]``
+
+        Supports slicing which returns a list of values.
+
+        Runtime complexity: `O(log(n))` -- single index lookup
+
+        :param index: integer or slice for indexing
+        :return: value or list of values
+        :raises IndexError: if index out of range
+
+        """
+        return self._list[index]
+
+    def __iter__(self):
+        """Return an iterator over the frozen sorted list.
+
+        ``fsl.__iter__()`` <==> ``iter(fsl)``
+
+        """
+        return iter(self._list)
+
+    def __reversed__(self):
+        """Return a reverse iterator over the frozen sorted list.
+
+        ``fsl.__reversed__()`` <==> ``reversed(fsl)``
+
+        """
+        return reversed(self._list)
+
+    def bisect_left(self, value):
+        """Return an index to insert `value` in the frozen sorted list.
+
+        See :func:`SortedList.bisect_left` for details.
+
+        """
+        return self._list.bisect_left(value)
+
+    def bisect_right(self, value):
+        """Return an index to insert `value` in the frozen sorted list.
+
+        See :func:`SortedList.bisect_right` for details.
+
+        """
+        return self._list.bisect_right(value)
+
+    bisect = bisect_right
+
+    def count(self, value):
+        """Return number of occurrences of `value` in the frozen sorted list.
+
+        Runtime complexity: `O(log(n))` -- approximate.
+
+        """
+        return self._list.count(value)
+
+    def index(self, value, start=None, stop=None):
+        """Return first index of value in frozen sorted list.
+
+        See :func:`SortedList.index` for details.
+
+        """
+        return self._list.index(value, start, stop)
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True), reverse=False):
+        """Create an iterator of values between `minimum` and `maximum`.
+
+        See :func:`SortedList.irange` for details.
+
+        """
+        return self._list.irange(minimum, maximum, inclusive, reverse)
+
+    def islice(self, start=None, stop=None, reverse=False):
+        """Return an iterator that slices frozen sorted list from `start` to
+        `stop`.
+
+        See :func:`SortedList.islice` for details.
+
+        """
+        return self._list.islice(start, stop, reverse)
+
+    def __eq__(self, other):
+        """Return true if frozen sorted list is equal to `other`.
+
+        ``fsl.__eq__(other)`` <==> ``fsl == other``
+
+        Comparisons use lexicographical order as with sequences.
+
+        """
+        if not isinstance(other, Sequence):
+            return NotImplemented
+
+        return len(self) == len(other) and all(map(eq, self, other))
+
+    def __hash__(self):
+        """Return hash of frozen sorted list.
+
+        ``fsl.__hash__()`` <==> ``hash(fsl)``
+
+        Runtime complexity: `O(n)`
+
+        """
+        return hash(tuple(self._list))
+
+    def __reduce__(self):
+        return (type(self), (list(self._list), self.key))
+
+    @recursive_repr()
+    def __repr__(self):
+        """Return string representation of frozen sorted list.
+
+        ``fsl.__repr__()`` <==> ``repr(fsl)``
+
+        :return: string representation
+
+        """
+        type_name = type(self).__name__
+        key = self.key
+
+        if key is None:
+            return f'{type_name}({list(self._list)!r})'
+
+        return f'{type_name}({list(self._list)!r}, key={key!r})'
+
+    def _check(self):
+        """Check invariants of frozen sorted list.
+
+        Runtime complexity: `O(n)`
+
+        """
+        self._list._check()
+
+
+class FrozenSortedSet(FrozenSortedList, Set):
+    """Frozen sorted set is an immutable, persistent sorted set.
+
+    Frozen sorted set values are unique and maintained in sorted order.
+    Membership is tested by bisecting so values need only be hashable if the
+    frozen sorted set is hashed. Methods that would change a sorted set
+    instead return a new version which shares unchanged sublists. See
+    :class:`FrozenSortedList` for details.
+
+    Set-operations such as ``fss | other`` and comparisons use set semantics
+    and return frozen sorted sets.
+
+    >>> fss = FrozenSortedSet([3, 1, 2, 1])
+    >>> fss.add(0)
+    FrozenSortedSet([0, 1, 2, 3])
+    >>> fss.add(2) is fss
+    True
+
+    """
+
+    def __init__(self, iterable=None, key=None):
+        """Initialize frozen sorted set instance.
+
+        Runtime complexity: `O(n*log(n))`
+
+        :param iterable: initial values (optional)
+        :param key: function used to extract comparison key (optional)
+
+        """
+        values = SortedList(iterable, key=key)
+        self._list = SortedList(key=key)
+        self._list._update_sorted(_unique(values), None)
+
+    def _from_iterable(self, iterable):
+        return type(self)(iterable, key=self.key)
+
+    def add(self, value):
+        """Return new version with `value` added.
+
+        If `value` is already a member then return the frozen sorted set
+        itself.
+
+        Runtime complexity: `O(log(n))` -- approximate.
+
+        :param value: value to add
+        :return: new frozen sorted set
+
+        """
+        if value in self._list:
+            return self
+
+        return self._evolve(methodcaller('add', value))
+
+    def update(self, iterable):
+        """Return new version with values from `iterable` added.
+
+        Runtime complexity: `O(k*log(n))` -- approximate.
+
+        :param iterable: iterable of values to add
+        :return: new frozen sorted set
+
+        """
+        _list = self._list
+        values = _unique(SortedList(iterable, key=self.key))
+        values = [value for value in values if value not in _list]
+
+        if not values:
+            return self
+
+        return self._evolve(methodcaller('_update_sorted', values))
+
+    def count(self, value):
+        """Return number of occurrences of `value` in the frozen sorted set.
+
+        Runtime complexity: `O(log(n))`
+
+        """
+        return int(value in self._list)
+
+    __eq__ = Set.__eq__
+    __le__ = Set.__le__
+    __lt__ = Set.__lt__
+    __ge__ = Set.__ge__
+    __gt__ = Set.__gt__
+
+    def __hash__(self):
+        """Return hash of frozen sorted set.
+
+        ``fss.__hash__()`` <==> ``hash(fss)``
+
+        Runtime complexity: `O(n)`
+
+        """
+        return self._hash()
+
+
+def _unique(sorted_list):
+    """Return list of unique values in `sorted_list` in sorted order."""
+    key = sorted_list.key or identity
+    result = []
+    run = []
+    run_key = None
+
+    for value in sorted_list:
+        value_key = key(value)
+
+        if not run or value_key != run_key:
+            run = []
+            run_key = value_key
+
+        if value not in run:
+            run.append(value)
+            result.append(value)
+
+    return result
+
+
+def _set_items(kv_list, items):
+    """Set `items` in sorted key-value list `kv_list` one at a time."""
+    _locate = kv_list._locate
+
+    for key, value in items:
+        if _locate(key) is None:
+            kv_list.add_item(key, value)
+        else:
+            kv_list.set_value(key, value)
+
+
+class FrozenSortedDict(Mapping):
+    """Frozen sorted dict is an immutable, persistent sorted mapping.
+
+    Frozen sorted dict keys are maintained in sorted order alongside their
+    values. Keys are found by bisecting so they need only be hashable if the
+    frozen sorted dict is hashed. Methods that would change a sorted dict
+    instead return a new version which shares unchanged sublists of keys and
+    values. See :class:`FrozenSortedList` for details.
+
+    Methods for adding and removing items:
+
+    * :func:`FrozenSortedDict.set`
+    * :func:`FrozenSortedDict.update`
+    * :func:`FrozenSortedDict.discard`
+    * :func:`FrozenSortedDict.remove`
+
+    Methods for looking up and iterating items:
+
+    * :func:`FrozenSortedDict.bisect_left`
+    * :func:`FrozenSortedDict.bisect_right`
+    * :func:`FrozenSortedDict.index`
+    * :func:`FrozenSortedDict.irange`
+    * :func:`FrozenSortedDict.islice`
+    * :func:`FrozenSortedDict.peekitem`
+
+    >>> fsd = FrozenSortedDict({'b': 2, 'a': 1})
+    >>> fsd.set('c', 3)
+    FrozenSortedDict({'a': 1, 'b': 2, 'c': 3})
+    >>> fsd
+    FrozenSortedDict({'a': 1, 'b': 2})
+
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize frozen sorted dict instance.
+
+        Optional key-function argument defines a callable that, like the `key`
+        argument to Python's `sorted` function, extracts a comparison key from
+        each dictionary key. Remaining arguments are passed to ``dict``.
+
+        Runtime complexity: `O(n*log(n))`
+
+        :param args: mapping or iterable of pairs, maybe after key-function
+        :param kwargs: keyword arguments mapping
+
+        """
+        if args and (args[0] is None or callable(args[0])):
+            _key = args[0]
+            args = args[1:]
+        else:
+            _key = None
+
+        items = dict(*args, **kwargs)
+        self._key = _key
+        self._list = SortedKeyValueList(key=identity if _key is None else _key)
+        self._list.update_items(list(items), list(items.values()))
+
+    def _fromlist(self, kv_list):
+        """Initialize frozen sorted dict from existing sorted key-value list.
+
+        Used internally by methods that return a new version.
+
+        """
+        result = object.__new__(type(self))
+        result._key = self._key
+        result._list = kv_list
+        return result
+
+    def _evolve(self, change):
+        return self._fromlist(_evolve(self._list, change))
+
+    @property
+    def key(self):
+        """Function used to extract comparison key from keys."""
+        return self._key
+
+    def __getitem__(self, key):
+        """Return value for item identified by `key`.
+
+        ``fsd.__getitem__(key)`` <==> ``fsd[key]``
+
+        Runtime complexity: `O(log(n))` -- approximate.
+
+        :param key: key for item
+        :return: value for item
+        :raises KeyError: if `key` not found
+
+        """
+        loc = self._list._locate(key)
+
+        if loc is None:
+            raise KeyError(key)
+
+        pos, idx = loc
+        return self._list._values[pos][idx]
+
+    def __contains__(self, key):
+        """Return true if `key` is a key in the frozen sorted dict.
+
+        ``fsd.__contains__(key)`` <==> ``key in fsd``
+
+        Runtime complexity: `O(log(n))` -- approximate.
+
+        """
+        return self._list._locate(key) is not None
+
+    def __len__(self):
+        """Return the size of the frozen sorted dict.
+
+        ``fsd.__len__()`` <==> ``len(fsd)``
+
+        """
+        return len(self._list)
+
+    def __iter__(self):
+        """Return an iterator over the keys of the frozen sorted dict.
+
+        ``fsd.__iter__()`` <==> ``iter(fsd)``
+
+        """
+        return iter(self._list)
+
+    def __reversed__(self):
+        """Return a reverse iterator over the keys of the frozen sorted dict.
+
+        ``fsd.__reversed__()`` <==> ``reversed(fsd)``
+
+        """
+        return reversed(self._list)
+
+    def items(self):
+        """Return new items view of the frozen sorted dict, in key order."""
+        return _FrozenItemsView(self)
+
+    def values(self):
+        """Return new values view of the frozen sorted dict, in key order."""
+        return _FrozenValuesView(self)
+
+    def set(self, key, value):
+        """Return new version with `key` set to `value`.
+
+        Runtime complexity: `O(log(n))` -- approximate.
+
+        >>> FrozenSortedDict({'a': 1}).set('a', 2)
+        FrozenSortedDict({'a': 2})
+
+        :param key: key for item
+        :param value: value for item
+        :return: new frozen sorted dict
+
+        """
+        return self._evolve(lambda kv_list: _set_items(kv_list, [(key, value)]))
+
+    def update(self, *args, **kwargs):
+        """Return new version updated with items from `args` and `kwargs`.
+
+        Arguments are passed to ``dict``. Many items rebuild the frozen sorted
+        dict rather than sharing sublists with it.
+
+        Runtime complexity: `O(k*log(n))` -- approximate.
+
+        :param args: mapping or iterable of pairs
+        :param kwargs: keyword arguments mapping
+        :return: new frozen sorted dict
+
+        """
+        pairs = dict(*args, **kwargs)
+
+        if not pairs:
+            return self
+
+        if len(pairs) * 10 > len(self):
+            items = dict(self.items())
+            items.update(pairs)
+            return type(self)(self._key, items)
+
+        return self._evolve(lambda kv_list: _set_items(kv_list, pairs.items()))
+
+    def discard(self, key):
+        """Return new version with item identified by `key` removed.
+
+        If `key` is not found then return the frozen sorted dict itself.
+
+        Runtime complexity: `O(log(n))` -- approximate.
+
+        :param key: key for item
+        :return: new frozen sorted dict
+
+        """
+        if key not in self:
+            return self
+
+        return self._evolve(methodcaller('remove', key))
+
+    def remove(self, key):
+        """Return new version with item identified by `key` removed.
+
+        Runtime complexity: `O(log(n))` -- approximate.
+
+        :param key: key for item
+        :return: new frozen sorted dict
+        :raises KeyError: if `key` not found
+
+        """
+        if key not in self:
+            raise KeyError(key)
+
+        return self._evolve(methodcaller('remove', key))
+
+    def peekitem(self, index=-1):
+        """Return `(key, value)` pair at `index` in frozen sorted dict.
+
+        Runtime complexity: `O(log(n))`
+
+        :param int index: index of item (default -1)
+        :return: key and value pair
+        :raises IndexError: if `index` out of range
+
+        """
+        return self._list.item(index)
+
+    def bisect_left(self, key):
+        """Return an index to insert `key` in the frozen sorted dict.
+
+        See :func:`SortedList.bisect_left` for details.
+
+        """
+        return self._list.bisect_left(key)
+
+    def bisect_right(self, key):
+        """Return an index to insert `key` in the frozen sorted dict.
+
+        See :func:`SortedList.bisect_right` for details.
+
+        """
+        return self._list.bisect_right(key)
+
+    bisect = bisect_right
+
+    def index(self, key, start=None, stop=None):
+        """Return first index of `key` in frozen sorted dict.
+
+        See :func:`SortedList.index` for details.
+
+        """
+        return self._list.index(key, start, stop)
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True), reverse=False):
+        """Create an iterator of keys between `minimum` and `maximum`.
+
+        See :func:`SortedList.irange` for details.
+
+        """
+        return self._list.irange(minimum, maximum, inclusive, reverse)
+
+    def islice(self, start=None, stop=None, reverse=False):
+        """Return an iterator that slices keys from `start` to `stop`.
+
+        See :func:`SortedList.islice` for details.
+
+        """
+        return self._list.islice(start, stop, reverse)
+
+    def __hash__(self):
+        """Return hash of frozen sorted dict.
+
+        ``fsd.__hash__()`` <==> ``hash(fsd)``
+
+        Runtime complexity: `O(n)`
+
+        """
+        return hash(frozenset(self.items()))
+
+    def __reduce__(self):
+        return (type(self), (self._key, dict(self.items())))
+
+    @recursive_repr()
+    def __repr__(self):
+        """Return string representation of frozen sorted dict.
+
+        ``fsd.__repr__()`` <==> ``repr(fsd)``
+
+        :return: string representation
+
+        """
+        _key = self._key
+        type_name = type(self).__name__
+        key_arg = '' if _key is None else f'{_key!r}, '
+        item_format = '{!r}: {!r}'.format
+        items = ', '.join(item_format(key, value) for key, value in self.items())
+        return f'{type_name}({key_arg}{{{items}}})'
+
+    def _check(self):
+        """Check invariants of frozen sorted dict.
+
+        Runtime complexity: `O(n)`
+
+        """
+        self._list._check()
+
+
+class _FrozenItemsView(ItemsView):
+    __slots__ = ()
+
+    def __iter__(self):
+        _list = self._mapping._list
+        keys = chain.from_iterable(_list._lists)
+        return zip(keys, chain.from_iterable(_list._values))
+
+
+class _FrozenValuesView(ValuesView):
+    __slots__ = ()
+
+    def __iter__(self):
+        return chain.from_iterable(self._mapping._list._values)
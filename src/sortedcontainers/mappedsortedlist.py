@@ -0,0 +1,849 @@
+"""Mapped Sorted List
+====================
+
+:doc:`Sorted Containers<index>` is an Apache2 licensed Python sorted
+collections library, written in pure-Python, and fast as C-extensions. The
+:doc:`introduction<introduction>` is the best way to get started.
+
+Mapped sorted list implementations:
+
+.. currentmodule:: sortedcontainers
+
+* :class:`MappedSortedList`
+
+"""
+
+import mmap
+import os
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from contextlib import ExitStack
+
+MAGIC = b'SCMSL\x00\x00\x01'
+HEADER = struct.Struct('<8s8sq')
+HEADER_SIZE = 64
+LENGTH_SIZE = 8
+TYPECODES = 'bBhHiIlLqQfd'
+
+
+class MappedSortedList(Sequence):
+    """Mapped sorted list is a sorted sequence stored in a memory-mapped file.
+
+    Mapped sorted list values are numbers of a single C type maintained in
+    sorted order. Values are stored in fixed-capacity pages of a file that is
+    memory-mapped so the operating system page cache decides which pages
+    reside in memory. Only the page order, the maximum of each page and the
+    positional index are kept in process memory.
+
+    Each page stores its length followed by up to `capacity` values. Pages
+    are split when full and combined with a neighbor when both fit in half a
+    page. Empty pages are reused before the file grows. The page order is not
+    stored in the file but recovered from the first and last value of each
+    page when the file is opened.
+
+    Methods for adding values:
+
+    * :func:`MappedSortedList.add`
+    * :func:`MappedSortedList.update`
+
+    Methods for removing values:
+
+    * :func:`MappedSortedList.discard`
+    * :func:`MappedSortedList.remove`
+
+    Methods for looking up values:
+
+    * :func:`MappedSortedList.bisect_left`
+    * :func:`MappedSortedList.bisect_right`
+    * :func:`MappedSortedList.count`
+    * :func:`MappedSortedList.__contains__`
+    * :func:`MappedSortedList.__getitem__`
+
+    Methods for iterating values:
+
+    * :func:`MappedSortedList.irange`
+    * :func:`MappedSortedList.islice`
+    * :func:`MappedSortedList.__iter__`
+    * :func:`MappedSortedList.__reversed__`
+
+    Methods for miscellany:
+
+    * :func:`MappedSortedList.flush`
+    * :func:`MappedSortedList.close`
+    * :func:`MappedSortedList.__len__`
+    * :func:`MappedSortedList.__repr__`
+    * :func:`MappedSortedList._check`
+
+    """
+
+    DEFAULT_CAPACITY = 4096
+
+    def __init__(self, path, dtype=None, capacity=None):
+        """Initialize mapped sorted list instance.
+
+        The `path` names the file that stores values. The file is created when
+        it does not exist or is empty. Otherwise its values are opened in
+        place.
+
+        Optional `dtype` argument defines the C type of values as an
+        :mod:`array` typecode. The default is the typecode of an existing file
+        or ``'q'`` for signed 64-bit integers.
+
+        Optional `capacity` argument defines the count of values per page. The
+        default is the capacity of an existing file or ``DEFAULT_CAPACITY``.
+
+        Runtime complexity: `O(p*log(p))` where `p` is the count of pages
+
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), 'values.dat')
+        >>> msl = MappedSortedList(path)
+        >>> msl.update([3, 1, 2])
+        >>> msl
+        MappedSortedList([1, 2, 3], dtype='q')
+        >>> msl.close()
+
+        :param path: path of file that stores values
+        :param str dtype: array typecode of values (optional)
+        :param int capacity: count of values per page (optional)
+        :raises ValueError: if arguments mismatch an existing file or the file
+            is not a mapped sorted list file
+
+        """
+        self._path = path
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        exists = size > 0
+
+        # Close the file if the header is invalid. Keep it open otherwise.
+
+        with ExitStack() as stack:
+            self._file = stack.enter_context(open(path, 'r+b' if exists else 'w+b'))
+
+            if exists:
+                if size < HEADER_SIZE:
+                    raise ValueError('not a mapped sorted list file')
+
+                header = self._file.read(HEADER.size)
+                magic, typecode, stored = HEADER.unpack(header)
+                typecode = typecode.rstrip(b'\x00').decode('ascii')
+
+                if magic != MAGIC:
+                    raise ValueError('not a mapped sorted list file')
+                if dtype is not None and dtype != typecode:
+                    raise ValueError(f'file dtype is {typecode!r}')
+                if capacity is not None and capacity != stored:
+                    raise ValueError(f'file capacity is {stored}')
+
+                dtype = typecode
+                capacity = stored
+            else:
+                if dtype is None:
+                    dtype = 'q'
+                if capacity is None:
+                    capacity = self.DEFAULT_CAPACITY
+
+            if dtype not in TYPECODES:
+                raise ValueError(f'dtype must be one of {TYPECODES!r}')
+
+            itemsize = array(dtype).itemsize
+
+            if capacity < 4 or (capacity * itemsize) % LENGTH_SIZE:
+                message = 'capacity must be at least 4 and fill whole words'
+                raise ValueError(message)
+
+            if not exists:
+                header = HEADER.pack(MAGIC, dtype.encode('ascii'), capacity)
+                self._file.write(header.ljust(HEADER_SIZE, b'\x00'))
+                self._file.flush()
+
+            stack.pop_all()
+
+        self._dtype = dtype
+        self._capacity = capacity
+        self._itemsize = itemsize
+        self._page_size = LENGTH_SIZE + capacity * itemsize
+        self._mmap = None
+        self._items = None
+        self._words = None
+        self._len = 0
+        self._pages = []
+        self._maxes = []
+        self._free = []
+        self._index = []
+        self._offset = 0
+        self._map()
+        self._load()
+
+    @property
+    def path(self):
+        "Path of file that stores values."
+        return self._path
+
+    @property
+    def dtype(self):
+        "Array typecode of values in mapped sorted list."
+        return self._dtype
+
+    @property
+    def capacity(self):
+        "Count of values per page."
+        return self._capacity
+
+    def _map(self):
+        "Map the file into memory and create typed views of the map."
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+        self._items = memoryview(self._mmap).cast(self._dtype)
+        self._words = memoryview(self._mmap).cast('q')
+        self._count = (len(self._mmap) - HEADER_SIZE) // self._page_size
+
+    def _unmap(self):
+        "Release typed views and unmap the file."
+        self._items.release()
+        self._words.release()
+        self._mmap.close()
+
+    def _load(self):
+        """Recover page order from the first and last value of every page.
+
+        Pages never overlap except at equal boundary values so ordering pages
+        by their first and then last values recovers the sorted order.
+
+        """
+        _items = self._items
+        order = []
+
+        for page in range(self._count):
+            length = self._length(page)
+
+            if length:
+                base = self._base(page)
+                first = _items[base]
+                last = _items[base + length - 1]
+                order.append((first, last, page))
+                self._len += length
+            else:
+                self._free.append(page)
+
+        order.sort()
+        self._pages = [page for _, _, page in order]
+        self._maxes = [last for _, last, _ in order]
+        self._free.reverse()
+
+    def _base(self, page):
+        "Return item offset of the first value of `page`."
+        offset = HEADER_SIZE + page * self._page_size + LENGTH_SIZE
+        return offset // self._itemsize
+
+    def _length(self, page):
+        "Return count of values in `page`."
+        return self._words[(HEADER_SIZE + page * self._page_size) >> 3]
+
+    def _set_length(self, page, length):
+        "Store count of values in `page`."
+        self._words[(HEADER_SIZE + page * self._page_size) >> 3] = length
+
+    def _move(self, dest, src, count):
+        "Move `count` values from item offset `src` to item offset `dest`."
+        itemsize = self._itemsize
+        self._mmap.move(dest * itemsize, src * itemsize, count * itemsize)
+
+    def _allocate(self):
+        """Return an empty page, growing the file when no page is free.
+
+        The file doubles in size so growth is amortized.
+
+        """
+        if self._free:
+            return self._free.pop()
+
+        count = self._count
+        grow = max(count, 1)
+        self._unmap()
+        self._file.truncate(HEADER_SIZE + (count + grow) * self._page_size)
+        self._map()
+        self._free.extend(reversed(range(count + 1, count + grow)))
+        return count
+
+    def _coerce(self, value):
+        "Return `value` converted to the C type of values."
+        return array(self._dtype, (value,))[0]
+
+    def add(self, value):
+        """Add `value` to mapped sorted list.
+
+        Runtime complexity: `O(log(n) + c)` where `c` is the capacity
+        -- approximate.
+
+        :param value: value to add to mapped sorted list
+
+        """
+        value = self._coerce(value)
+        _pages = self._pages
+        _maxes = self._maxes
+
+        if not _pages:
+            page = self._allocate()
+            self._items[self._base(page)] = value
+            self._set_length(page, 1)
+            _pages.append(page)
+            _maxes.append(value)
+            self._len = 1
+            del self._index[:]
+            return
+
+        pos = bisect_right(_maxes, value)
+
+        if pos == len(_maxes):
+            pos -= 1
+
+        if self._length(_pages[pos]) == self._capacity:
+            self._split(pos)
+
+            if value > _maxes[pos]:
+                pos += 1
+
+        page = _pages[pos]
+        base = self._base(page)
+        length = self._length(page)
+        idx = bisect_right(self._items, value, base, base + length)
+        self._move(idx + 1, idx, base + length - idx)
+        self._items[idx] = value
+        self._set_length(page, length + 1)
+
+        if value > _maxes[pos]:
+            _maxes[pos] = value
+
+        self._len += 1
+        self._increment(pos, 1)
+
+    def _split(self, pos):
+        "Split the full page at `pos` into two half-full pages."
+        page = self._allocate()
+        _pages = self._pages
+        _maxes = self._maxes
+        full = _pages[pos]
+        length = self._length(full)
+        half = length >> 1
+        base = self._base(full)
+        self._move(self._base(page), base + half, length - half)
+        self._set_length(full, half)
+        self._set_length(page, length - half)
+        _pages.insert(pos + 1, page)
+        _maxes.insert(pos + 1, _maxes[pos])
+        _maxes[pos] = self._items[base + half - 1]
+        del self._index[:]
+
+    def update(self, iterable):
+        """Update mapped sorted list by adding all values from `iterable`.
+
+        Runtime complexity: `O(k*log(n))` -- approximate.
+
+        :param iterable: iterable of values to add
+
+        """
+        _add = self.add
+
+        for value in sorted(iterable):
+            _add(value)
+
+    def discard(self, value):
+        """Remove `value` from mapped sorted list if it is a member.
+
+        If `value` is not a member, do nothing.
+
+        Runtime complexity: `O(log(n) + c)` where `c` is the capacity
+        -- approximate.
+
+        :param value: `value` to discard from mapped sorted list
+
+        """
+        _maxes = self._maxes
+
+        if not _maxes:
+            return
+
+        pos = bisect_left(_maxes, value)
+
+        if pos == len(_maxes):
+            return
+
+        page = self._pages[pos]
+        base = self._base(page)
+        length = self._length(page)
+        idx = bisect_left(self._items, value, base, base + length)
+
+        if self._items[idx] == value:
+            self._delete(pos, idx - base)
+
+    def remove(self, value):
+        """Remove `value` from mapped sorted list; `value` must be a member.
+
+        If `value` is not a member, raise ValueError.
+
+        Runtime complexity: `O(log(n) + c)` where `c` is the capacity
+        -- approximate.
+
+        :param value: `value` to remove from mapped sorted list
+        :raises ValueError: if `value` is not an element of mapped sorted list
+
+        """
+        _len = self._len
+        self.discard(value)
+
+        if self._len == _len:
+            raise ValueError(f'{value!r} not in list')
+
+    def _delete(self, pos, idx):
+        """Delete value at the given `(pos, idx)`.
+
+        Empty pages are freed. Pages are combined with the next page, or the
+        previous page for the last page, when both fit in half a page.
+
+        """
+        _pages = self._pages
+        _maxes = self._maxes
+        page = _pages[pos]
+        base = self._base(page)
+        length = self._length(page) - 1
+        self._move(base + idx, base + idx + 1, length - idx)
+        self._set_length(page, length)
+        self._len -= 1
+
+        if not length:
+            del _pages[pos]
+            del _maxes[pos]
+            self._free.append(page)
+            del self._index[:]
+            return
+
+        _maxes[pos] = self._items[base + length - 1]
+        self._increment(pos, -1)
+
+        if len(_pages) > 1:
+            prev = pos if pos + 1 < len(_pages) else pos - 1
+            first = _pages[prev]
+            second = _pages[prev + 1]
+            len_first = self._length(first)
+            len_second = self._length(second)
+
+            if len_first + len_second <= (self._capacity >> 1):
+                dest = self._base(first) + len_first
+                self._move(dest, self._base(second), len_second)
+                self._set_length(first, len_first + len_second)
+                self._set_length(second, 0)
+                _maxes[prev] = _maxes[prev + 1]
+                del _pages[prev + 1]
+                del _maxes[prev + 1]
+                self._free.append(second)
+                del self._index[:]
+
+    def _increment(self, pos, delta):
+        "Add `delta` to the index path of page `pos` when the index is built."
+        _index = self._index
+
+        if _index:
+            child = self._offset + pos
+
+            while child:
+                _index[child] += delta
+                child = (child - 1) >> 1
+
+            _index[0] += delta
+
+    def _build_index(self):
+        """Build a positional index of page lengths.
+
+        The index is a dense binary tree like ``SortedList._build_index``
+        with leaf nodes padded to a power of two.
+
+        """
+        lengths = [self._length(page) for page in self._pages]
+        size = 1
+
+        while size < len(lengths):
+            size <<= 1
+
+        tree = [0] * (size - 1)
+        tree.extend(lengths)
+        tree.extend([0] * (size - len(lengths)))
+
+        for pos in reversed(range(size - 1)):
+            child = (pos << 1) + 1
+            tree[pos] = tree[child] + tree[child + 1]
+
+        self._index[:] = tree
+        self._offset = size - 1
+
+    def _pos(self, idx):
+        "Convert an index into an index pair (page position, page index)."
+        if not self._index:
+            self._build_index()
+
+        _index = self._index
+        len_index = len(_index)
+        pos = 0
+        child = 1
+
+        while child < len_index:
+            index_child = _index[child]
+
+            if idx < index_child:
+                pos = child
+            else:
+                idx -= index_child
+                pos = child + 1
+
+            child = (pos << 1) + 1
+
+        return (pos - self._offset, idx)
+
+    def _loc(self, pos, idx):
+        "Convert an index pair (page position, page index) into an index."
+        if not pos:
+            return idx
+
+        if not self._index:
+            self._build_index()
+
+        _index = self._index
+        total = 0
+        pos += self._offset
+
+        while pos:
+            if not pos & 1:
+                total += _index[pos - 1]
+
+            pos = (pos - 1) >> 1
+
+        return total + idx
+
+    def bisect_left(self, value):
+        """Return an index to insert `value` in the mapped sorted list.
+
+        If the `value` is already present, the insertion point will be before
+        (to the left of) any existing values.
+
+        Runtime complexity: `O(log(n))` -- approximate.
+
+        :param value: insertion index of value in mapped sorted list
+        :return: index
+
+        """
+        _maxes = self._maxes
+
+        if not _maxes:
+            return 0
+
+        pos = bisect_left(_maxes, value)
+
+        if pos == len(_maxes):
+            return self._len
+
+        base = self._base(self._pages[pos])
+        length = self._length(self._pages[pos])
+        idx = bisect_left(self._items, value, base, base + length)
+        return self._loc(pos, idx - base)
+
+    def bisect_right(self, value):
+        """Return an index to insert `value` in the mapped sorted list.
+
+        Similar to `bisect_left`, but if `value` is already present, the
+        insertion point will be after (to the right of) any existing values.
+
+        Runtime complexity: `O(log(n))` -- approximate.
+
+        :param value: insertion index of value in mapped sorted list
+        :return: index
+
+        """
+        _maxes = self._maxes
+
+        if not _maxes:
+            return 0
+
+        pos = bisect_right(_maxes, value)
+
+        if pos == len(_maxes):
+            return self._len
+
+        base = self._base(self._pages[pos])
+        length = self._length(self._pages[pos])
+        idx = bisect_right(self._items, value, base, base + length)
+        return self._loc(pos, idx - base)
+
+    def count(self, value):
+        """Return number of occurrences of `value` in the mapped sorted list.
+
+        Runtime complexity: `O(log(n))` -- approximate.
+
+        :param value: value to count in mapped sorted list
+        :return: count
+
+        """
+        return self.bisect_right(value) - self.bisect_left(value)
+
+    def __contains__(self, value):
+        """Return true if `value` is an element of the mapped sorted list.
+
+        ``msl.__contains__(value)`` <==> ``value in msl``
+
+        Runtime complexity: `O(log(n))`
+
+        :param value: search for value in mapped sorted list
+        :return: true if `value` in mapped sorted list
+
+        """
+        _maxes = self._maxes
+
+        if not _maxes:
+            return False
+
+        pos = bisect_left(_maxes, value)
+
+        if pos == len(_maxes):
+            return False
+
+        base = self._base(self._pages[pos])
+        length = self._length(self._pages[pos])
+        idx = bisect_left(self._items, value, base, base + length)
+        return self._items[idx] == value
+
+    def __getitem__(self, index):
+        """Lookup value at `index` in mapped sorted list.
+
+        ``msl.__getitem__(index)`` <==> ``msl[index]``
+
+        Supports slicing. Slices are returned as lists.
+
+        Runtime complexity: `O(log(n))` -- approximate.
+
+        :param index: integer or slice for indexing
+        :return: value or list of values
+        :raises IndexError: if index out of range
+
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+
+            if step == 1:
+                return list(self.islice(start, stop))
+
+            return [self[idx] for idx in range(start, stop, step)]
+
+        _len = self._len
+
+        if index < 0:
+            index += _len
+
+        if not 0 <= index < _len:
+            raise IndexError('list index out of range')
+
+        pos, idx = self._pos(index)
+        return self._items[self._base(self._pages[pos]) + idx]
+
+    def _segments(self, pos, idx, stop_pos, stop_idx):
+        "Return list of item ranges from `(pos, idx)` to `(stop_pos, stop_idx)`."
+        segments = []
+
+        while pos <= stop_pos:
+            page = self._pages[pos]
+            base = self._base(page)
+            end = stop_idx if pos == stop_pos else self._length(page)
+            segments.append((base + idx, base + end))
+            pos += 1
+            idx = 0
+
+        return segments
+
+    def _iter(self, segments, reverse):
+        """Yield values of item `segments` optionally in reverse order.
+
+        Values are copied a segment at a time so that no view of the map is
+        held between values.
+
+        """
+        if reverse:
+            for start, stop in reversed(segments):
+                yield from reversed(self._items[start:stop].tolist())
+        else:
+            for start, stop in segments:
+                yield from self._items[start:stop].tolist()
+
+    def __iter__(self):
+        """Return an iterator over the mapped sorted list.
+
+        ``msl.__iter__()`` <==> ``iter(msl)``
+
+        Iterating the mapped sorted list while adding or deleting values may
+        raise a :exc:`RuntimeError` or fail to iterate over all values.
+
+        """
+        return self.islice()
+
+    def __reversed__(self):
+        """Return a reverse iterator over the mapped sorted list.
+
+        ``msl.__reversed__()`` <==> ``reversed(msl)``
+
+        Iterating the mapped sorted list while adding or deleting values may
+        raise a :exc:`RuntimeError` or fail to iterate over all values.
+
+        """
+        return self.islice(reverse=True)
+
+    def islice(self, start=None, stop=None, reverse=False):
+        """Return an iterator that slices mapped sorted list from `start` to
+        `stop`.
+
+        The `start` and `stop` index are treated inclusive and exclusive,
+        respectively.
+
+        Both `start` and `stop` default to `None` which is automatically
+        inclusive of the beginning and end of the mapped sorted list.
+
+        When `reverse` is `True` the values are yielded from the iterator in
+        reverse order; `reverse` defaults to `False`.
+
+        :param int start: start index (inclusive)
+        :param int stop: stop index (exclusive)
+        :param bool reverse: yield values in reverse order
+        :return: iterator
+
+        """
+        start, stop, _ = slice(start, stop).indices(self._len)
+
+        if start >= stop:
+            return iter(())
+
+        pos, idx = self._pos(start)
+        stop_pos, stop_idx = self._pos(stop - 1)
+        segments = self._segments(pos, idx, stop_pos, stop_idx + 1)
+        return self._iter(segments, reverse)
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True), reverse=False):
+        """Create an iterator of values between `minimum` and `maximum`.
+
+        Both `minimum` and `maximum` default to `None` which is automatically
+        inclusive of the beginning and end of the mapped sorted list.
+
+        The argument `inclusive` is a pair of booleans that indicates whether
+        the minimum and maximum ought to be included in the range,
+        respectively. The default is ``(True, True)`` such that the range is
+        inclusive of both minimum and maximum.
+
+        When `reverse` is `True` the values are yielded from the iterator in
+        reverse order; `reverse` defaults to `False`.
+
+        :param minimum: minimum value to start iterating
+        :param maximum: maximum value to stop iterating
+        :param inclusive: pair of booleans
+        :param bool reverse: yield values in reverse order
+        :return: iterator
+
+        """
+        if minimum is None:
+            start = 0
+        elif inclusive[0]:
+            start = self.bisect_left(minimum)
+        else:
+            start = self.bisect_right(minimum)
+
+        if maximum is None:
+            stop = self._len
+        elif inclusive[1]:
+            stop = self.bisect_right(maximum)
+        else:
+            stop = self.bisect_left(maximum)
+
+        return self.islice(start, stop, reverse)
+
+    def __len__(self):
+        """Return the size of the mapped sorted list.
+
+        ``msl.__len__()`` <==> ``len(msl)``
+
+        :return: size of mapped sorted list
+
+        """
+        return self._len
+
+    def flush(self):
+        """Flush changes to the file.
+
+        Runtime complexity: `O(p)` where `p` is the count of pages
+
+        """
+        self._mmap.flush()
+
+    def close(self):
+        """Flush changes and close the file.
+
+        The mapped sorted list is not usable after closing.
+
+        """
+        if self._mmap is not None:
+            self.flush()
+            self._unmap()
+            self._mmap = None
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        """Return string representation of mapped sorted list.
+
+        ``msl.__repr__()`` <==> ``repr(msl)``
+
+        :return: string representation
+
+        """
+        type_name = type(self).__name__
+        return f'{type_name}({list(self)!r}, dtype={self._dtype!r})'
+
+    def _check(self):
+        """Check invariants of mapped sorted list.
+
+        Runtime complexity: `O(n)`
+
+        """
+        _pages = self._pages
+        _maxes = self._maxes
+        _items = self._items
+        lengths = [self._length(page) for page in _pages]
+
+        assert len(_pages) == len(_maxes)
+        assert len(set(_pages)) == len(_pages)
+        assert not set(_pages) & set(self._free)
+        assert len(_pages) + len(self._free) == self._count
+        assert all(0 < length <= self._capacity for length in lengths)
+        assert all(not self._length(page) for page in self._free)
+        assert self._len == sum(lengths)
+
+        # Check pages are sorted and maxes are the last value of each page.
+
+        values = []
+
+        for page, length, maximum in zip(_pages, lengths, _maxes):
+            base = self._base(page)
+            assert _items[base + length - 1] == maximum
+            values.extend(_items[base : (base + length)])
+
+        assert all(alpha <= beta for alpha, beta in zip(values, values[1:]))
+
+        # Check index leaf nodes and branch nodes.
+
+        if self._index:
+            assert self._index[0] == self._len
+
+            for pos, length in enumerate(lengths):
+                assert self._index[self._offset + pos] == length
+
+            for pos in range(self._offset):
+                child = (pos << 1) + 1
+                child_sum = self._index[child] + self._index[child + 1]
+                assert self._index[pos] == child_sum
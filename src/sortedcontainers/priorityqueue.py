@@ -0,0 +1,311 @@
+"""Sorted Priority Queue
+======================
+
+:doc:`Sorted Containers<index>` is an Apache2 licensed Python sorted
+collections library, written in pure-Python, and fast as C-extensions. The
+:doc:`introduction<introduction>` is the best way to get started.
+
+Sorted priority queue implementations:
+
+.. currentmodule:: sortedcontainers
+
+* :class:`SortedPriorityQueue`
+
+"""
+
+from bisect import bisect_left
+from itertools import count
+
+from .sortedlist import SortedList, recursive_repr
+
+
+class SortedPriorityQueue:
+    """Sorted priority queue is a double-ended priority queue with handles.
+
+    Items are stored with a priority in a sorted list of `(priority, handle,
+    item)` entries. Each push returns a unique handle, ordered by time of
+    push, so entries never compare items and items with equal priorities
+    are popped first in, first out. Handles make changing the priority of an
+    item and removing an item `O(log(n))` without scanning duplicates.
+
+    Priorities must be comparable. Items may be any object.
+
+    Methods for adding and removing items:
+
+    * :func:`SortedPriorityQueue.push`
+    * :func:`SortedPriorityQueue.pushpop`
+    * :func:`SortedPriorityQueue.pop_min`
+    * :func:`SortedPriorityQueue.pop_max`
+    * :func:`SortedPriorityQueue.remove`
+    * :func:`SortedPriorityQueue.update_priority`
+
+    Methods for looking up items:
+
+    * :func:`SortedPriorityQueue.peek_min`
+    * :func:`SortedPriorityQueue.peek_max`
+    * :func:`SortedPriorityQueue.priority`
+
+    >>> spq = SortedPriorityQueue([(3, 'c'), (1, 'a')])
+    >>> handle = spq.push(2, 'b')
+    >>> spq.peek_min()
+    (1, 'a')
+    >>> spq.update_priority(handle, 0)
+    >>> spq.pop_min()
+    (0, 'b')
+    >>> spq.pop_max()
+    (3, 'c')
+
+    """
+
+    def __init__(self, iterable=None):
+        """Initialize sorted priority queue instance.
+
+        Optional `iterable` argument provides an initial iterable of
+        `(priority, item)` pairs to initialize the sorted priority queue.
+
+        Runtime complexity: `O(n*log(n))`
+
+        :param iterable: initial pairs of priority and item (optional)
+
+        """
+        self._list = SortedList()
+        self._entries = {}
+        self._counter = count()
+
+        if iterable is not None:
+            _entries = self._entries
+            _counter = self._counter
+
+            for priority, item in iterable:
+                handle = next(_counter)
+                _entries[handle] = (priority, handle, item)
+
+            self._list.update(_entries.values())
+
+    def push(self, priority, item):
+        """Push `item` with `priority` and return its handle.
+
+        Runtime complexity: `O(log(n))` -- approximate.
+
+        :param priority: priority of item
+        :param item: item to push
+        :return: handle of item
+
+        """
+        handle = next(self._counter)
+        entry = (priority, handle, item)
+        self._entries[handle] = entry
+        self._list.add(entry)
+        return handle
+
+    def pushpop(self, priority, item):
+        """Push `item` with `priority` then pop and return the minimum.
+
+        Equivalent to :func:`SortedPriorityQueue.push` followed by
+        :func:`SortedPriorityQueue.pop_min` but faster. When the new entry
+        belongs in the first sublist it replaces the first entry in place and
+        the positional index is not touched.
+
+        Runtime complexity: `O(log(n))` -- approximate.
+
+        :param priority: priority of item
+        :param item: item to push
+        :return: `(priority, item)` pair with minimum priority
+
+        """
+        _list = self._list
+        _lists = _list._lists
+        handle = next(self._counter)
+        entry = (priority, handle, item)
+
+        if not _lists or entry < _lists[0][0]:
+            return priority, item
+
+        _maxes = _list._maxes
+
+        if len(_lists) > 1 and _maxes[0] < entry:
+            self._entries[handle] = entry
+            _list.add(entry)
+            return self.pop_min()
+
+        if _list._shared:
+            _list._unshare(0)
+
+        first = _lists[0]
+        idx = bisect_left(first, entry)
+        result = first[0]
+        del first[0]
+        first.insert(idx - 1, entry)
+        _maxes[0] = first[-1]
+
+        _entries = self._entries
+        del _entries[result[1]]
+        _entries[handle] = entry
+        return result[0], result[2]
+
+    def peek_min(self):
+        """Return `(priority, item)` pair with minimum priority.
+
+        Runtime complexity: `O(1)`
+
+        :return: `(priority, item)` pair
+        :raises IndexError: if sorted priority queue is empty
+
+        """
+        _lists = self._list._lists
+
+        if not _lists:
+            raise IndexError('peek from empty priority queue')
+
+        priority, _, item = _lists[0][0]
+        return priority, item
+
+    def peek_max(self):
+        """Return `(priority, item)` pair with maximum priority.
+
+        Runtime complexity: `O(1)`
+
+        :return: `(priority, item)` pair
+        :raises IndexError: if sorted priority queue is empty
+
+        """
+        _lists = self._list._lists
+
+        if not _lists:
+            raise IndexError('peek from empty priority queue')
+
+        priority, _, item = _lists[-1][-1]
+        return priority, item
+
+    def pop_min(self):
+        """Remove and return `(priority, item)` pair with minimum priority.
+
+        Runtime complexity: `O(log(n))` -- approximate.
+
+        :return: `(priority, item)` pair
+        :raises IndexError: if sorted priority queue is empty
+
+        """
+        if not self._list:
+            raise IndexError('pop from empty priority queue')
+
+        priority, handle, item = self._list.pop(0)
+        del self._entries[handle]
+        return priority, item
+
+    def pop_max(self):
+        """Remove and return `(priority, item)` pair with maximum priority.
+
+        Runtime complexity: `O(log(n))` -- approximate.
+
+        :return: `(priority, item)` pair
+        :raises IndexError: if sorted priority queue is empty
+
+        """
+        if not self._list:
+            raise IndexError('pop from empty priority queue')
+
+        priority, handle, item = self._list.pop()
+        del self._entries[handle]
+        return priority, item
+
+    def priority(self, handle):
+        """Return priority of item identified by `handle`.
+
+        :param handle: handle of item
+        :return: priority
+        :raises KeyError: if `handle` not found
+
+        """
+        return self._entries[handle][0]
+
+    def update_priority(self, handle, priority):
+        """Change priority of item identified by `handle` to `priority`.
+
+        The handle is kept so the item stays after items pushed before it
+        with equal priority.
+
+        Runtime complexity: `O(log(n))` -- approximate.
+
+        :param handle: handle of item
+        :param priority: new priority
+        :raises KeyError: if `handle` not found
+
+        """
+        _entries = self._entries
+        entry = _entries[handle]
+        self._list.remove(entry)
+        entry = _entries[handle] = (priority, handle, entry[2])
+        self._list.add(entry)
+
+    def remove(self, handle):
+        """Remove and return `(priority, item)` pair identified by `handle`.
+
+        Runtime complexity: `O(log(n))` -- approximate.
+
+        :param handle: handle of item
+        :return: `(priority, item)` pair
+        :raises KeyError: if `handle` not found
+
+        """
+        priority, _, item = entry = self._entries.pop(handle)
+        self._list.remove(entry)
+        return priority, item
+
+    def clear(self):
+        """Remove all items from sorted priority queue.
+
+        Runtime complexity: `O(n)`
+
+        """
+        self._list.clear()
+        self._entries.clear()
+
+    def __contains__(self, handle):
+        """Return true if `handle` identifies an item in the priority queue.
+
+        ``spq.__contains__(handle)`` <==> ``handle in spq``
+
+        """
+        return handle in self._entries
+
+    def __len__(self):
+        """Return the number of items in the sorted priority queue.
+
+        ``spq.__len__()`` <==> ``len(spq)``
+
+        """
+        return len(self._list)
+
+    def __iter__(self):
+        """Return an iterator of `(priority, item)` pairs in priority order.
+
+        ``spq.__iter__()`` <==> ``iter(spq)``
+
+        """
+        for priority, _, item in self._list:
+            yield priority, item
+
+    @recursive_repr()
+    def __repr__(self):
+        """Return string representation of sorted priority queue.
+
+        ``spq.__repr__()`` <==> ``repr(spq)``
+
+        :return: string representation
+
+        """
+        return f'{type(self).__name__}({list(self)!r})'
+
+    def _check(self):
+        """Check invariants of sorted priority queue.
+
+        Runtime complexity: `O(n)`
+
+        """
+        self._list._check()
+        _entries = self._entries
+        assert len(_entries) == len(self._list)
+
+        for entry in self._list:
+            assert _entries[entry[1]] is entry
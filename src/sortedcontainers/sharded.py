@@ -0,0 +1,886 @@
+"""Sharded Sorted Containers
+==========================
+
+:doc:`Sorted Containers<index>` is an Apache2 licensed Python sorted
+collections library, written in pure-Python, and fast as C-extensions. The
+:doc:`introduction<introduction>` is the best way to get started.
+
+Sharded sorted container implementations:
+
+.. currentmodule:: sortedcontainers.sharded
+
+* :class:`ShardedSortedList`
+
+"""
+
+import multiprocessing
+from bisect import bisect_left, bisect_right
+from collections import deque
+from collections.abc import Sequence
+from itertools import chain
+from operator import ne
+
+from .sortedlist import SortedList, identity, recursive_repr
+
+
+def _discard(sorted_list, value):
+    "Remove `value` from `sorted_list` and return true if it was a member."
+    if value in sorted_list:
+        sorted_list.remove(value)
+        return True
+    return False
+
+
+def _take(sorted_list, count, tail):
+    """Remove and return `count` values from one end of `sorted_list`.
+
+    The cut is moved down to the start of a run of equal keys so runs are not
+    split across shards, or up to its end when the tail cut would reach the
+    head. Returns the removed values and a list of the first
+    remaining value, if any.
+
+    """
+    size = len(sorted_list)
+    idx = size - count if tail else count
+
+    if idx <= 0:
+        idx = 0
+    elif idx >= size:
+        idx = size
+    else:
+        value = sorted_list[idx]
+        idx = sorted_list.bisect_left(value)
+
+        if tail and not idx:
+            idx = sorted_list.bisect_right(value)
+
+    if tail:
+        values = sorted_list[idx:]
+        del sorted_list[idx:]
+    else:
+        values = sorted_list[:idx]
+        del sorted_list[:idx]
+
+    return values, sorted_list[:1]
+
+
+def _irange_key(sorted_list, *args):
+    "Return list of values with keys in range. Values are keys without key."
+    irange_key = getattr(sorted_list, 'irange_key', sorted_list.irange)
+    return list(irange_key(*args))
+
+
+def _batch(sorted_list, requests):
+    "Run `requests` in order and return list of their replies."
+    return [_run(sorted_list, name, args) for name, args in requests]
+
+
+_COMMANDS = {
+    'batch': _batch,
+    'discard': _discard,
+    'take': _take,
+    'values': list,
+    'irange': lambda sorted_list, *args: list(sorted_list.irange(*args)),
+    'irange_key': _irange_key,
+    'islice': lambda sorted_list, *args: list(sorted_list.islice(*args)),
+    'bisect_key_left': lambda sorted_list, key: getattr(
+        sorted_list, 'bisect_key_left', sorted_list.bisect_left
+    )(key),
+    'bisect_key_right': lambda sorted_list, key: getattr(
+        sorted_list, 'bisect_key_right', sorted_list.bisect_right
+    )(key),
+}
+
+
+def _run(sorted_list, name, args):
+    """Run command `name` with `args` on `sorted_list` and return reply.
+
+    Replies are pairs of a success flag and the result or the exception
+    raised.
+
+    """
+    command = _COMMANDS.get(name)
+
+    try:
+        if command is None:
+            result = getattr(sorted_list, name)(*args)
+        else:
+            result = command(sorted_list, *args)
+    except Exception as exc:  # pylint: disable=broad-except
+        return False, exc
+
+    return True, result
+
+
+def _serve(conn, key):
+    """Serve requests for a shard over `conn` until sent none.
+
+    Requests are pairs of a command name and arguments. See :func:`_run` for
+    replies.
+
+    """
+    sorted_list = SortedList(key=key)
+
+    while True:
+        request = conn.recv()
+
+        if request is None:
+            break
+
+        conn.send(_run(sorted_list, *request))
+
+    conn.close()
+
+
+class ShardedSortedList:
+    """Sharded sorted list spreads sorted values across worker processes.
+
+    The keyspace is range-partitioned across shards. Each shard is a sorted
+    list owned by a worker process. Boundary keys route values to shards:
+    shard `i` holds the values with keys at least boundary `i - 1` and less
+    than boundary `i`, so values are in sorted order shard after shard.
+
+    Single-value methods like :func:`ShardedSortedList.add` and
+    :func:`ShardedSortedList.bisect_left` are routed to one shard. Bulk
+    methods like :func:`ShardedSortedList.update`,
+    :func:`ShardedSortedList.irange` and :func:`ShardedSortedList.islice`
+    send requests to all their shards before waiting for any reply so the
+    shards work in parallel.
+
+    Single-value mutations by :func:`ShardedSortedList.add` and
+    :func:`ShardedSortedList.discard` are pipelined: requests to a shard are
+    buffered and sent in batches of `_window` without waiting for their
+    replies. The buffer of a shard is sent and its replies are received
+    before it is next read. An error raised by a pipelined mutation, like
+    :exc:`TypeError` from comparing values, is raised by the method that
+    receives its reply.
+
+    Boundaries are moved by :func:`ShardedSortedList.rebalance` when the
+    largest shard grows past twice its share of values plus the load-factor.
+
+    Values and the key function must be picklable. Call
+    :func:`ShardedSortedList.close` or use the sharded sorted list as a
+    context manager to stop the workers.
+
+    >>> with ShardedSortedList(range(10), shards=2) as ssl:
+    ...     ssl.add(5)
+    ...     list(ssl.irange(4, 6))
+    [4, 5, 5, 6]
+
+    """
+
+    _load = 1000
+    _window = 64
+
+    def __init__(self, iterable=None, key=None, shards=None, context=None):
+        """Initialize sharded sorted list instance.
+
+        Optional `iterable` argument provides an initial iterable of values.
+
+        Optional `key` argument defines a callable that, like the `key`
+        argument to Python's `sorted` function, extracts a comparison key from
+        each value.
+
+        Optional `shards` argument sets the number of worker processes and
+        defaults to the number of CPUs. Optional `context` argument is a
+        :mod:`multiprocessing` context or start method name.
+
+        :param iterable: initial values (optional)
+        :param key: function used to extract comparison key (optional)
+        :param int shards: number of shards (optional)
+        :param context: multiprocessing context (optional)
+
+        """
+        if shards is None:
+            shards = multiprocessing.cpu_count()
+
+        if shards < 1:
+            raise ValueError('shards must be at least one')
+
+        if context is None or isinstance(context, str):
+            context = multiprocessing.get_context(context)
+
+        self._key = key
+        self._context = context
+        self._boundaries = []
+        self._lens = [0] * shards
+        self._buffers = [[] for _ in range(shards)]
+        self._pending = [deque() for _ in range(shards)]
+        self._conns = []
+        self._procs = []
+
+        for _ in range(shards):
+            conn, child = context.Pipe()
+            proc = context.Process(target=_serve, args=(child, key), daemon=True)
+            proc.start()
+            child.close()
+            self._conns.append(conn)
+            self._procs.append(proc)
+
+        if iterable is not None:
+            self.update(iterable)
+
+    @property
+    def key(self):
+        "Function used to extract comparison key from values."
+        return self._key
+
+    @property
+    def shards(self):
+        "Number of shards."
+        return len(self._conns)
+
+    def _result(self, shard):
+        "Receive reply from `shard` and return its result or raise its error."
+        success, result = self._conns[shard].recv()
+
+        if not success:
+            raise result
+
+        return result
+
+    def _send(self, shard, name, args, done):
+        """Buffer command `name` for `shard` without waiting for its reply.
+
+        The buffer is sent as a batch when it is full. The reply is received
+        by :func:`ShardedSortedList._drain` which calls `done` with the success
+        flag and the result.
+
+        """
+        buffer = self._buffers[shard]
+        buffer.append((name, args, done))
+
+        if len(buffer) >= self._window:
+            self._flush(shard)
+
+            if len(self._pending[shard]) > 1:
+                self._receive(shard)
+
+    def _flush(self, shard):
+        "Send the buffered commands of `shard` as a batch."
+        buffer = self._buffers[shard]
+        requests = [(name, args) for name, args, _ in buffer]
+        self._conns[shard].send(('batch', (requests,)))
+        self._pending[shard].append([done for _, _, done in buffer])
+        buffer.clear()
+
+    def _receive(self, shard):
+        "Receive the replies of the oldest batch sent to `shard`."
+        dones = self._pending[shard].popleft()
+        replies = self._result(shard)
+        error = None
+
+        for done, (success, result) in zip(dones, replies):
+            done(success, result)
+
+            if not success and error is None:
+                error = result
+
+        if error is not None:
+            raise error
+
+    def _drain(self, shard):
+        """Send the buffer of `shard` and receive the replies of its batches.
+
+        The first error is raised after all replies are received.
+
+        """
+        if self._buffers[shard]:
+            self._flush(shard)
+
+        pending = self._pending[shard]
+        error = None
+
+        while pending:
+            try:
+                self._receive(shard)
+            except Exception as exc:  # pylint: disable=broad-except
+                if error is None:
+                    error = exc
+
+        if error is not None:
+            raise error
+
+    def _sync(self):
+        "Receive the replies of pipelined requests sent to all shards."
+        error = None
+
+        for shard in range(self.shards):
+            try:
+                self._drain(shard)
+            except Exception as exc:  # pylint: disable=broad-except
+                error = exc
+
+        if error is not None:
+            raise error
+
+    def _call(self, shard, name, *args):
+        "Call command `name` in `shard` and return result."
+        self._drain(shard)
+        self._conns[shard].send((name, args))
+        return self._result(shard)
+
+    def _fanout(self, requests):
+        """Send all `requests` then return results in the same order.
+
+        Requests are triples of shard, command name and arguments. Errors are
+        raised after all replies are received.
+
+        """
+        self._sync()
+
+        for shard, name, args in requests:
+            self._conns[shard].send((name, args))
+
+        results = []
+        error = None
+
+        for shard, _, _ in requests:
+            try:
+                results.append(self._result(shard))
+            except Exception as exc:  # pylint: disable=broad-except
+                error = exc
+
+        if error is not None:
+            raise error
+
+        return results
+
+    def _route(self, value):
+        "Return shard of `value`."
+        key = self._key or identity
+        return bisect_right(self._boundaries, key(value))
+
+    def _route_key(self, key):
+        "Return shard of values with `key`."
+        return bisect_right(self._boundaries, key)
+
+    def _offset(self, shard):
+        "Return index of first value in `shard`."
+        self._sync()
+        return sum(self._lens[:shard])
+
+    def add(self, value):
+        """Add `value` to sharded sorted list.
+
+        The request is pipelined. See :class:`ShardedSortedList` for details.
+
+        :param value: value to add
+
+        """
+        shard = self._route(value)
+        _lens = self._lens
+
+        def done(success, _):
+            if not success:
+                _lens[shard] -= 1
+
+        _lens[shard] += 1
+        self._send(shard, 'add', (value,), done)
+        self._balance()
+
+    def update(self, iterable):
+        """Update sharded sorted list by adding all values from `iterable`.
+
+        Values are partitioned by boundary keys and the shards are updated in
+        parallel.
+
+        :param iterable: iterable of values to add
+
+        """
+        key = self._key or identity
+        values = sorted(iterable, key=key)
+
+        if not values:
+            return
+
+        self._sync()
+
+        if not any(self._lens):
+            self._boundaries = []
+            self._call(0, 'update', values)
+            self._lens[0] = len(values)
+            self.rebalance()
+            return
+
+        keys = list(map(key, values))
+        requests = []
+        start = 0
+
+        for shard, boundary in enumerate(self._boundaries + [None]):
+            if boundary is None:
+                stop = len(values)
+            else:
+                stop = bisect_left(keys, boundary, start)
+
+            if stop > start:
+                requests.append((shard, 'update', (values[start:stop],)))
+                self._lens[shard] += stop - start
+
+            start = stop
+
+        self._fanout(requests)
+        self._balance()
+
+    def discard(self, value):
+        """Remove `value` from sharded sorted list if it is a member.
+
+        The request is pipelined. See :class:`ShardedSortedList` for details.
+
+        :param value: value to discard
+
+        """
+        shard = self._route(value)
+        _lens = self._lens
+
+        def done(success, result):
+            if success and result:
+                _lens[shard] -= 1
+
+        self._send(shard, 'discard', (value,), done)
+
+    def remove(self, value):
+        """Remove `value` from sharded sorted list.
+
+        :param value: value to remove
+        :raises ValueError: if `value` is not a member
+
+        """
+        shard = self._route(value)
+        self._call(shard, 'remove', value)
+        self._lens[shard] -= 1
+
+    def clear(self):
+        "Remove all values from sharded sorted list."
+        self._fanout([(shard, 'clear', ()) for shard in range(self.shards)])
+        self._boundaries = []
+        self._lens[:] = [0] * self.shards
+
+    def _locate(self, index):
+        "Return shard and shard index of `index`."
+        size = len(self)
+
+        if index < 0:
+            index += size
+
+        if not 0 <= index < size:
+            raise IndexError('list index out of range')
+
+        for shard, length in enumerate(self._lens):
+            if index < length:
+                return shard, index
+            index -= length
+
+    def pop(self, index=-1):
+        """Remove and return value at `index` in sharded sorted list.
+
+        :param int index: index of value (default -1)
+        :return: value
+        :raises IndexError: if index out of range
+
+        """
+        shard, idx = self._locate(index)
+        value = self._call(shard, 'pop', idx)
+        self._lens[shard] -= 1
+        return value
+
+    def __delitem__(self, index):
+        """Remove value at `index` from sharded sorted list.
+
+        ``ssl.__delitem__(index)`` <==> ``del ssl[index]``
+
+        Slices are split into a slice of each shard they overlap and the
+        shards delete their slices in parallel.
+
+        :param index: integer or slice for indexing
+        :raises IndexError: if index out of range
+
+        """
+        if not isinstance(index, slice):
+            shard, idx = self._locate(index)
+            self._call(shard, '__delitem__', idx)
+            self._lens[shard] -= 1
+            return
+
+        indices = range(len(self))[index]
+
+        if indices.step < 0:
+            indices = indices[::-1]
+
+        start, stop, step = indices.start, indices.stop, indices.step
+        requests = []
+        offset = 0
+
+        for shard, length in enumerate(self._lens):
+            lower = max(start, offset)
+            lower += -(lower - start) % step
+            upper = min(stop, offset + length)
+
+            if lower < upper:
+                part = slice(lower - offset, upper - offset, step)
+                requests.append((shard, '__delitem__', (part,)))
+                self._lens[shard] -= len(range(lower, upper, step))
+
+            offset += length
+
+        self._fanout(requests)
+        self._balance()
+
+    def __len__(self):
+        """Return the size of the sharded sorted list.
+
+        ``ssl.__len__()`` <==> ``len(ssl)``
+
+        """
+        self._sync()
+        return sum(self._lens)
+
+    def __contains__(self, value):
+        """Return true if `value` is an element of the sharded sorted list.
+
+        ``ssl.__contains__(value)`` <==> ``value in ssl``
+
+        """
+        return self._call(self._route(value), '__contains__', value)
+
+    def __getitem__(self, index):
+        """Lookup value at `index` in sharded sorted list.
+
+        ``ssl.__getitem__(index)`` <==> ``ssl[index]``
+
+        Slices with step one are read with :func:`ShardedSortedList.islice`.
+
+        :param index: integer or slice for indexing
+        :return: value or list of values
+        :raises IndexError: if index out of range
+
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+
+            if step == 1:
+                return list(self.islice(start, stop))
+
+            return list(self)[index]
+
+        shard, idx = self._locate(index)
+        return self._call(shard, '__getitem__', idx)
+
+    def __iter__(self):
+        """Return an iterator over the sharded sorted list.
+
+        Values are read from one shard at a time.
+
+        ``ssl.__iter__()`` <==> ``iter(ssl)``
+
+        """
+        self._sync()
+
+        for shard, length in enumerate(self._lens):
+            if length:
+                yield from self._call(shard, 'values')
+
+    def __reversed__(self):
+        """Return a reverse iterator over the sharded sorted list.
+
+        ``ssl.__reversed__()`` <==> ``reversed(ssl)``
+
+        """
+        self._sync()
+
+        for shard in reversed(range(self.shards)):
+            if self._lens[shard]:
+                yield from reversed(self._call(shard, 'values'))
+
+    def bisect_left(self, value):
+        """Return an index to insert `value` in the sharded sorted list.
+
+        See :func:`SortedList.bisect_left` for details.
+
+        """
+        shard = self._route(value)
+        return self._offset(shard) + self._call(shard, 'bisect_left', value)
+
+    def bisect_right(self, value):
+        """Return an index to insert `value` in the sharded sorted list.
+
+        See :func:`SortedList.bisect_right` for details.
+
+        """
+        shard = self._route(value)
+        return self._offset(shard) + self._call(shard, 'bisect_right', value)
+
+    bisect = bisect_right
+
+    def bisect_key_left(self, key):
+        """Return an index to insert `key` in the sharded sorted list.
+
+        Without a key function, keys are the values themselves. See
+        :func:`SortedKeyList.bisect_key_left` for details.
+
+        """
+        shard = self._route_key(key)
+        return self._offset(shard) + self._call(shard, 'bisect_key_left', key)
+
+    def bisect_key_right(self, key):
+        """Return an index to insert `key` in the sharded sorted list.
+
+        Without a key function, keys are the values themselves. See
+        :func:`SortedKeyList.bisect_key_right` for details.
+
+        """
+        shard = self._route_key(key)
+        return self._offset(shard) + self._call(shard, 'bisect_key_right', key)
+
+    bisect_key = bisect_key_right
+
+    def count(self, value):
+        "Return number of occurrences of `value` in the sharded sorted list."
+        return self._call(self._route(value), 'count', value)
+
+    def index(self, value):
+        """Return first index of `value` in sharded sorted list.
+
+        :raises ValueError: if `value` is not present
+
+        """
+        shard = self._route(value)
+        return self._offset(shard) + self._call(shard, 'index', value)
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True), reverse=False):
+        """Create an iterator of values between `minimum` and `maximum`.
+
+        Shards overlapping the range are read in parallel and their values
+        are chained in order. See :func:`SortedList.irange` for details.
+
+        """
+        key = self._key or identity
+        min_key = None if minimum is None else key(minimum)
+        max_key = None if maximum is None else key(maximum)
+        args = (minimum, maximum, inclusive, reverse)
+        return self._irange('irange', min_key, max_key, args)
+
+    def irange_key(
+        self, min_key=None, max_key=None, inclusive=(True, True), reverse=False
+    ):
+        """Create an iterator of values between `min_key` and `max_key`.
+
+        Without a key function, keys are the values themselves. See
+        :func:`SortedKeyList.irange_key` for details.
+
+        """
+        args = (min_key, max_key, inclusive, reverse)
+        return self._irange('irange_key', min_key, max_key, args)
+
+    def _irange(self, name, min_key, max_key, args):
+        "Fan out command `name` to shards with keys in range and chain results."
+        self._sync()
+        first = 0 if min_key is None else self._route_key(min_key)
+        last = self.shards - 1 if max_key is None else self._route_key(max_key)
+        requests = [
+            (shard, name, args) for shard in range(first, last + 1) if self._lens[shard]
+        ]
+        return self._chain(requests, args[-1])
+
+    def islice(self, start=None, stop=None, reverse=False):
+        """Return an iterator that slices sharded sorted list from `start` to
+        `stop`.
+
+        Shards overlapping the slice are read in parallel and their values
+        are chained in order. See :func:`SortedList.islice` for details.
+
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        requests = []
+        offset = 0
+
+        for shard, length in enumerate(self._lens):
+            lower = max(start - offset, 0)
+            upper = min(stop - offset, length)
+
+            if lower < upper:
+                requests.append((shard, 'islice', (lower, upper, reverse)))
+
+            offset += length
+
+        return self._chain(requests, reverse)
+
+    def _chain(self, requests, reverse):
+        "Fan out `requests` and chain results in sorted or reverse order."
+        results = self._fanout(requests)
+
+        if reverse:
+            results.reverse()
+
+        return chain.from_iterable(results)
+
+    def _balance(self):
+        "Rebalance shards when the largest has grown too large."
+        _lens = self._lens
+        share = sum(_lens) // len(_lens)
+
+        if max(_lens) > 2 * share + self._load:
+            self.rebalance()
+
+    def rebalance(self):
+        """Move values between shards to even their sizes.
+
+        Boundaries are moved left to right so the first `i` shards hold about
+        `i` shares of values. A shard short of values takes the smallest
+        values of the next non-empty shard and empty shards between them are
+        left with empty ranges. Runs of equal keys are not split across
+        shards.
+
+        """
+        self._sync()
+        _lens = self._lens
+        _boundaries = self._boundaries
+        key = self._key or identity
+        total = sum(_lens)
+        shards = len(_lens)
+        filled = 0
+
+        for shard in range(shards - 1):
+            filled += _lens[shard]
+            surplus = filled - total * (shard + 1) // shards
+
+            if surplus > 0:
+                values, _ = self._call(shard, 'take', surplus, True)
+
+                if not values:
+                    continue
+
+                self._call(shard + 1, 'update', values)
+                boundary = key(values[0])
+
+                if shard == len(_boundaries):
+                    _boundaries.append(boundary)
+                else:
+                    _boundaries[shard] = boundary
+
+                _lens[shard] -= len(values)
+                _lens[shard + 1] += len(values)
+                filled -= len(values)
+            elif surplus < 0:
+                source = shard + 1
+                active = len(_boundaries)
+
+                while source <= active and not _lens[source]:
+                    source += 1
+
+                if source > active:
+                    continue
+
+                values, rest = self._call(source, 'take', -surplus, False)
+
+                if not values:
+                    continue
+
+                self._call(shard, 'update', values)
+
+                if rest:
+                    boundary = key(rest[0])
+                elif source < active:
+                    boundary = _boundaries[source]
+                else:
+                    del _boundaries[shard:]
+                    boundary = None
+
+                if boundary is not None:
+                    _boundaries[shard:source] = [boundary] * (source - shard)
+
+                _lens[source] -= len(values)
+                _lens[shard] += len(values)
+                filled += len(values)
+
+    def copy(self):
+        """Return a shallow copy of the sharded sorted list.
+
+        The copy has new worker processes with the same shards and
+        boundaries. Shards are copied in parallel.
+
+        :return: new sharded sorted list
+
+        """
+        requests = [(shard, 'values', ()) for shard in range(self.shards)]
+        values = self._fanout(requests)
+        result = self.__class__(
+            key=self._key, shards=self.shards, context=self._context
+        )
+        result._load = self._load
+        result._boundaries = self._boundaries[:]
+        result._lens[:] = self._lens
+        requests = [
+            (shard, 'update', (part,)) for shard, part in enumerate(values) if part
+        ]
+        result._fanout(requests)
+        return result
+
+    __copy__ = copy
+
+    def __eq__(self, other):
+        """Return true if and only if sharded sorted list is equal to `other`.
+
+        ``ssl.__eq__(other)`` <==> ``ssl == other``
+
+        :param other: `other` sequence or sharded sorted list
+        :return: true if sharded sorted list is equal to `other`
+
+        """
+        if not isinstance(other, (Sequence, ShardedSortedList)):
+            return NotImplemented
+
+        return len(self) == len(other) and not any(map(ne, self, other))
+
+    __hash__ = None
+
+    def close(self):
+        "Stop the worker processes."
+        for conn in self._conns:
+            conn.send(None)
+            conn.close()
+
+        for proc in self._procs:
+            proc.join()
+
+        self._conns = []
+        self._procs = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @recursive_repr()
+    def __repr__(self):
+        """Return string representation of sharded sorted list.
+
+        ``ssl.__repr__()`` <==> ``repr(ssl)``
+
+        """
+        type_name = type(self).__name__
+        return f'{type_name}({list(self)!r}, shards={self.shards})'
+
+    def _check(self):
+        """Check invariants of sharded sorted list.
+
+        Shard sizes and boundaries are compared with the values of every
+        shard.
+
+        """
+        _boundaries = self._boundaries
+        assert _boundaries == sorted(_boundaries)
+        assert len(_boundaries) < len(self._lens)
+        requests = [(shard, 'values', ()) for shard in range(self.shards)]
+
+        for shard, values in enumerate(self._fanout(requests)):
+            assert len(values) == self._lens[shard]
+
+            if shard > len(_boundaries):
+                assert not values
+
+            for value in values:
+                assert self._route(value) == shard
+
+            self._call(shard, '_check')
@@ -10,6 +10,7 @@ Sorted dict implementations:
 .. currentmodule:: sortedcontainers
 
 * :class:`SortedDict`
+* :class:`SortedColocatedDict`
 * :class:`SortedKeysView`
 * :class:`SortedItemsView`
 * :class:`SortedValuesView`
@@ -17,10 +18,20 @@ Sorted dict implementations:
 """
 
 import warnings
+from bisect import bisect_left, bisect_right
 from collections.abc import ItemsView, KeysView, Mapping, Sequence, ValuesView
+from functools import reduce
 from itertools import chain
-
-from .sortedlist import SortedList, recursive_repr
+from operator import iadd
+
+from .sortedlist import (
+    SortedKeyList,
+    SortedList,
+    _dump_payload,
+    _load_payload,
+    identity,
+    recursive_repr,
+)
 from .sortedset import SortedSet
 
 
@@ -52,12 +63,19 @@ class SortedDict(dict):
     * :func:`SortedDict.clear`
     * :func:`SortedDict.pop`
     * :func:`SortedDict.popitem`
+    * :func:`SortedDict.delete_range`
+    * :func:`SortedDict.delete_many`
+    * :func:`SortedDict.pop_range`
 
     Methods for looking up items:
 
     * :func:`SortedDict.__contains__` (inherited from dict)
     * :func:`SortedDict.get` (inherited from dict)
     * :func:`SortedDict.peekitem`
+    * :func:`SortedDict.irange_items`
+    * :func:`SortedDict.irange_values`
+    * :func:`SortedDict.islice_items`
+    * :func:`SortedDict.islice_values`
 
     Methods for views:
 
@@ -68,7 +86,10 @@ class SortedDict(dict):
     Methods for miscellany:
 
     * :func:`SortedDict.copy`
+    * :func:`SortedDict.snapshot`
     * :func:`SortedDict.fromkeys`
+    * :func:`SortedDict.dump`
+    * :func:`SortedDict.load`
     * :func:`SortedDict.__reversed__`
     * :func:`SortedDict.__eq__` (inherited from dict)
     * :func:`SortedDict.__ne__` (inherited from dict)
@@ -137,12 +158,16 @@ class SortedDict(dict):
         else:
             _key = self._key = None
 
-        self._list = SortedList(key=_key)
+        self._bind_list(self._new_list(_key))
+        self._update(*args, **kwargs)
+
+    def _bind_list(self, _list):
+        """Set sorted list of keys to `_list` and cache its methods."""
+        self._list = _list
 
         # Reaching through ``self._list`` repeatedly adds unnecessary overhead
         # so cache references to sorted list methods.
 
-        _list = self._list
         self._list_add = _list.add
         self._list_clear = _list.clear
         self._list_iter = _list.__iter__
@@ -161,13 +186,15 @@ class SortedDict(dict):
         self.islice = _list.islice
         self._reset = _list._reset
 
-        if _key is not None:
+        if self._key is not None:
             self.bisect_key_left = _list.bisect_key_left
             self.bisect_key_right = _list.bisect_key_right
             self.bisect_key = _list.bisect_key
             self.irange_key = _list.irange_key
 
-        self._update(*args, **kwargs)
+    def _new_list(self, key):
+        """Return new sorted list for keys with key-function `key`."""
+        return SortedList(key=key)
 
     @property
     def key(self):
@@ -300,10 +327,50 @@ class SortedDict(dict):
         :return: new sorted dict
 
         """
-        return self.__class__(self._key, self.items())
+        _list = self._list
+        result = self.__class__(self._key)
+        dict.update(result, self)
+        keys = reduce(iadd, _list._lists, [])
+        result._list._update_sorted(keys, _list._sorted_keys())
+        return result
 
     __copy__ = copy
 
+    def snapshot(self):
+        """Return a snapshot of the sorted dict.
+
+        The snapshot is a sorted dict of the same type. Its sorted keys are a
+        copy-on-write snapshot of the sorted list of keys so the keys are not
+        copied or sorted again. See :func:`SortedList.snapshot` for details.
+        The value sublists of a :class:`SortedColocatedDict` are shared the
+        same way. Iterating the keys, items or values of the snapshot is
+        unaffected by later changes to the sorted dict.
+
+        The snapshot is itself a dict so the dict's items are always copied
+        in `O(n)`. Iterators of
+        :class:`~sortedcontainers.concurrent.ConcurrentSortedDict` avoid the
+        copy by taking a snapshot of the sorted keys alone.
+
+        Runtime complexity: `O(n)` -- copying the dict's items only
+
+        >>> sd = SortedDict({'a': 1, 'b': 2})
+        >>> snapshot = sd.snapshot()
+        >>> sd['a'] = 0
+        >>> del sd['b']
+        >>> snapshot
+        SortedDict({'a': 1, 'b': 2})
+        >>> list(snapshot.items())
+        [('a', 1), ('b', 2)]
+
+        :return: new sorted dict
+
+        """
+        result = dict.__new__(type(self))
+        result._key = self._key
+        result._bind_list(self._list.snapshot())
+        dict.update(result, self)
+        return result
+
     @classmethod
     def fromkeys(cls, iterable, value=None):
         """Return a new sorted dict initailized from `iterable` and `value`.
@@ -424,6 +491,106 @@ class SortedDict(dict):
         value = dict.pop(self, key)
         return (key, value)
 
+    def _pop_range_keys(self, minimum, maximum, inclusive):
+        """Remove and return list of keys between `minimum` and `maximum`.
+
+        Keys are removed from the sorted list in bulk but not from the dict.
+
+        """
+        _list = self._list
+        loc = _list._irange_loc(minimum, maximum, inclusive)
+
+        if loc is None:
+            return []
+
+        keys = list(_list._islice(*loc, False))
+        _list._delete_range(*loc)
+        return keys
+
+    def delete_range(self, minimum=None, maximum=None, inclusive=(True, True)):
+        """Remove items with keys between `minimum` and `maximum`.
+
+        Both `minimum` and `maximum` default to `None` which is automatically
+        inclusive of the beginning and end of the sorted dict.
+
+        The argument `inclusive` is a pair of booleans that indicates whether
+        the minimum and maximum ought to be included in the range,
+        respectively. The default is ``(True, True)`` such that the range is
+        inclusive of both minimum and maximum.
+
+        Both ends of the range are located once and the keys between are
+        removed from the sorted keys in bulk.
+
+        Runtime complexity: `O(k + m)` where `m` is the number of sublists
+        -- approximate.
+
+        >>> sd = SortedDict({'a': 1, 'b': 2, 'c': 3, 'd': 4})
+        >>> sd.delete_range('b', 'c')
+        >>> sd
+        SortedDict({'a': 1, 'd': 4})
+
+        :param minimum: minimum key of items to remove
+        :param maximum: maximum key of items to remove
+        :param inclusive: pair of booleans
+
+        """
+        _dict_delitem = dict.__delitem__
+
+        for key in self._pop_range_keys(minimum, maximum, inclusive):
+            _dict_delitem(self, key)
+
+    def delete_many(self, keys):
+        """Remove items with keys in `keys` from sorted dict.
+
+        Keys that are not in the sorted dict are ignored. The keys are
+        removed from the sorted keys in a single sweep. See
+        :func:`SortedList.discard_many`.
+
+        Runtime complexity: `O(k*log(k) + k*log(m) + m)` where `m` is the
+        load-factor -- approximate.
+
+        >>> sd = SortedDict({'a': 1, 'b': 2, 'c': 3, 'd': 4})
+        >>> sd.delete_many(['d', 'b', 'z'])
+        >>> sd
+        SortedDict({'a': 1, 'c': 3})
+
+        :param keys: iterable of keys of items to remove
+
+        """
+        _dict_contains = dict.__contains__
+        keys = [key for key in dict.fromkeys(keys) if _dict_contains(self, key)]
+        self._list.discard_many(keys)
+        _dict_delitem = dict.__delitem__
+
+        for key in keys:
+            _dict_delitem(self, key)
+
+    def pop_range(self, minimum=None, maximum=None, inclusive=(True, True)):
+        """Remove and return list of items with keys between `minimum` and
+        `maximum`.
+
+        Items are returned in sorted order. See :func:`SortedDict.delete_range`
+        for details of arguments.
+
+        Runtime complexity: `O(k + m)` where `m` is the number of sublists
+        -- approximate.
+
+        >>> sd = SortedDict({'a': 1, 'b': 2, 'c': 3, 'd': 4})
+        >>> sd.pop_range('b', 'c')
+        [('b', 2), ('c', 3)]
+        >>> sd
+        SortedDict({'a': 1, 'd': 4})
+
+        :param minimum: minimum key of items to remove
+        :param maximum: maximum key of items to remove
+        :param inclusive: pair of booleans
+        :return: list of key and value pairs
+
+        """
+        _dict_pop = dict.pop
+        keys = self._pop_range_keys(minimum, maximum, inclusive)
+        return [(key, _dict_pop(self, key)) for key in keys]
+
     def peekitem(self, index=-1):
         """Return ``(key, value)`` pair at `index` in sorted dict.
 
@@ -454,6 +621,129 @@ class SortedDict(dict):
         key = self._list[index]
         return key, self[key]
 
+    def _items_at(self, index):
+        """Return item or list of items at `index`. Supports slicing.
+
+        Used by :class:`SortedItemsView`.
+
+        """
+        _list = self._list
+
+        if isinstance(index, slice):
+            keys = _list[index]
+            return list(zip(keys, map(self.__getitem__, keys)))
+
+        key = _list[index]
+        return key, self[key]
+
+    def _values_at(self, index):
+        """Return value or list of values at `index`. Supports slicing.
+
+        Used by :class:`SortedValuesView`.
+
+        """
+        _list = self._list
+
+        if isinstance(index, slice):
+            keys = _list[index]
+            return list(map(self.__getitem__, keys))
+
+        return self[_list[index]]
+
+    def irange_items(
+        self, minimum=None, maximum=None, inclusive=(True, True), reverse=False
+    ):
+        """Create an iterator of items with keys between `minimum` and
+        `maximum`.
+
+        Items are pairs of key and value. See :func:`SortedList.irange` for
+        details of arguments. Both ends of the range are located once and
+        values are looked up without a Python-level call per item.
+
+        >>> sd = SortedDict({'a': 1, 'b': 2, 'c': 3, 'd': 4})
+        >>> list(sd.irange_items('b', 'c'))
+        [('b', 2), ('c', 3)]
+
+        :param minimum: minimum key to start iterating
+        :param maximum: maximum key to stop iterating
+        :param inclusive: pair of booleans
+        :param bool reverse: yield items in reverse order
+        :return: iterator
+
+        """
+        _list = self._list
+        loc = _list._irange_loc(minimum, maximum, inclusive)
+
+        if loc is None:
+            return iter(())
+
+        keys = _list._islice(*loc, reverse)
+        values = map(self.__getitem__, _list._islice(*loc, reverse))
+        return zip(keys, values)
+
+    def irange_values(
+        self, minimum=None, maximum=None, inclusive=(True, True), reverse=False
+    ):
+        """Create an iterator of values with keys between `minimum` and
+        `maximum`.
+
+        See :func:`SortedDict.irange_items` for details.
+
+        >>> sd = SortedDict({'a': 1, 'b': 2, 'c': 3, 'd': 4})
+        >>> list(sd.irange_values('b', 'c'))
+        [2, 3]
+
+        :param minimum: minimum key to start iterating
+        :param maximum: maximum key to stop iterating
+        :param inclusive: pair of booleans
+        :param bool reverse: yield values in reverse order
+        :return: iterator
+
+        """
+        keys = self._list.irange(minimum, maximum, inclusive, reverse)
+        return map(self.__getitem__, keys)
+
+    def islice_items(self, start=None, stop=None, reverse=False):
+        """Return an iterator that slices sorted dict items from `start` to
+        `stop`.
+
+        Items are pairs of key and value. See :func:`SortedList.islice` for
+        details of arguments.
+
+        >>> sd = SortedDict({'a': 1, 'b': 2, 'c': 3, 'd': 4})
+        >>> list(sd.islice_items(1, 3))
+        [('b', 2), ('c', 3)]
+
+        :param int start: start index (inclusive)
+        :param int stop: stop index (exclusive)
+        :param bool reverse: yield items in reverse order
+        :return: iterator
+
+        """
+        _list = self._list
+        keys = _list.islice(start, stop, reverse)
+        values = map(self.__getitem__, _list.islice(start, stop, reverse))
+        return zip(keys, values)
+
+    def islice_values(self, start=None, stop=None, reverse=False):
+        """Return an iterator that slices sorted dict values from `start` to
+        `stop`.
+
+        See :func:`SortedList.islice` for details of arguments.
+
+        >>> sd = SortedDict({'a': 1, 'b': 2, 'c': 3, 'd': 4})
+        >>> list(sd.islice_values(1, 3))
+        [2, 3]
+
+        :param int start: start index (inclusive)
+        :param int stop: stop index (exclusive)
+        :param bool reverse: yield values in reverse order
+        :return: iterator
+
+        """
+        keys = self._list.islice(start, stop, reverse)
+        return map(self.__getitem__, keys)
+
     def setdefault(self, key, default=None):
         """Return value for item identified by `key` in sorted dict.
 
@@ -527,6 +817,60 @@ class SortedDict(dict):
         items = dict.copy(self)
         return (type(self), (self._key, items))
 
+    def dump(self, fp):
+        """Write sorted dict to binary file object `fp`.
+
+        Keys are written in sorted order followed by their values. See
+        :func:`SortedList.dump` for details of the format and
+        :func:`SortedDict.load` to read the sorted dict.
+
+        Runtime complexity: `O(n)`
+
+        >>> import io
+        >>> fp = io.BytesIO()
+        >>> SortedDict({'b': 2, 'a': 1}).dump(fp)
+        >>> _ = fp.seek(0)
+        >>> SortedDict.load(fp)
+        SortedDict({'a': 1, 'b': 2})
+
+        :param fp: binary file object to write
+
+        """
+        _list = self._list
+        keys = reduce(iadd, _list._lists, [])
+        values = list(map(self.__getitem__, keys))
+        _dump_payload(fp, type(self), (self._key, values), _list, keys)
+
+    @classmethod
+    def load(cls, fp):
+        """Read sorted dict from binary file object `fp`.
+
+        Reads the format written by :func:`SortedDict.dump`. Keys are chopped
+        into sublists without comparing any keys.
+
+        Runtime complexity: `O(n)`
+
+        :param fp: binary file object to read
+        :return: sorted dict
+        :raises ValueError: if the format version is not supported
+        :raises TypeError: if the file contains another type
+
+        """
+        kind, (key, values), load, auto, keys = _load_payload(fp, cls)
+        result = kind(key)
+        result._restore(keys, values, load, auto)
+        return result
+
+    def _restore(self, keys, values, load, auto):
+        """Restore empty sorted dict from `keys` in sorted order and `values`.
+
+        Used by :func:`SortedDict.load`.
+
+        """
+        _list = self._list
+        _list._restore(keys, load, auto)
+        dict.update(self, zip(_list, values))
+
     @recursive_repr()
     def __repr__(self):
         """Return string representation of sorted dict.
@@ -555,6 +899,789 @@ class SortedDict(dict):
         assert all(key in self for key in _list)
 
 
+class SortedColocatedDict(SortedDict):
+    """Colocated sorted dict is a subtype of sorted dict.
+
+    The colocated sorted dict stores each value in sublists parallel to the
+    sublists of sorted keys. Values are split, merged and re-chunked in
+    lockstep with the keys. Positional lookups of values and items, and
+    scans of values in a range of keys, index the sublists directly rather
+    than looking up each key in the dict.
+
+    Assigning a new value to an existing key also locates the key in the
+    sorted keys so it costs `O(log(n))` rather than `O(1)`.
+
+    All the same methods that are available in :class:`SortedDict` are also
+    available in :class:`SortedColocatedDict`.
+
+    >>> sd = SortedColocatedDict({'b': 2, 'a': 1})
+    >>> sd
+    SortedColocatedDict({'a': 1, 'b': 2})
+    >>> sd.values()[-1]
+    2
+
+    """
+
+    def _new_list(self, key):
+        """Return new sorted key-value list for keys with key-function `key`."""
+        return SortedKeyValueList(key=identity if key is None else key)
+
+    def __setitem__(self, key, value):
+        """Store item in sorted dict with `key` and corresponding `value`.
+
+        ``sd.__setitem__(key, value)`` <==> ``sd[key] = value``
+
+        Runtime complexity: `O(log(n))` -- approximate.
+
+        >>> sd = SortedColocatedDict()
+        >>> sd['c'] = 3
+        >>> sd['a'] = 1
+        >>> sd['a'] = 2
+        >>> sd
+        SortedColocatedDict({'a': 2, 'c': 3})
+
+        :param key: key for item
+        :param value: value for item
+
+        """
+        if key in self:
+            self._list.set_value(key, value)
+        else:
+            self._list.add_item(key, value)
+        dict.__setitem__(self, key, value)
+
+    _setitem = __setitem__
+
+    def copy(self):
+        """Return a shallow copy of the sorted dict.
+
+        Runtime complexity: `O(n)`
+
+        :return: new sorted dict
+
+        """
+        _list = self._list
+        result = self.__class__(self._key)
+        dict.update(result, self)
+        keys = reduce(iadd, _list._lists, [])
+        values = reduce(iadd, _list._values, [])
+        result._list._update_sorted_items(keys, _list._sorted_keys(), values)
+        return result
+
+    __copy__ = copy
+
+    def peekitem(self, index=-1):
+        """Return ``(key, value)`` pair at `index` in sorted dict.
+
+        See :func:`SortedDict.peekitem` for details.
+
+        Runtime complexity: `O(log(n))`
+
+        >>> sd = SortedColocatedDict({'a': 1, 'b': 2, 'c': 3})
+        >>> sd.peekitem()
+        ('c', 3)
+
+        :param int index: index of item (default -1)
+        :return: key and value pair
+        :raises IndexError: if `index` out of range
+
+        """
+        return self._list.item(index)
+
+    def _items_at(self, index):
+        """Return item or list of items at `index`. Supports slicing."""
+        _list = self._list
+
+        if isinstance(index, slice):
+            return list(zip(_list[index], _list.value(index)))
+
+        return _list.item(index)
+
+    def _values_at(self, index):
+        """Return value or list of values at `index`. Supports slicing."""
+        return self._list.value(index)
+
+    def _irange_items(self, loc, reverse):
+        """Return iterator of items at index pairs `loc`."""
+        if loc is None:
+            return iter(())
+
+        _list = self._list
+        keys = _list._islice(*loc, reverse)
+        values = _list._islice_values(*loc, reverse)
+        return zip(keys, values)
+
+    def irange_items(
+        self, minimum=None, maximum=None, inclusive=(True, True), reverse=False
+    ):
+        """Create an iterator of items with keys between `minimum` and
+        `maximum`.
+
+        See :func:`SortedDict.irange_items` for details.
+
+        >>> sd = SortedColocatedDict({'a': 1, 'b': 2, 'c': 3, 'd': 4})
+        >>> list(sd.irange_items('b', 'c'))
+        [('b', 2), ('c', 3)]
+
+        :param minimum: minimum key to start iterating
+        :param maximum: maximum key to stop iterating
+        :param inclusive: pair of booleans
+        :param bool reverse: yield items in reverse order
+        :return: iterator
+
+        """
+        loc = self._list._irange_loc(minimum, maximum, inclusive)
+        return self._irange_items(loc, reverse)
+
+    def irange_values(
+        self, minimum=None, maximum=None, inclusive=(True, True), reverse=False
+    ):
+        """Create an iterator of values with keys between `minimum` and
+        `maximum`.
+
+        See :func:`SortedDict.irange_items` for details.
+
+        >>> sd = SortedColocatedDict({'a': 1, 'b': 2, 'c': 3, 'd': 4})
+        >>> list(sd.irange_values('b', 'c'))
+        [2, 3]
+
+        :param minimum: minimum key to start iterating
+        :param maximum: maximum key to stop iterating
+        :param inclusive: pair of booleans
+        :param bool reverse: yield values in reverse order
+        :return: iterator
+
+        """
+        _list = self._list
+        loc = _list._irange_loc(minimum, maximum, inclusive)
+
+        if loc is None:
+            return iter(())
+
+        return _list._islice_values(*loc, reverse)
+
+    def islice_items(self, start=None, stop=None, reverse=False):
+        """Return an iterator that slices sorted dict items from `start` to
+        `stop`.
+
+        See :func:`SortedDict.islice_items` for details.
+
+        >>> sd = SortedColocatedDict({'a': 1, 'b': 2, 'c': 3, 'd': 4})
+        >>> list(sd.islice_items(1, 3))
+        [('b', 2), ('c', 3)]
+
+        :param int start: start index (inclusive)
+        :param int stop: stop index (exclusive)
+        :param bool reverse: yield items in reverse order
+        :return: iterator
+
+        """
+        loc = self._list._islice_loc(start, stop)
+        return self._irange_items(loc, reverse)
+
+    def islice_values(self, start=None, stop=None, reverse=False):
+        """Return an iterator that slices sorted dict values from `start` to
+        `stop`.
+
+        See :func:`SortedDict.islice_values` for details.
+
+        >>> sd = SortedColocatedDict({'a': 1, 'b': 2, 'c': 3, 'd': 4})
+        >>> list(sd.islice_values(1, 3))
+        [2, 3]
+
+        :param int start: start index (inclusive)
+        :param int stop: stop index (exclusive)
+        :param bool reverse: yield values in reverse order
+        :return: iterator
+
+        """
+        _list = self._list
+        loc = _list._islice_loc(start, stop)
+
+        if loc is None:
+            return iter(())
+
+        return _list._islice_values(*loc, reverse)
+
+    def setdefault(self, key, default=None):
+        """Return value for item identified by `key` in sorted dict.
+
+        See :func:`SortedDict.setdefault` for details.
+
+        Runtime complexity: `O(log(n))` -- approximate.
+
+        >>> sd = SortedColocatedDict()
+        >>> sd.setdefault('a', 1)
+        1
+        >>> sd.setdefault('a', 10)
+        1
+
+        :param key: key for item
+        :param default: value for item (default None)
+        :return: value for item identified by `key`
+
+        """
+        if key in self:
+            return self[key]
+        dict.__setitem__(self, key, default)
+        self._list.add_item(key, default)
+        return default
+
+    def update(self, *args, **kwargs):
+        """Update sorted dict with items from `args` and `kwargs`.
+
+        See :func:`SortedDict.update` for details.
+
+        :param args: mapping or iterable of pairs
+        :param kwargs: keyword arguments mapping
+
+        """
+        if self:
+            if not kwargs and len(args) == 1 and isinstance(args[0], dict):
+                pairs = args[0]
+            else:
+                pairs = dict(*args, **kwargs)
+
+            if (10 * len(pairs)) <= len(self):
+                for key in pairs:
+                    self._setitem(key, pairs[key])
+                return
+
+            dict.update(self, pairs)
+        else:
+            dict.update(self, *args, **kwargs)
+
+        _list = self._list
+        _list.clear()
+        _list.update_items(list(dict.keys(self)), list(dict.values(self)))
+
+    _update = update
+
+    def _restore(self, keys, values, load, auto):
+        """Restore empty sorted dict from `keys` in sorted order and `values`.
+
+        Used by :func:`SortedDict.load`.
+
+        """
+        keys = list(keys)
+        _list = self._list
+        _list._load = load
+        _list._update_sorted_items(keys, list(map(_list._key, keys)), values)
+        _list._auto = auto
+        dict.update(self, zip(keys, values))
+
+    def _check(self):
+        """Check invariants of sorted dict.
+
+        Runtime complexity: `O(n)`
+
+        """
+        SortedDict._check(self)
+        _list = self._list
+
+        for keys, values in zip(_list._lists, _list._values):
+            assert all(self[key] is value for key, value in zip(keys, values))
+
+
+class SortedKeyValueList(SortedKeyList):
+    """Sorted key-value list is a subtype of sorted-key list.
+
+    The sorted key-value list maintains dictionary keys in comparison order
+    and a value for each key in sublists parallel to the sublists of keys.
+    Used by :class:`SortedColocatedDict`.
+
+    Values are added with :func:`SortedKeyValueList.add_item` and updated
+    with :func:`SortedKeyValueList.set_value`. Methods that add values
+    without a corresponding value raise :exc:`NotImplementedError`.
+
+    """
+
+    def __init__(self, key=identity):
+        """Initialize sorted key-value list instance.
+
+        :param key: function used to extract comparison key (optional)
+
+        """
+        SortedKeyList.__init__(self, key=key)
+        self._values = []
+
+    def __new__(cls, key=identity):
+        return object.__new__(cls)
+
+    def clear(self):
+        """Remove all keys and values from sorted key-value list.
+
+        Runtime complexity: `O(n)`
+
+        """
+        SortedKeyList.clear(self)
+        del self._values[:]
+
+    _clear = clear
+
+    def _reset(self, load):
+        """Reset sorted key-value list load factor.
+
+        See ``SortedList._reset`` for details.
+
+        :param load: load-factor for sorted list sublists or ``'auto'``
+
+        """
+        if load == 'auto':
+            SortedKeyList._reset(self, load)
+            return
+
+        keys = reduce(iadd, self._lists, [])
+        sort_keys = self._sorted_keys()
+        values = reduce(iadd, self._values, [])
+        self._clear()
+        self._auto = False
+        self._load = load
+        self._update_sorted_items(keys, sort_keys, values)
+
+    def _rechunk(self, size):
+        """Re-chunk sublists at the cursor to the load-factor.
+
+        Values are re-chunked first using the same sublist boundaries. See
+        ``SortedKeyList._rechunk`` for details.
+
+        :param int size: minimum count of values to re-chunk
+
+        """
+        _values = self._values
+        _load = self._load
+        pos = self._cursor
+        len_values = len(_values)
+        stop = pos
+        total = 0
+
+        while stop < len_values and (total < size or total < _load):
+            total += len(_values[stop])
+            stop += 1
+
+        if pos < stop:
+            values = reduce(iadd, _values[pos:stop], [])
+            starts = list(range(0, total, _load))
+
+            if len(starts) > 1 and total - starts[-1] < (_load >> 1):
+                del starts[-1]
+
+            stops = starts[1:] + [total]
+            _values[pos:stop] = [values[idx:end] for idx, end in zip(starts, stops)]
+
+        SortedKeyList._rechunk(self, size)
+
+    def add(self, value):
+        """Raise not-implemented error.
+
+        :raises NotImplementedError: use ``skvl.add_item(key, value)``
+            instead
+
+        """
+        raise NotImplementedError('use ``skvl.add_item(key, value)`` instead')
+
+    def _update_sorted(self, values, keys=None):
+        """Raise not-implemented error.
+
+        :raises NotImplementedError: use ``skvl.update_items(keys, values)``
+            instead
+
+        """
+        message = 'use ``skvl.update_items(keys, values)`` instead'
+        raise NotImplementedError(message)
+
+    update = _update = _update_sorted
+
+    def add_item(self, key, value):
+        """Add `key` with corresponding `value` to sorted key-value list.
+
+        Runtime complexity: `O(log(n))` -- approximate.
+
+        :param key: key to add to sorted key-value list
+        :param value: value for `key`
+
+        """
+        _lists = self._lists
+        _keys = self._keys
+        _values = self._values
+        _maxes = self._maxes
+
+        sort_key = self._key(key)
+
+        if _maxes:
+            pos = bisect_right(_maxes, sort_key)
+
+            if self._shared:
+                self._unshare(min(pos, len(_maxes) - 1))
+                self._unshare_values(min(pos, len(_maxes) - 1))
+
+            if pos == len(_maxes):
+                pos -= 1
+                _lists[pos].append(key)
+                _keys[pos].append(sort_key)
+                _values[pos].append(value)
+                _maxes[pos] = sort_key
+            else:
+                idx = bisect_right(_keys[pos], sort_key)
+                _lists[pos].insert(idx, key)
+                _keys[pos].insert(idx, sort_key)
+                _values[pos].insert(idx, value)
+
+            self._expand(pos)
+        else:
+            _lists.append([key])
+            _keys.append([sort_key])
+            _values.append([value])
+            _maxes.append(sort_key)
+
+        self._len += 1
+
+    def set_value(self, key, value):
+        """Set `value` for `key` in sorted key-value list.
+
+        Runtime complexity: `O(log(n))` -- approximate.
+
+        :param key: key in sorted key-value list
+        :param value: new value for `key`
+        :raises ValueError: if `key` is not in sorted key-value list
+
+        """
+        loc = self._locate(key)
+
+        if loc is None:
+            raise ValueError(f'{key!r} not in list')
+
+        pos, idx = loc
+
+        if self._shared:
+            self._unshare_values(pos)
+
+        self._values[pos][idx] = value
+
+    def _locate(self, key):
+        """Return index pair `(pos, idx)` of `key` or none if not found.
+
+        Runtime complexity: `O(log(n))` -- approximate.
+
+        :param key: key to locate
+        :return: index pair or none
+
+        """
+        _maxes = self._maxes
+
+        if not _maxes:
+            return None
+
+        sort_key = self._key(key)
+        pos = bisect_left(_maxes, sort_key)
+
+        if pos == len(_maxes):
+            return None
+
+        _lists = self._lists
+        _keys = self._keys
+        idx = bisect_left(_keys[pos], sort_key)
+        len_keys = len(_keys)
+        len_sublist = len(_keys[pos])
+
+        while True:
+            if _keys[pos][idx] != sort_key:
+                return None
+            if _lists[pos][idx] == key:
+                return pos, idx
+            idx += 1
+            if idx == len_sublist:
+                pos += 1
+                if pos == len_keys:
+                    return None
+                len_sublist = len(_keys[pos])
+                idx = 0
+
+    def update_items(self, keys, values):
+        """Update empty sorted key-value list from `keys` and `values`.
+
+        Runtime complexity: `O(n*log(n))`
+
+        :param list keys: keys to add
+        :param list values: value for each key
+
+        """
+        sort_keys = list(map(self._key, keys))
+        order = sorted(range(len(keys)), key=sort_keys.__getitem__)
+        keys = [keys[idx] for idx in order]
+        sort_keys = [sort_keys[idx] for idx in order]
+        values = [values[idx] for idx in order]
+        self._update_sorted_items(keys, sort_keys, values)
+
+    def _update_sorted_items(self, keys, sort_keys, values):
+        """Update empty sorted key-value list from items in sorted order.
+
+        Sublists are chopped to the load-factor without comparing keys.
+
+        :param list keys: keys in sorted order
+        :param list sort_keys: comparison keys of `keys`
+        :param list values: value for each key
+
+        """
+        _load = self._load
+        starts = range(0, len(keys), _load)
+        self._lists.extend(keys[idx : (idx + _load)] for idx in starts)
+        self._keys.extend(sort_keys[idx : (idx + _load)] for idx in starts)
+        self._values.extend(values[idx : (idx + _load)] for idx in starts)
+        self._maxes.extend(sublist[-1] for sublist in self._keys)
+        self._len = len(keys)
+        del self._index[:]
+
+        if self._auto:
+            self._adapt(len(keys))
+
+    def snapshot(self):
+        """Return a copy-on-write snapshot of the sorted key-value list.
+
+        Value sublists are shared along with key sublists. See
+        :func:`SortedList.snapshot` for details.
+
+        Runtime complexity: `O(n/m)` where `m` is the load-factor
+
+        :return: new sorted key-value list
+
+        """
+        result = SortedKeyList.snapshot(self)
+        result._values = self._values[:]
+        shared = set(map(id, self._values))
+        self._shared.update(shared)
+        result._shared.update(shared)
+        return result
+
+    def _unshare_values(self, pos):
+        """Copy value sublist at `pos` when it is shared with a snapshot.
+
+        Key sublists are copied by ``SortedList._unshare``.
+
+        :param int pos: lists index
+
+        """
+        sublist = self._values[pos]
+
+        if id(sublist) in self._shared:
+            self._shared.remove(id(sublist))
+            self._values[pos] = sublist[:]
+
+    def _expand(self, pos):
+        """Split sublists with length greater than double the load-factor.
+
+        Values are split first at the same position. See
+        ``SortedKeyList._expand`` for details.
+
+        """
+        _values = self._values
+
+        if len(_values[pos]) > (self._load << 1):
+            if self._shared:
+                self._unshare_values(pos)
+
+            values_pos = _values[pos]
+            _values.insert(pos + 1, values_pos[self._load :])
+            del values_pos[self._load :]
+
+        SortedKeyList._expand(self, pos)
+
+    def _delete(self, pos, idx):
+        """Delete key and value at the given `(pos, idx)`.
+
+        Values are deleted and merged first at the same positions. See
+        ``SortedKeyList._delete`` for details.
+
+        :param int pos: lists index
+        :param int idx: sublist index
+
+        """
+        _values = self._values
+
+        if self._shared:
+            self._unshare_values(pos)
+
+        values_pos = _values[pos]
+        del values_pos[idx]
+
+        if len(values_pos) <= (self._load >> 1) and len(_values) > 1:
+            prev = pos - 1 if pos else 0
+
+            if self._shared:
+                self._unshare_values(prev)
+
+            _values[prev].extend(_values[prev + 1])
+            del _values[prev + 1]
+        elif not values_pos:
+            del _values[pos]
+
+        SortedKeyList._delete(self, pos, idx)
+
+    def _trim(self, pos, start, stop):
+        """Delete keys and values from `start` to `stop` of sublists at `pos`.
+
+        See ``SortedList._trim`` for details.
+
+        """
+        if self._shared:
+            self._unshare_values(pos)
+
+        del self._values[pos][start:stop]
+        SortedKeyList._trim(self, pos, start, stop)
+
+    def _delete_range(self, min_pos, min_idx, max_pos, max_idx):
+        """Delete keys and values between two index pairs.
+
+        Values are deleted and re-chunked first using the same sublist
+        boundaries. See ``SortedKeyList._delete_range`` for details.
+
+        :param int min_pos: lists index of first value to delete
+        :param int min_idx: sublist index of first value to delete
+        :param int max_pos: lists index of value after last value to delete
+        :param int max_idx: sublist index of value after last value to delete
+
+        """
+        if min_pos > max_pos or (min_pos == max_pos and min_idx >= max_idx):
+            return
+
+        _values = self._values
+        _load = self._load
+        start = min_pos
+        stop = max_pos + 1
+        values = _values[min_pos][:min_idx] + _values[max_pos][max_idx:]
+
+        if len(values) < (_load >> 1):
+            if start:
+                start -= 1
+                values = _values[start] + values
+            elif stop < len(_values):
+                values += _values[stop]
+                stop += 1
+
+        if len(values) > (_load << 1):
+            starts = list(range(0, len(values), _load))
+
+            if len(values) - starts[-1] < (_load >> 1):
+                del starts[-1]
+
+            stops = starts[1:] + [len(values)]
+            chunks = [values[idx:end] for idx, end in zip(starts, stops)]
+        elif values:
+            chunks = [values]
+        else:
+            chunks = []
+
+        _values[start:stop] = chunks
+        SortedKeyList._delete_range(self, min_pos, min_idx, max_pos, max_idx)
+
+    def _delete_marked(self, marks, names=None):
+        """Delete keys and values at marked positions in a single pass.
+
+        Value sublists are compacted and combined along with key sublists.
+        See ``SortedList._delete_marked`` for details.
+
+        :param dict marks: mapping of lists index to list of sublist indexes
+        :param tuple names: names of lists of sublists to change (optional)
+
+        """
+        if names is None:
+            names = self._SUBLISTS + ('_values',)
+
+        SortedKeyList._delete_marked(self, marks, names)
+
+    def item(self, index):
+        """Return ``(key, value)`` pair at `index` in sorted key-value list.
+
+        Runtime complexity: `O(log(n))`
+
+        :param int index: index of item
+        :return: key and value pair
+        :raises IndexError: if `index` out of range
+
+        """
+        pos, idx = self._pos(index)
+        return self._lists[pos][idx], self._values[pos][idx]
+
+    def value(self, index):
+        """Return value at `index` in sorted key-value list.
+
+        Supports slicing.
+
+        Runtime complexity: `O(log(n))`
+
+        :param index: integer or slice for indexing
+        :return: value or list of values
+        :raises IndexError: if index out of range
+
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+
+            if step == 1:
+                loc = self._islice_loc(start, stop)
+
+                if loc is None:
+                    return []
+
+                return list(self._islice_values(*loc, False))
+
+            return [self.value(index) for index in range(start, stop, step)]
+
+        pos, idx = self._pos(index)
+        return self._values[pos][idx]
+
+    def _islice_values(self, min_pos, min_idx, max_pos, max_idx, reverse):
+        """Return an iterator that slices values using two index pairs.
+
+        See ``SortedList._islice`` for details.
+
+        """
+        _values = self._values
+
+        if min_pos > max_pos or (min_pos == max_pos and min_idx >= max_idx):
+            return iter(())
+
+        if min_pos == max_pos:
+            sublists = [_values[min_pos][min_idx:max_idx]]
+        else:
+            sublists = _values[min_pos:max_pos]
+            sublists[0] = sublists[0][min_idx:]
+            sublists.append(_values[max_pos][:max_idx])
+
+        if reverse:
+            return chain.from_iterable(map(reversed, reversed(sublists)))
+
+        return chain.from_iterable(sublists)
+
+    def copy(self):
+        """Return a shallow copy of the sorted key-value list.
+
+        Runtime complexity: `O(n)`
+
+        :return: new sorted key-value list
+
+        """
+        keys = reduce(iadd, self._lists, [])
+        values = reduce(iadd, self._values, [])
+        result = self.__class__(key=self._key)
+        result._update_sorted_items(keys, self._sorted_keys(), values)
+        return result
+
+    __copy__ = copy
+
+    def _check(self):
+        """Check invariants of sorted key-value list.
+
+        Runtime complexity: `O(n)`
+
+        """
+        SortedKeyList._check(self)
+        assert len(self._values) == len(self._lists)
+
+        for values, keys in zip(self._values, self._lists):
+            assert len(values) == len(keys)
+
+
 def _view_delitem(self, index):
     """Remove item at `index` from sorted dict.
 
@@ -682,15 +1809,7 @@ class SortedItemsView(ItemsView, Sequence):
         :raises IndexError: if index out of range
 
         """
-        _mapping = self._mapping
-        _mapping_list = _mapping._list
-
-        if isinstance(index, slice):
-            keys = _mapping_list[index]
-            return [(key, _mapping[key]) for key in keys]
-
-        key = _mapping_list[index]
-        return key, _mapping[key]
+        return self._mapping._items_at(index)
 
     __delitem__ = _view_delitem
 
@@ -733,14 +1852,6 @@ class SortedValuesView(ValuesView, Sequence):
         :raises IndexError: if index out of range
 
         """
-        _mapping = self._mapping
-        _mapping_list = _mapping._list
-
-        if isinstance(index, slice):
-            keys = _mapping_list[index]
-            return [_mapping[key] for key in keys]
-
-        key = _mapping_list[index]
-        return _mapping[key]
+        return self._mapping._values_at(index)
 
     __delitem__ = _view_delitem
@@ -11,21 +11,95 @@ Sorted list implementations:
 
 * :class:`SortedList`
 * :class:`SortedKeyList`
+* :class:`SortedAggregateList`
+* :class:`SortedArrayList`
 
 """
 # pylint: disable=too-many-lines
 
+import pickle
 import sys
 import traceback
+from array import array
 from bisect import bisect_left, bisect_right, insort
 from collections.abc import MutableSequence, Sequence
 from functools import reduce
-from itertools import chain, repeat, starmap
-from math import log
+from itertools import chain, islice, starmap
 from operator import add, eq, ge, gt, iadd, le, lt, ne
 from reprlib import recursive_repr
 from textwrap import dedent
 
+DUMP_VERSION = 1
+
+
+def _pack_values(values):
+    """Return `values` as a typed array when possible.
+
+    Lists of only ints that fit in 64 bits are packed in an array of typecode
+    ``'q'`` and lists of only floats in an array of typecode ``'d'``. Other
+    values and arrays are returned unchanged.
+
+    """
+    if isinstance(values, array):
+        return values
+
+    types = set(map(type, values))
+
+    if types == {int}:
+        try:
+            return array('q', values)
+        except OverflowError:
+            return values
+
+    if types == {float}:
+        return array('d', values)
+
+    return values
+
+
+def _dump_payload(fp, kind, args, sorted_list, values):
+    """Write payload of `kind` to binary file object `fp`.
+
+    The payload records the format version, the type and arguments needed to
+    create an empty instance, the load-factor and mode of `sorted_list`, and
+    `values` in sorted order.
+
+    """
+    payload = (
+        DUMP_VERSION,
+        kind,
+        args,
+        sorted_list._load,
+        sorted_list._auto,
+        _pack_values(values),
+    )
+    pickle.dump(payload, fp, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _load_payload(fp, cls):
+    """Read payload of `cls` written by `dump` from binary file object `fp`.
+
+    :raises ValueError: if the payload version is not supported
+    :raises TypeError: if the payload type is not a subtype of `cls`
+
+    """
+    payload = pickle.load(fp)
+
+    if not isinstance(payload, tuple) or payload[0] != DUMP_VERSION:
+        raise ValueError('unsupported dump format')
+
+    kind = payload[1]
+
+    if not (isinstance(kind, type) and issubclass(kind, cls)):
+        raise TypeError(f'dump contains {kind!r} not {cls.__name__}')
+
+    return payload[1:]
+
+
+def _spread(start, width, count):
+    "Return `count` slots spread evenly over `width` slots from `start`."
+    return [start + (((num << 1) + 1) * width) // (count << 1) for num in range(count)]
+
 
 class SortedList(MutableSequence):
     """Sorted list is a sorted mutable sequence.
@@ -48,14 +122,22 @@ class SortedList(MutableSequence):
 
     * :func:`SortedList.clear`
     * :func:`SortedList.discard`
+    * :func:`SortedList.discard_range`
+    * :func:`SortedList.discard_many`
     * :func:`SortedList.remove`
+    * :func:`SortedList.remove_many`
     * :func:`SortedList.pop`
+    * :func:`SortedList.pop_many`
+    * :func:`SortedList.popleft`
+    * :func:`SortedList.popright`
     * :func:`SortedList.__delitem__`
 
     Methods for looking up values:
 
     * :func:`SortedList.bisect_left`
     * :func:`SortedList.bisect_right`
+    * :func:`SortedList.bisect_left_many`
+    * :func:`SortedList.bisect_right_many`
     * :func:`SortedList.count`
     * :func:`SortedList.index`
     * :func:`SortedList.__contains__`
@@ -71,6 +153,11 @@ class SortedList(MutableSequence):
     Methods for miscellany:
 
     * :func:`SortedList.copy`
+    * :func:`SortedList.snapshot`
+    * :func:`SortedList.from_numpy`
+    * :func:`SortedList.to_numpy`
+    * :func:`SortedList.dump`
+    * :func:`SortedList.load`
     * :func:`SortedList.__len__`
     * :func:`SortedList.__repr__`
     * :func:`SortedList._check`
@@ -85,6 +172,13 @@ class SortedList(MutableSequence):
     """
 
     DEFAULT_LOAD_FACTOR = 1000
+    MIN_AUTO_LOAD_FACTOR = 16
+
+    # Names of the lists of sublists shared by snapshots and the identities of
+    # shared sublists. See ``SortedList.snapshot``.
+
+    _SUBLISTS = ('_lists',)
+    _shared = frozenset()
 
     def __init__(self, iterable=None, key=None):
         """Initialize sorted list instance.
@@ -107,10 +201,15 @@ class SortedList(MutableSequence):
         assert key is None
         self._len = 0
         self._load = self.DEFAULT_LOAD_FACTOR
+        self._auto = False
+        self._cursor = None
         self._lists = []
         self._maxes = []
         self._index = []
         self._offset = 0
+        self._slots = []
+        self._positions = []
+        self._reads = 0
 
         if iterable is not None:
             self._update(iterable)
@@ -163,18 +262,126 @@ class SortedList(MutableSequence):
         your usage. It's best to leave the load factor at the default until you
         start benchmarking.
 
+        When `load` is ``'auto'`` the load-factor restarts at
+        ``MIN_AUTO_LOAD_FACTOR``, is grown to the cube root of the length of
+        the list and adjusted as the list grows and shrinks. Sublists are
+        re-chunked incrementally rather than all at once. See
+        ``SortedList._adapt`` for details.
+
         See :doc:`implementation` and :doc:`performance-scale` for more
         information.
 
         Runtime complexity: `O(n)`
 
-        :param int load: load-factor for sorted list sublists
+        :param load: load-factor for sorted list sublists or ``'auto'``
 
         """
+        if load == 'auto':
+            self._auto = True
+
+            if self._load != self.MIN_AUTO_LOAD_FACTOR:
+                self._load = self.MIN_AUTO_LOAD_FACTOR
+                self._cursor = 0
+
+            self._adapt(0)
+            return
+
         values = reduce(iadd, self._lists, [])
+        keys = self._sorted_keys()
         self._clear()
+        self._auto = False
         self._load = load
-        self._update(values)
+        self._update_sorted(values, keys)
+
+    def _sorted_keys(self):
+        """Return list of keys of values in sorted order or none.
+
+        Sorted lists have no keys. Used to reuse keys when re-building.
+
+        """
+        return None
+
+    def _adapt(self, size):
+        """Adapt the load-factor to the length of the sorted list.
+
+        Used when the load-factor is ``'auto'``. The load-factor starts at
+        ``MIN_AUTO_LOAD_FACTOR`` and doubles while its cube is less than the
+        length of the list, so it tracks the cube root of the length. It
+        halves, but never below the minimum, once the list shrinks to half
+        the cube of the halved load-factor. The gap between the thresholds
+        avoids flapping between load-factors.
+
+        When the load-factor changes, re-chunking starts from the first
+        sublist. Each call then re-chunks a window of at least `size` values
+        at the cursor. See ``SortedList._rechunk``. Callers pass a `size`
+        proportional to the work that triggered the call, so re-chunking is
+        amortized over the operations that change the list.
+
+        Runtime complexity: `O(size + m)` where `m` is the number of sublists
+        -- approximate.
+
+        :param int size: minimum count of values to re-chunk
+
+        """
+        minimum = self.MIN_AUTO_LOAD_FACTOR
+        _load = self._load
+        _len = self._len
+        load = _load
+
+        while load**3 < _len:
+            load <<= 1
+
+        while load > minimum and ((load >> 1) ** 3 >> 1) > _len:
+            load >>= 1
+
+        if load != _load:
+            self._load = load
+            self._cursor = 0
+
+        if self._cursor is not None:
+            self._rechunk(size)
+
+    def _rechunk(self, size):
+        """Re-chunk sublists at the cursor to the load-factor.
+
+        Sublists from the cursor are combined until they hold at least `size`
+        values and at least the load-factor. The values are then chopped into
+        sublists of the load-factor and a short tail is folded into the last
+        sublist. The cursor advances past the new sublists and is cleared
+        after the last sublist.
+
+        Between calls, sublists after the cursor may violate the load-factor
+        bounds. Splits and merges before the cursor shift it accordingly. See
+        ``SortedList._expand`` and ``SortedList._delete``.
+
+        :param int size: minimum count of values to re-chunk
+
+        """
+        _lists = self._lists
+        _load = self._load
+        pos = self._cursor
+        len_lists = len(_lists)
+        stop = pos
+        total = 0
+
+        while stop < len_lists and (total < size or total < _load):
+            total += len(_lists[stop])
+            stop += 1
+
+        if pos < stop:
+            values = reduce(iadd, _lists[pos:stop], [])
+            chunks = [values[idx : (idx + _load)] for idx in range(0, total, _load)]
+
+            if len(chunks) > 1 and len(chunks[-1]) < (_load >> 1):
+                tail = chunks.pop()
+                chunks[-1] += tail
+
+            _lists[pos:stop] = chunks
+            self._maxes[pos:stop] = [chunk[-1] for chunk in chunks]
+            self._repair_index(pos, stop - pos)
+            pos += len(chunks)
+
+        self._cursor = pos if pos < len(_lists) else None
 
     def clear(self):
         """Remove all values from sorted list.
@@ -183,6 +390,7 @@ class SortedList(MutableSequence):
 
         """
         self._len = 0
+        self._cursor = None
         del self._lists[:]
         del self._maxes[:]
         del self._index[:]
@@ -211,6 +419,9 @@ class SortedList(MutableSequence):
         if _maxes:
             pos = bisect_right(_maxes, value)
 
+            if self._shared:
+                self._unshare(min(pos, len(_maxes) - 1))
+
             if pos == len(_maxes):
                 pos -= 1
                 _lists[pos].append(value)
@@ -233,14 +444,19 @@ class SortedList(MutableSequence):
         leaf node to the root. For an example traversal see
         ``SortedList._loc``.
 
+        Repairs the index when the sublist is split. See
+        ``SortedList._repair_index``.
+
         """
         _load = self._load
         _lists = self._lists
         _index = self._index
 
         if len(_lists[pos]) > (_load << 1):
-            _maxes = self._maxes
+            if self._shared:
+                self._unshare(pos)
 
+            _maxes = self._maxes
             _lists_pos = _lists[pos]
             half = _lists_pos[_load:]
             del _lists_pos[_load:]
@@ -249,10 +465,16 @@ class SortedList(MutableSequence):
             _lists.insert(pos + 1, half)
             _maxes.insert(pos + 1, half[-1])
 
-            del _index[:]
+            self._repair_index(pos)
+
+            if self._auto:
+                if self._cursor is not None and pos < self._cursor:
+                    self._cursor += 1
+
+                self._adapt(_load << 1)
         else:
             if _index:
-                child = self._offset + pos
+                child = self._offset + self._slots[pos]
                 while child:
                     _index[child] += 1
                     child = (child - 1) >> 1
@@ -270,32 +492,107 @@ class SortedList(MutableSequence):
 
         :param iterable: iterable of values to add
 
+        """
+        values = sorted(iterable)
+        self._update_sorted(values)
+
+    _update = update
+
+    def _update_sorted(self, values, keys=None):
+        """Update sorted list by adding all `values` in sorted order.
+
+        Few values are added one at a time and many values are merged. Used by
+        :func:`SortedList.update` and by sorted sets whose values are already
+        in sorted order. Optional `keys` are ignored by sorted lists. See
+        ``SortedKeyList._update_sorted``.
+
+        :param list values: values in sorted order
+        :param list keys: keys of `values` (optional)
+
+        """
+        if self._maxes and len(values) * 4 < self._len:
+            _add = self.add
+            for val in values:
+                _add(val)
+        else:
+            self._merge(values)
+
+            if self._cursor is not None:
+                self._cursor = 0
+
+        if self._auto:
+            self._adapt(len(values))
+
+    def _merge(self, values):
+        """Merge sorted `values` into the sorted list.
+
+        Each sublist is extended by the run of `values` that belongs to it and
+        then sorted. Sorting two concatenated runs is a linear-time merge so
+        the sorted list is never re-sorted as a whole and sublists that receive
+        no values are left untouched. Sublists longer than double the
+        load-factor are split.
+
+        Runtime complexity: `O(n + k)` -- approximate.
+
+        :param list values: values in sorted order
+
         """
         _lists = self._lists
         _maxes = self._maxes
-        values = sorted(iterable)
+        _load = self._load
 
-        if _maxes:
-            if len(values) * 4 >= self._len:
-                _lists.append(values)
-                values = reduce(iadd, _lists, [])
-                values.sort()
-                self._clear()
+        if not _maxes:
+            _lists.extend(
+                values[pos : (pos + _load)] for pos in range(0, len(values), _load)
+            )
+            _maxes.extend(sublist[-1] for sublist in _lists)
+            self._len = len(values)
+            del self._index[:]
+            return
+
+        if not values:
+            return
+
+        lists = []
+        start = 0
+        last = len(_lists) - 1
+        double = _load << 1
+        half = _load >> 1
+
+        for pos, sublist in enumerate(_lists):
+            if pos == last:
+                stop = len(values)
             else:
-                _add = self.add
-                for val in values:
-                    _add(val)
-                return
+                stop = bisect_left(values, _maxes[pos], start)
 
-        _load = self._load
-        _lists.extend(
-            values[pos : (pos + _load)] for pos in range(0, len(values), _load)
-        )
-        _maxes.extend(sublist[-1] for sublist in _lists)
-        self._len = len(values)
-        del self._index[:]
+            if start < stop:
+                if self._shared:
+                    self._unshare(pos)
+                    sublist = _lists[pos]
 
-    _update = update
+                sublist.extend(values[start:stop])
+                sublist.sort()
+                start = stop
+
+                if len(sublist) > double:
+                    chunks = [
+                        sublist[idx : (idx + _load)]
+                        for idx in range(0, len(sublist), _load)
+                    ]
+
+                    if len(chunks[-1]) < half:
+                        tail = chunks.pop()
+                        chunks[-1] += tail
+
+                    lists.extend(chunks)
+                    continue
+
+            lists.append(sublist)
+
+        _lists[:] = lists
+        _maxes[:] = [sublist[-1] for sublist in lists]
+        self._len += len(values)
+        del self._index[:]
 
     def __contains__(self, value):
         """Return true if `value` is an element of the sorted list.
@@ -397,10 +694,98 @@ class SortedList(MutableSequence):
         else:
             raise ValueError(f'{value!r} not in list')
 
+    def discard_range(self, minimum=None, maximum=None, inclusive=(True, True)):
+        """Remove values between `minimum` and `maximum`.
+
+        Both `minimum` and `maximum` default to `None` which is automatically
+        inclusive of the beginning and end of the sorted list. See
+        :func:`SortedList.irange` for details of arguments.
+
+        Both ends of the range are located once and the values between are
+        removed in bulk: the sublists at either end are trimmed, whole
+        sublists between are dropped and the index is repaired once.
+
+        Runtime complexity: `O(log(n) + k/m + m)` where `m` is the
+        load-factor -- approximate.
+
+        >>> sl = SortedList([1, 2, 3, 4, 5])
+        >>> sl.discard_range(2, 4)
+        >>> sl
+        SortedList([1, 5])
+
+        :param minimum: minimum value of values to remove
+        :param maximum: maximum value of values to remove
+        :param inclusive: pair of booleans
+
+        """
+        loc = self._irange_loc(minimum, maximum, inclusive)
+
+        if loc is not None:
+            self._delete_range(*loc)
+
+    def discard_many(self, iterable):
+        """Remove values in `iterable` from sorted list if they are members.
+
+        Each value in `iterable` removes at most one matching value. Values
+        that are not members are ignored.
+
+        The values are sorted once and merged against the sublists in a
+        single sweep. Each touched sublist is compacted once and the maxes
+        and index are repaired once at the end.
+
+        Runtime complexity: `O(k*log(k) + k*log(m) + m)` where `m` is the
+        load-factor -- approximate.
+
+        >>> sl = SortedList([1, 2, 2, 3, 4, 5])
+        >>> sl.discard_many([5, 2, 0])
+        >>> sl
+        SortedList([1, 2, 3, 4])
+
+        :param iterable: iterable of values to discard
+
+        """
+        marks, _ = self._mark_many(iterable)
+
+        if marks:
+            self._delete_marked(marks)
+
+    def remove_many(self, iterable):
+        """Remove values in `iterable` from sorted list; values must be
+        members.
+
+        Each value in `iterable` removes one matching value. If any value is
+        not a member, raise ValueError and remove nothing. See
+        :func:`SortedList.discard_many` for details.
+
+        Runtime complexity: `O(k*log(k) + k*log(m) + m)` where `m` is the
+        load-factor -- approximate.
+
+        >>> sl = SortedList([1, 2, 3, 4, 5])
+        >>> sl.remove_many([4, 2])
+        >>> sl
+        SortedList([1, 3, 5])
+        >>> sl.remove_many([1, 2])
+        Traceback (most recent call last):
+          ...
+        ValueError: 2 not in list
+
+        :param iterable: iterable of values to remove
+        :raises ValueError: if a value is not in sorted list
+
+        """
+        marks, missing = self._mark_many(iterable)
+
+        if missing:
+            raise ValueError(f'{missing[0]!r} not in list')
+
+        if marks:
+            self._delete_marked(marks)
+
     def _delete(self, pos, idx):
         """Delete value at the given `(pos, idx)`.
 
-        Combines lists that are less than half the load level.
+        Combines lists that are less than half the load level and repairs the
+        index. See ``SortedList._repair_index``.
 
         Updates the index when the sublist length is more than half the load
         level. This requires decrementing the nodes in a traversal from the
@@ -415,6 +800,9 @@ class SortedList(MutableSequence):
         _maxes = self._maxes
         _index = self._index
 
+        if self._shared:
+            self._unshare(pos)
+
         _lists_pos = _lists[pos]
 
         del _lists_pos[idx]
@@ -426,7 +814,7 @@ class SortedList(MutableSequence):
             _maxes[pos] = _lists_pos[-1]
 
             if _index:
-                child = self._offset + pos
+                child = self._offset + self._slots[pos]
                 while child > 0:
                     _index[child] -= 1
                     child = (child - 1) >> 1
@@ -436,14 +824,26 @@ class SortedList(MutableSequence):
                 pos += 1
 
             prev = pos - 1
+
+            if self._shared:
+                self._unshare(prev)
+
             _lists[prev].extend(_lists[pos])
             _maxes[prev] = _lists[prev][-1]
 
             del _lists[pos]
             del _maxes[pos]
-            del _index[:]
 
-            self._expand(prev)
+            self._repair_index(prev, 2)
+
+            if self._cursor is not None and pos <= self._cursor:
+                self._cursor -= 1
+
+            if len(_lists[prev]) > (self._load << 1):
+                self._expand(prev)
+
+            if self._auto:
+                self._adapt(self._load << 1)
         elif len_lists_pos:
             _maxes[pos] = _lists_pos[-1]
         else:
@@ -451,6 +851,230 @@ class SortedList(MutableSequence):
             del _maxes[pos]
             del _index[:]
 
+    def _trim(self, pos, start, stop):
+        """Delete values from `start` to `stop` of the sublist at `pos`.
+
+        The sublist must keep more than half the load-factor so it is changed
+        in place and never combined. Updates the maxes and decrements the
+        index like ``SortedList._delete``.
+
+        :param int pos: lists index
+        :param int start: sublist index of first value to delete
+        :param int stop: sublist index of value after last value to delete
+
+        """
+        if self._shared:
+            self._unshare(pos)
+
+        _lists_pos = self._lists[pos]
+        del _lists_pos[start:stop]
+        self._maxes[pos] = _lists_pos[-1]
+        count = stop - start
+        self._len -= count
+        _index = self._index
+
+        if _index:
+            child = self._offset + self._slots[pos]
+            while child > 0:
+                _index[child] -= count
+                child = (child - 1) >> 1
+            _index[0] -= count
+
+    def _delete_range(self, min_pos, min_idx, max_pos, max_idx):
+        """Delete values between two index pairs.
+
+        The index pairs are (min_pos, min_idx) and (max_pos, max_idx), the
+        first inclusive and the latter exclusive. See ``SortedList._islice``.
+
+        Sublists between the pairs are deleted in bulk. The remains of the
+        sublists at either end are combined, merged with a neighbor when less
+        than half the load-factor and re-chunked when more than double the
+        load-factor. Sublists are replaced rather than changed in place. The
+        maxes and index are repaired once. See ``SortedList._repair_index``.
+
+        Runtime complexity: `O(k + m)` where `m` is the number of sublists
+        -- approximate.
+
+        :param int min_pos: lists index of first value to delete
+        :param int min_idx: sublist index of first value to delete
+        :param int max_pos: lists index of value after last value to delete
+        :param int max_idx: sublist index of value after last value to delete
+
+        """
+        if min_pos > max_pos or (min_pos == max_pos and min_idx >= max_idx):
+            return
+
+        _lists = self._lists
+        _maxes = self._maxes
+        _load = self._load
+        start = min_pos
+        stop = max_pos + 1
+        combined = _lists[min_pos][:min_idx] + _lists[max_pos][max_idx:]
+        count = sum(map(len, _lists[start:stop])) - len(combined)
+
+        if len(combined) < (_load >> 1):
+            if start:
+                start -= 1
+                combined = _lists[start] + combined
+            elif stop < len(_lists):
+                combined += _lists[stop]
+                stop += 1
+
+        if len(combined) > (_load << 1):
+            chunks = [
+                combined[idx : (idx + _load)] for idx in range(0, len(combined), _load)
+            ]
+
+            if len(chunks[-1]) < (_load >> 1):
+                tail = chunks.pop()
+                chunks[-1] += tail
+        elif combined:
+            chunks = [combined]
+        else:
+            chunks = []
+
+        _lists[start:stop] = chunks
+        del _maxes[start:stop]
+
+        for offset, chunk in enumerate(chunks):
+            _maxes.insert(start + offset, chunk[-1])
+
+        self._len -= count
+        self._repair_index(start, stop - start)
+
+        cursor = self._cursor
+
+        if cursor is not None and cursor >= start:
+            cursor = start + len(chunks) + max(0, cursor - stop)
+            self._cursor = cursor if cursor < len(_lists) else None
+
+        if self._auto:
+            self._adapt(count)
+
+    def _mark_many(self, iterable):
+        """Locate values in `iterable` in a single sweep of the sublists.
+
+        The values are sorted first. The sweep keeps a position `(pos, idx)`
+        that only moves forward. Each value bisects the maxes from `pos` and
+        the sublist from `idx`. A matching value is marked and the position
+        steps past it so equal values mark successive occurrences.
+
+        :param iterable: iterable of values
+        :return: pair of dict mapping lists index to list of sublist indexes
+            and list of values not found in sorted order
+
+        """
+        values = sorted(iterable)
+        _lists = self._lists
+        _maxes = self._maxes
+        len_maxes = len(_maxes)
+        marks = {}
+        missing = []
+        pos = idx = 0
+
+        for value in values:
+            if pos < len_maxes and _maxes[pos] < value:
+                pos = bisect_left(_maxes, value, pos)
+                idx = 0
+
+            if pos == len_maxes:
+                missing.append(value)
+                continue
+
+            sublist = _lists[pos]
+            idx = bisect_left(sublist, value, idx)
+
+            if sublist[idx] == value:
+                marks.setdefault(pos, []).append(idx)
+                idx += 1
+
+                if idx == len(sublist):
+                    pos += 1
+                    idx = 0
+            else:
+                missing.append(value)
+
+        return marks, missing
+
+    def _delete_marked(self, marks, names=None):
+        """Delete values at marked positions in a single pass.
+
+        Each marked sublist is replaced by a compacted copy built from slices.
+        Empty sublists are then dropped and sublists less than half the
+        load-factor are combined with the next sublist, splitting again when
+        more than double the load-factor. Sublists after the cursor are only
+        compacted. The maxes and index are repaired once. See
+        ``SortedList._repair_index``.
+
+        Runtime complexity: `O(k + m)` where `m` is the number of sublists
+        -- approximate.
+
+        :param dict marks: mapping of lists index to list of sublist indexes
+        :param tuple names: names of lists of sublists to change (optional)
+
+        """
+        if names is None:
+            names = self._SUBLISTS
+
+        _load = self._load
+        half = _load >> 1
+        double = _load << 1
+        len_lists = len(self._lists)
+        cursor = len_lists if self._cursor is None else self._cursor
+        marks = sorted((pos, sorted(indices)) for pos, indices in marks.items())
+        count = sum(len(indices) for _, indices in marks)
+
+        for name in names:
+            sublists = getattr(self, name)
+
+            for pos, indices in marks:
+                sublist = sublists[pos]
+                kept = sublist[:0]
+                start = 0
+
+                for idx in indices:
+                    kept += sublist[start:idx]
+                    start = idx + 1
+
+                kept += sublist[start:]
+                sublists[pos] = kept
+
+            chunks = []
+            stop = None
+
+            for pos, sublist in enumerate(sublists):
+                if pos == cursor:
+                    stop = len(chunks)
+
+                    if chunks and len(chunks[-1]) < half:
+                        stop -= 1
+
+                if not sublist:
+                    continue
+
+                if pos < cursor and chunks and len(chunks[-1]) < half:
+                    sublist = chunks.pop() + sublist
+
+                    if len(sublist) > double:
+                        chunks.append(sublist[:_load])
+                        sublist = sublist[_load:]
+
+                chunks.append(sublist)
+
+            sublists[:] = chunks
+
+        _maxes = self._maxes
+        del _maxes[:]
+        _maxes.extend(sublist[-1] for sublist in getattr(self, self._SUBLISTS[-1]))
+        self._len -= count
+        self._repair_index(0, len_lists)
+
+        if self._cursor is not None:
+            self._cursor = stop if stop < len(self._lists) else None
+
+        if self._auto:
+            self._adapt(count)
+
     def _loc(self, pos, idx):
         """Convert an index pair (lists index, sublist index) into a single
         index number that corresponds to the position of the value in the
@@ -472,27 +1096,33 @@ class SortedList(MutableSequence):
 
         For example, using the index from ``SortedList._build_index``::
 
-            _index = 14 5 9 3 2 4 5
-            _offset = 3
+            _index = 14 5 9 3 2 4 5 0 3 0 2 0 4 0 5
+            _offset = 7
+            _slots = 1 3 5 7
 
         Tree::
 
-                 14
-              5      9
-            3   2  4   5
+                        14
+                  5            9
+               3     2      4     5
+              0 3   0 2    0 4   0 5
 
         Converting an index pair (2, 3) into a single index involves iterating
         like so:
 
-        1. Starting at the leaf node: offset + alpha = 3 + 2 = 5. We identify
-           the node as a left-child node. At such nodes, we simply traverse to
-           the parent.
+        1. Starting at the leaf node: offset + slot = 7 + 5 = 12. We identify
+           the node as a right-child node and accumulate the left-child, an
+           empty slot, in our total. Total is now 0 and we traverse to the
+           parent at position 5.
 
-        2. At node 9, position 2, we recognize the node as a right-child node
+        2. At node 4, position 5, we identify the node as a left-child node.
+           At such nodes, we simply traverse to the parent.
+
+        3. At node 9, position 2, we recognize the node as a right-child node
            and accumulate the left-child in our total. Total is now 5 and we
            traverse to the parent at position 0.
 
-        3. Iteration ends at the root.
+        4. Iteration ends at the root.
 
         The index is then the sum of the total and sublist index: 5 + 3 = 8.
 
@@ -511,9 +1141,9 @@ class SortedList(MutableSequence):
 
         total = 0
 
-        # Increment pos to point in the index to len(self._lists[pos]).
+        # Point pos in the index to the leaf for len(self._lists[pos]).
 
-        pos += self._offset
+        pos = self._offset + self._slots[pos]
 
         # Iterate until reaching the root of the index tree at pos = 0.
 
@@ -544,22 +1174,30 @@ class SortedList(MutableSequence):
 
         When the index is less than the left-child, traversal moves to the
         left sub-tree. Otherwise, the index is decremented by the left-child
-        and traversal moves to the right sub-tree.
-
-        At a child node, the indexing pair is computed from the relative
-        position of the child node as compared with the offset and the remaining
-        index.
+        and traversal moves to the right sub-tree. Empty slots count zero so
+        traversal never ends at one.
+
+        At a leaf node, the slot is the position of the leaf node relative to
+        the offset. The lists index is looked up in the positions of slots and
+        the index in the sublist is the remaining index. After the index is
+        repaired, the positions are discarded and the lists index is found by
+        bisecting the slots instead. Once there have been more reads than
+        sublists since the last repair, the positions are rebuilt. A new list
+        of positions is assigned so concurrent readers never see it partly
+        built.
 
         For example, using the index from ``SortedList._build_index``::
 
-            _index = 14 5 9 3 2 4 5
-            _offset = 3
+            _index = 14 5 9 3 2 4 5 0 3 0 2 0 4 0 5
+            _offset = 7
+            _slots = 1 3 5 7
 
         Tree::
 
-                 14
-              5      9
-            3   2  4   5
+                        14
+                  5            9
+               3     2      4     5
+              0 3   0 2    0 4   0 5
 
         Indexing position 8 involves iterating like so:
 
@@ -571,12 +1209,16 @@ class SortedList(MutableSequence):
            node with value 4. Because the index is the less than the left-child
            node, we simply traverse to the left.
 
-        3. At node 4 with index 3, we recognize that we are at a leaf node and
+        3. At node 4 with index 3, the left-child is an empty slot so the
+           index is decremented by zero and traversal moves to the right.
+
+        4. At node 4, position 12, we recognize that we are at a leaf node and
            stop iterating.
 
-        4. To compute the sublist index, we subtract the offset from the index
-           of the leaf node: 5 - 3 = 2. To compute the index in the sublist, we
-           simply use the index remaining from iteration. In this case, 3.
+        5. To compute the slot, we subtract the offset from the index of the
+           leaf node: 12 - 7 = 5. The positions of slots, or bisecting the
+           slots for 5, give lists index 2. The index in the sublist is the
+           index remaining from iteration. In this case, 3.
 
         The final index pair from our example is (2, 3) which corresponds to
         index 8 in the sorted list.
@@ -621,13 +1263,37 @@ class SortedList(MutableSequence):
 
             child = (pos << 1) + 1
 
-        return (pos - self._offset, idx)
+        _positions = self._positions
+
+        if _positions:
+            return _positions[pos - self._offset], idx
+
+        _slots = self._slots
+        self._reads += 1
+
+        if self._reads > len(_slots):
+            self._positions = self._slot_positions()
+
+        return bisect_left(_slots, pos - self._offset), idx
+
+    def _slot_positions(self):
+        "Return list that maps slots to lists indexes and empty slots to zero."
+        positions = [0] * (self._offset + 1)
+
+        for pos, slot in enumerate(self._slots):
+            positions[slot] = pos
+
+        return positions
 
     def _build_index(self):
         """Build a positional index for indexing the sorted list.
 
         Indexes are represented as binary trees in a dense array notation
-        similar to a binary heap.
+        similar to a binary heap. The leaves of the tree are slots and each
+        sublist is assigned a slot. At least half the slots are left empty so
+        that sublists which are split or combined later are re-assigned slots
+        nearby without shifting the rest of the tree. See
+        ``SortedList._repair_index``.
 
         For example, given a lists representation storing integers::
 
@@ -636,94 +1302,226 @@ class SortedList(MutableSequence):
             2: [6, 7, 8, 9]
             3: [10, 11, 12, 13, 14]
 
-        The first transformation maps the sub-lists by their length. The
-        first row of the index is the length of the sub-lists::
+        The number of slots is the least power of two that is at least double
+        the number of sub-lists, here 8. The sub-lists are spread evenly over
+        the slots::
 
-            0: [3, 2, 4, 5]
+            _slots = [1, 3, 5, 7]
+
+        The first row of the index is the length of the sub-list in each slot
+        and zero for empty slots::
+
+            0: [0, 3, 0, 2, 0, 4, 0, 5]
 
         Each row after that is the sum of consecutive pairs of the previous
         row::
 
-            1: [5, 9]
-            2: [14]
+            1: [3, 2, 4, 5]
+            2: [5, 9]
+            3: [14]
 
         Finally, the index is built by concatenating these lists together::
 
-            _index = [14, 5, 9, 3, 2, 4, 5]
+            _index = [14, 5, 9, 3, 2, 4, 5, 0, 3, 0, 2, 0, 4, 0, 5]
 
         An offset storing the start of the first row is also stored::
 
-            _offset = 3
+            _offset = 7
 
         When built, the index can be used for efficient indexing into the list.
         See the comment and notes on ``SortedList._pos`` for details.
 
         """
-        row0 = list(map(len, self._lists))
-
-        if len(row0) == 1:
-            self._index[:] = row0
-            self._offset = 0
-            return
+        _lists = self._lists
+        len_lists = len(_lists)
+        size = 1
 
-        head = iter(row0)
-        tail = iter(head)
-        row1 = list(starmap(add, zip(head, tail)))
+        while size < (len_lists << 1):
+            size <<= 1
 
-        if len(row0) & 1:
-            row1.append(row0[-1])
+        _slots = self._slots
+        _slots[:] = _spread(0, size, len_lists)
+        row = [0] * size
 
-        if len(row1) == 1:
-            self._index[:] = row1 + row0
-            self._offset = 1
-            return
+        for slot, sublist in zip(_slots, _lists):
+            row[slot] = len(sublist)
 
-        size = 2 ** (int(log(len(row1) - 1, 2)) + 1)
-        row1.extend(repeat(0, size - len(row1)))
-        tree = [row0, row1]
+        tree = [row]
 
-        while len(tree[-1]) > 1:
-            head = iter(tree[-1])
-            tail = iter(head)
-            row = list(starmap(add, zip(head, tail)))
+        while len(row) > 1:
+            pairs = iter(row)
+            row = list(starmap(add, zip(pairs, pairs)))
             tree.append(row)
 
-        reduce(iadd, reversed(tree), self._index)
-        self._offset = size * 2 - 1
+        _index = self._index
+        del _index[:]
+        reduce(iadd, reversed(tree), _index)
+        self._offset = size - 1
+        self._positions = self._slot_positions()
 
-    def __delitem__(self, index):
-        """Remove value at `index` from sorted list.
+    def _repair_index(self, pos, count=1):
+        """Repair the positional index after sublists change at `pos`.
 
-        ``sl.__delitem__(index)`` <==> ``del sl[index]``
+        The `count` sublists from `pos` may have been split or combined into
+        more or fewer sublists. The changed sublists are re-assigned slots
+        spread over the empty slots between their neighbors. The leaf nodes
+        for those slots are replaced and only the branch nodes above them are
+        recomputed. See ``SortedList._update_index``.
 
-        Supports slicing.
+        For example, using the index from ``SortedList._build_index``, when the
+        sublist at position 1 is split in two, the slots between the
+        neighbors at slots 1 and 5 are re-assigned::
 
-        Runtime complexity: `O(log(n))` -- approximate.
+            _slots = 1 3 5 7  ->  1 2 4 5 7
 
-        >>> sl = SortedList('abcde')
-        >>> del sl[2]
-        >>> sl
-        SortedList(['a', 'b', 'd', 'e'])
-        >>> del sl[:2]
-        >>> sl
-        SortedList(['d', 'e'])
+        When the slots between the neighbors are too few, the slots of a
+        window of neighbors are re-assigned instead, like a packed-memory
+        array. The window is the smallest aligned run of slots that covers the
+        change and is sparse enough: its density may be at most one at the
+        leaves, falling to three quarters for the whole tree. Sparse windows
+        leave room for many later changes so re-assignment is amortized.
 
-        :param index: integer or slice for indexing
-        :raises IndexError: if index out of range
+        The index is discarded when the whole tree is too dense, when it has
+        more than eight slots per sublist or when there are fewer than two
+        sublists. Rebuilding the index resizes the tree.
 
-        """
-        if isinstance(index, slice):
-            start, stop, step = index.indices(self._len)
+        Runtime complexity: `O(count + log(m))` where `m` is the number of
+        sublists -- amortized.
+
+        :param int pos: lists index
+        :param int count: count of sublists that changed (default 1)
+
+        """
+        _index = self._index
+
+        if not _index:
+            return
+
+        _lists = self._lists
+        _slots = self._slots
+        len_lists = len(_lists)
+        size = self._offset + 1
+        self._positions = []
+        self._reads = 0
+
+        if len_lists < 2 or (len_lists << 3) < size:
+            del _index[:]
+            return
+
+        delta = len_lists - len(_slots)
+        stop = pos + count
+        start = _slots[pos - 1] + 1 if pos else 0
+        end = _slots[stop] if stop < len(_slots) else size
+
+        if end - start < count + delta:
+            # Find the smallest aligned window around the change that is
+            # sparse enough. The allowed density falls with the window level.
+
+            depth = self._offset.bit_length()
+            level = 0
+
+            while True:
+                level += 1
+                width = 1 << level
+
+                if width > size:
+                    del _index[:]
+                    return
+
+                lo = (start >> level) << level
+                hi = lo + width
+
+                if hi < end:
+                    continue
+
+                first = bisect_left(_slots, lo, 0, pos)
+                last = bisect_left(_slots, hi, stop)
+                total = last - first + delta
+
+                if (total * depth) << 2 <= width * ((depth << 2) - level):
+                    break
+
+            pos, stop, start, end = first, last, lo, hi
+
+        slots = _spread(start, end - start, stop - pos + delta)
+        leaves = [0] * (end - start)
+
+        for slot, sublist in zip(slots, islice(_lists, pos, stop + delta)):
+            leaves[slot - start] = len(sublist)
+
+        _slots[pos:stop] = slots
+        self._update_index(start, leaves)
+
+    def _update_index(self, start, leaves):
+        """Replace leaf nodes of the index from slot `start` with `leaves`.
+
+        The branch nodes above the leaf nodes are recomputed a row at a time
+        with slice assignment until a row has a single changed node. The path
+        from that node to the root is then recomputed node by node.
+
+        Runtime complexity: `O(k + log(m))` where `k` is the number of leaves
+        and `m` is the number of sublists -- approximate.
+
+        :param int start: first slot to replace
+        :param list leaves: lengths of sublists or zero for empty slots
+
+        """
+        _index = self._index
+        first = self._offset + start
+        last = first + len(leaves)
+        _index[first:last] = leaves
+
+        while first:
+            first = (first - 1) >> 1
+            last = ((last - 2) >> 1) + 1
+
+            if first + 1 == last:
+                break
+
+            children = _index[((first << 1) + 1) : ((last << 1) + 1)]
+            _index[first:last] = map(add, children[::2], children[1::2])
+        else:
+            return
+
+        while True:
+            child = (first << 1) + 1
+            _index[first] = _index[child] + _index[child + 1]
+
+            if not first:
+                return
+
+            first = (first - 1) >> 1
+
+    def __delitem__(self, index):
+        """Remove value at `index` from sorted list.
+
+        ``sl.__delitem__(index)`` <==> ``del sl[index]``
+
+        Supports slicing. Contiguous slices are deleted in bulk by
+        ``SortedList._delete_range``.
+
+        Runtime complexity: `O(log(n))` -- approximate.
+
+        >>> sl = SortedList('abcde')
+        >>> del sl[2]
+        >>> sl
+        SortedList(['a', 'b', 'd', 'e'])
+        >>> del sl[:2]
+        >>> sl
+        SortedList(['d', 'e'])
+
+        :param index: integer or slice for indexing
+        :raises IndexError: if index out of range
+
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
 
             if step == 1 and start < stop:
                 if start == 0 and stop == self._len:
                     return self._clear()
-                elif self._len <= 8 * (stop - start):
-                    values = self._getitem(slice(None, start))
-                    if stop < self._len:
-                        values += self._getitem(slice(stop, None))
-                    self._clear()
-                    return self._update(values)
+
+                return self._delete_range(*self._islice_loc(start, stop))
 
             indices = range(start, stop, step)
 
@@ -905,16 +1703,31 @@ class SortedList(MutableSequence):
         :param bool reverse: yield values in reverse order
         :return: iterator
 
+        """
+        loc = self._islice_loc(start, stop)
+
+        if loc is None:
+            return iter(())
+
+        return self._islice(*loc, reverse)
+
+    def _islice_loc(self, start, stop):
+        """Return index pairs of values from index `start` to `stop`.
+
+        Returns ``(min_pos, min_idx, max_pos, max_idx)`` where the first pair
+        is inclusive and the latter exclusive, or none when the slice is
+        empty. See :func:`SortedList.islice` for arguments.
+
         """
         _len = self._len
 
         if not _len:
-            return iter(())
+            return None
 
         start, stop, _ = slice(start, stop).indices(self._len)
 
         if start >= stop:
-            return iter(())
+            return None
 
         _pos = self._pos
 
@@ -926,7 +1739,7 @@ class SortedList(MutableSequence):
         else:
             max_pos, max_idx = _pos(stop)
 
-        return self._islice(min_pos, min_idx, max_pos, max_idx, reverse)
+        return min_pos, min_idx, max_pos, max_idx
 
     def _islice(self, min_pos, min_idx, max_pos, max_idx, reverse):
         """Return an iterator that slices sorted list using two index pairs.
@@ -1016,11 +1829,26 @@ class SortedList(MutableSequence):
         :param bool reverse: yield values in reverse order
         :return: iterator
 
+        """
+        loc = self._irange_loc(minimum, maximum, inclusive)
+
+        if loc is None:
+            return iter(())
+
+        return self._islice(*loc, reverse)
+
+    def _irange_loc(self, minimum, maximum, inclusive):
+        """Return index pairs of values between `minimum` and `maximum`.
+
+        Returns ``(min_pos, min_idx, max_pos, max_idx)`` where the first pair
+        is inclusive and the latter exclusive, or none when the range is
+        known to be empty. See :func:`SortedList.irange` for arguments.
+
         """
         _maxes = self._maxes
 
         if not _maxes:
-            return iter(())
+            return None
 
         _lists = self._lists
 
@@ -1035,14 +1863,14 @@ class SortedList(MutableSequence):
                 min_pos = bisect_left(_maxes, minimum)
 
                 if min_pos == len(_maxes):
-                    return iter(())
+                    return None
 
                 min_idx = bisect_left(_lists[min_pos], minimum)
             else:
                 min_pos = bisect_right(_maxes, minimum)
 
                 if min_pos == len(_maxes):
-                    return iter(())
+                    return None
 
                 min_idx = bisect_right(_lists[min_pos], minimum)
 
@@ -1070,7 +1898,7 @@ class SortedList(MutableSequence):
                 else:
                     max_idx = bisect_left(_lists[max_pos], maximum)
 
-        return self._islice(min_pos, min_idx, max_pos, max_idx, reverse)
+        return min_pos, min_idx, max_pos, max_idx
 
     def __len__(self):
         """Return the size of the sorted list.
@@ -1147,6 +1975,84 @@ class SortedList(MutableSequence):
     bisect = bisect_right
     _bisect_right = bisect_right
 
+    def bisect_left_many(self, values):
+        """Return indexes to insert each of `values` in the sorted list.
+
+        Equivalent to ``[sl.bisect_left(value) for value in values]`` but the
+        `values` are sorted once and the sorted list is searched in a single
+        pass. Each sublist is located in the index at most once.
+
+        Runtime complexity: `O(k*log(k) + k*log(m))` -- approximate.
+
+        >>> sl = SortedList([10, 11, 12, 13, 14])
+        >>> sl.bisect_left_many([12, 10, 15])
+        [2, 0, 5]
+
+        :param values: iterable of values
+        :return: list of indexes
+
+        """
+        return self._bisect_many(self._lists, list(values), bisect_left)
+
+    def bisect_right_many(self, values):
+        """Return indexes to insert each of `values` in the sorted list.
+
+        Similar to `bisect_left_many`, but if a value is already present, the
+        insertion point will be after (to the right of) any existing values.
+
+        Runtime complexity: `O(k*log(k) + k*log(m))` -- approximate.
+
+        >>> sl = SortedList([10, 11, 12, 13, 14])
+        >>> sl.bisect_right_many([12, 10, 15])
+        [3, 1, 5]
+
+        :param values: iterable of values
+        :return: list of indexes
+
+        """
+        return self._bisect_many(self._lists, list(values), bisect_right)
+
+    def _bisect_many(self, lists, values, bisect):
+        """Return indexes to insert each of `values` using `bisect`.
+
+        The `lists` are the sublists compared against `values` and `bisect` is
+        either `bisect_left` or `bisect_right` from the standard library.
+
+        Values are visited in sorted order so the search of `_maxes` starts at
+        the previous position and the index of the first value in each sublist
+        is computed once.
+
+        """
+        result = [0] * len(values)
+        _maxes = self._maxes
+
+        if not _maxes:
+            return result
+
+        _len = self._len
+        _loc = self._loc
+        len_maxes = len(_maxes)
+        order = sorted(range(len(values)), key=values.__getitem__)
+        pos = 0
+        prev = -1
+        total = 0
+
+        for index in order:
+            value = values[index]
+            pos = bisect(_maxes, value, pos)
+
+            if pos == len_maxes:
+                result[index] = _len
+                continue
+
+            if pos != prev:
+                total = _loc(pos, 0)
+                prev = pos
+
+            result[index] = total + bisect(lists[pos], value)
+
+        return result
+
     def count(self, value):
         """Return number of occurrences of `value` in the sorted list.
 
@@ -1198,6 +2104,152 @@ class SortedList(MutableSequence):
 
     __copy__ = copy
 
+    def snapshot(self):
+        """Return a copy-on-write snapshot of the sorted list.
+
+        The snapshot is a sorted list of the same type that shares sublists
+        with the sorted list. Only the lists of sublists and the positional
+        index are copied. The first change to a shared sublist, in either the
+        sorted list or the snapshot, copies that sublist alone. Iterating the
+        snapshot is unaffected by later changes to the sorted list.
+
+        Runtime complexity: `O(n/m)` where `m` is the load-factor
+
+        >>> sl = SortedList([1, 2, 3])
+        >>> snapshot = sl.snapshot()
+        >>> sl.add(4)
+        >>> snapshot
+        SortedList([1, 2, 3])
+
+        :return: new sorted list
+
+        """
+        result = object.__new__(type(self))
+        result.__dict__.update(self.__dict__)
+        shared = set()
+
+        for name in self._SUBLISTS:
+            lists = getattr(self, name)
+            shared.update(map(id, lists))
+            setattr(result, name, lists[:])
+
+        result._maxes = self._maxes[:]
+        result._index = self._index[:]
+        result._slots = self._slots[:]
+        result._shared = set(shared)
+        self._shared = shared
+        return result
+
+    def _unshare(self, pos):
+        """Copy sublists at `pos` that are shared with a snapshot.
+
+        Called before changing sublists in place. See
+        :func:`SortedList.snapshot`.
+
+        :param int pos: lists index
+
+        """
+        _shared = self._shared
+
+        for name in self._SUBLISTS:
+            lists = getattr(self, name)
+            sublist = lists[pos]
+
+            if id(sublist) in _shared:
+                _shared.remove(id(sublist))
+                lists[pos] = sublist[:]
+
+    @classmethod
+    def from_numpy(cls, arr):
+        """Return new sorted list with values from NumPy array `arr`.
+
+        Values are sorted with :func:`numpy.sort` and then chopped into
+        sublists of the load-factor. The sorted list never compares values.
+        Multi-dimensional arrays are flattened.
+
+        Requires NumPy which is imported on first use.
+
+        Runtime complexity: `O(n*log(n))`
+
+        :param arr: NumPy array of values
+        :return: new sorted list
+
+        """
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        values = numpy.sort(arr, axis=None)
+        result = cls()
+        result._merge(values.tolist())
+        return result
+
+    def to_numpy(self, start=None, stop=None, dtype=None):
+        """Return NumPy array of values from index `start` to `stop`.
+
+        The `start` and `stop` index are treated inclusive and exclusive,
+        respectively. Both default to `None` which is automatically inclusive
+        of the beginning and end of the sorted list.
+
+        When `dtype` is given, an array is allocated once and sublists are
+        copied into it. Otherwise NumPy infers the dtype from a list of the
+        values.
+
+        Requires NumPy which is imported on first use.
+
+        Runtime complexity: `O(log(n) + k)` -- approximate.
+
+        :param int start: start index (inclusive)
+        :param int stop: stop index (exclusive)
+        :param dtype: NumPy dtype of the array (optional)
+        :return: NumPy array of values
+
+        """
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        start, stop, _ = slice(start, stop).indices(self._len)
+
+        if dtype is None:
+            return numpy.array(self._getitem(slice(start, stop)))
+
+        result = numpy.empty(max(stop - start, 0), dtype=dtype)
+        offset = 0
+
+        for segment in self._segments(start, stop):
+            size = len(segment)
+            result[offset : (offset + size)] = segment
+            offset += size
+
+        return result
+
+    def _segments(self, start, stop):
+        """Yield sublist segments covering index `start` to `stop`.
+
+        Whole sublists are yielded as-is while partial sublists are sliced.
+
+        :param int start: start index (inclusive)
+        :param int stop: stop index (exclusive)
+
+        """
+        if start >= stop:
+            return
+
+        _lists = self._lists
+        pos, idx = self._pos(start)
+        remaining = stop - start
+
+        while remaining:
+            sublist = _lists[pos]
+            len_sublist = len(sublist)
+            end = min(len_sublist, idx + remaining)
+
+            if idx == 0 and end == len_sublist:
+                yield sublist
+            else:
+                yield sublist[idx:end]
+
+            remaining -= end - idx
+            pos += 1
+            idx = 0
+
     def append(self, value):
         """Raise not-implemented error.
 
@@ -1287,6 +2339,179 @@ class SortedList(MutableSequence):
         self._delete(pos, idx)
         return val
 
+    def popleft(self, k=1):
+        """Remove and return list of the `k` smallest values.
+
+        Values are returned in sorted order. A single value is deleted like
+        ``sl.pop(0)``. When the first sublist keeps more than half the
+        load-factor, the prefix is deleted from it in place and the index is
+        updated like :func:`SortedList.pop`. Otherwise the prefix is located by walking sublist lengths from the front and
+        removed in one slice: whole sublists are dropped, the sublist at the
+        cut is trimmed and the index is repaired once.
+
+        Raise :exc:`IndexError` if the sorted list has fewer than `k` values.
+
+        Runtime complexity: `O(k + m)` where `m` is the load-factor --
+        approximate.
+
+        >>> sl = SortedList([3, 1, 4, 1, 5])
+        >>> sl.popleft()
+        [1]
+        >>> sl.popleft(2)
+        [1, 3]
+        >>> sl
+        SortedList([4, 5])
+
+        :param int k: number of values to remove (default 1)
+        :return: list of values
+        :raises IndexError: if `k` is out of range
+
+        """
+        if k == 1 and self._len:
+            values = [self._lists[0][0]]
+            self._delete(0, 0)
+            return values
+
+        if not 0 <= k <= self._len:
+            raise IndexError('pop index out of range')
+
+        if not k:
+            return []
+
+        _lists = self._lists
+        _lists_pos = _lists[0]
+
+        if len(_lists_pos) - k > (self._load >> 1):
+            values = list(_lists_pos[:k])
+            self._trim(0, 0, k)
+            return values
+
+        last = len(_lists) - 1
+        pos = 0
+        idx = k
+
+        while pos < last and idx >= len(_lists[pos]):
+            idx -= len(_lists[pos])
+            pos += 1
+
+        values = self._range_values(0, 0, pos, idx)
+        self._delete_range(0, 0, pos, idx)
+        return values
+
+    def popright(self, k=1):
+        """Remove and return list of the `k` largest values.
+
+        Values are returned in reverse sorted order, the order of repeated
+        pops. A single value is deleted like ``sl.pop()``. The suffix is
+        deleted in place or removed in one slice. See
+        :func:`SortedList.popleft`.
+
+        Raise :exc:`IndexError` if the sorted list has fewer than `k` values.
+
+        Runtime complexity: `O(k + m)` where `m` is the load-factor --
+        approximate.
+
+        >>> sl = SortedList([3, 1, 4, 1, 5])
+        >>> sl.popright()
+        [5]
+        >>> sl.popright(2)
+        [4, 3]
+        >>> sl
+        SortedList([1, 1])
+
+        :param int k: number of values to remove (default 1)
+        :return: list of values
+        :raises IndexError: if `k` is out of range
+
+        """
+        _lists = self._lists
+
+        if k == 1 and self._len:
+            pos = len(_lists) - 1
+            _lists_pos = _lists[pos]
+            values = [_lists_pos[-1]]
+            self._delete(pos, len(_lists_pos) - 1)
+            return values
+
+        if not 0 <= k <= self._len:
+            raise IndexError('pop index out of range')
+
+        if not k:
+            return []
+
+        last = len(_lists) - 1
+        _lists_last = _lists[last]
+        end = len(_lists_last)
+
+        if end - k > (self._load >> 1):
+            values = list(_lists_last[end - 1 : end - k - 1 : -1])
+            self._trim(last, end - k, end)
+            return values
+
+        pos = last
+        idx = k
+
+        while pos > 0 and idx > len(_lists[pos]):
+            idx -= len(_lists[pos])
+            pos -= 1
+
+        idx = len(_lists[pos]) - idx
+        values = self._range_values(pos, idx, last, end)
+        values.reverse()
+        self._delete_range(pos, idx, last, end)
+        return values
+
+    def pop_many(self, start=None, stop=None):
+        """Remove and return list of values from index `start` to `stop`.
+
+        Values are returned in sorted order. Negative indices are supported
+        and out of range indices are clamped like slicing. Values are copied
+        out by slicing sublists and removed in bulk like
+        ``del sl[start:stop]``.
+
+        Runtime complexity: `O(log(n) + k/m + m)` where `m` is the
+        load-factor -- approximate.
+
+        >>> sl = SortedList('abcde')
+        >>> sl.pop_many(1, 3)
+        ['b', 'c']
+        >>> sl
+        SortedList(['a', 'd', 'e'])
+
+        :param int start: start index (inclusive)
+        :param int stop: stop index (exclusive)
+        :return: list of values
+
+        """
+        loc = self._islice_loc(start, stop)
+
+        if loc is None:
+            return []
+
+        values = self._range_values(*loc)
+        self._delete_range(*loc)
+        return values
+
+    def _range_values(self, min_pos, min_idx, max_pos, max_idx):
+        """Return list of values between two index pairs.
+
+        Values are copied by slicing sublists. See ``SortedList._islice`` for
+        details of the index pairs.
+
+        """
+        _lists = self._lists
+
+        if min_pos == max_pos:
+            return list(_lists[min_pos][min_idx:max_idx])
+
+        values = list(_lists[min_pos][min_idx:])
+
+        for sublist in _lists[min_pos + 1 : max_pos]:
+            values.extend(sublist)
+
+        values.extend(_lists[max_pos][:max_idx])
+        return values
+
     def index(self, value, start=None, stop=None):
         """Return first index of value in sorted list.
 
@@ -1501,19 +2726,79 @@ class SortedList(MutableSequence):
         values = reduce(iadd, self._lists, [])
         return (type(self), (values,))
 
-    @recursive_repr()
-    def __repr__(self):
-        """Return string representation of sorted list.
-
-        ``sl.__repr__()`` <==> ``repr(sl)``
-
-        :return: string representation
+    def dump(self, fp):
+        """Write sorted list to binary file object `fp`.
 
-        """
-        return f'{type(self).__name__}({list(self)!r})'
+        The format is versioned and records that values are already sorted
+        along with the load-factor. Values that are all ints or all floats are
+        stored as typed arrays. See :func:`SortedList.load` to read the sorted
+        list.
 
-    def _check(self):
-        """Check invariants of sorted list.
+        The format uses :mod:`pickle` so the sorted list type and arguments
+        must be picklable and only trusted files should be loaded.
+
+        Runtime complexity: `O(n)`
+
+        >>> import io
+        >>> fp = io.BytesIO()
+        >>> SortedList([3, 1, 2]).dump(fp)
+        >>> _ = fp.seek(0)
+        >>> SortedList.load(fp)
+        SortedList([1, 2, 3])
+
+        :param fp: binary file object to write
+
+        """
+        kind, args = self.__reduce__()
+        _dump_payload(fp, kind, args[1:], self, args[0])
+
+    @classmethod
+    def load(cls, fp):
+        """Read sorted list from binary file object `fp`.
+
+        Reads the format written by :func:`SortedList.dump`. Values are
+        chopped into sublists of the recorded load-factor without comparing
+        any values.
+
+        Runtime complexity: `O(n)`
+
+        :param fp: binary file object to read
+        :return: sorted list
+        :raises ValueError: if the format version is not supported
+        :raises TypeError: if the file contains another type
+
+        """
+        kind, args, load, auto, values = _load_payload(fp, cls)
+        result = kind(None, *args)
+        result._restore(values, load, auto)
+        return result
+
+    def _restore(self, values, load, auto):
+        """Restore empty sorted list from `values` in sorted order.
+
+        Used by :func:`SortedList.load`.
+
+        """
+        if isinstance(values, array):
+            values = values.tolist()
+
+        self._load = load
+        self._merge(values)
+        self._auto = auto
+
+    @recursive_repr()
+    def __repr__(self):
+        """Return string representation of sorted list.
+
+        ``sl.__repr__()`` <==> ``repr(sl)``
+
+        :return: string representation
+
+        """
+        return f'{type(self).__name__}({list(self)!r})'
+
+    def _check(self):
+        """Check invariants of sorted list.
 
         Runtime complexity: `O(n)`
 
@@ -1539,46 +2824,60 @@ class SortedList(MutableSequence):
             for pos in range(len(self._maxes)):
                 assert self._maxes[pos] == self._lists[pos][-1]
 
-            # Check sublist lengths are less than double load-factor.
+            # Check sublist lengths are less than double load-factor and
+            # greater than half load-factor for all but the last sublist.
+            # Sublists after the cursor are not yet re-chunked.
 
             double = self._load << 1
-            assert all(len(sublist) <= double for sublist in self._lists)
+            half = self._load >> 1
+            stop = len(self._lists) if self._cursor is None else self._cursor
 
-            # Check sublist lengths are greater than half load-factor for all
-            # but the last sublist.
+            for pos in range(stop):
+                assert len(self._lists[pos]) <= double
 
-            half = self._load >> 1
-            for pos in range(0, len(self._lists) - 1):
-                assert len(self._lists[pos]) >= half
+                if pos < len(self._lists) - 1:
+                    assert len(self._lists[pos]) >= half
+
+            if self._cursor is not None:
+                assert self._auto
+                assert 0 <= self._cursor < len(self._lists)
 
             if self._index:
                 assert self._len == self._index[0]
-                assert len(self._index) == self._offset + len(self._lists)
+                assert len(self._index) == 2 * self._offset + 1
+                assert len(self._slots) == len(self._lists)
+
+                # Check slots are increasing and index leaf nodes equal length
+                # of sublists or zero for empty slots.
+
+                leaves = [0] * (self._offset + 1)
+
+                for pos, slot in enumerate(self._slots):
+                    assert pos == 0 or self._slots[pos - 1] < slot
+                    leaves[slot] = len(self._lists[pos])
 
-                # Check index leaf nodes equal length of sublists.
+                assert self._index[self._offset :] == leaves
 
-                for pos in range(len(self._lists)):
-                    leaf = self._index[self._offset + pos]
-                    assert leaf == len(self._lists[pos])
+                if self._positions:
+                    assert self._positions == self._slot_positions()
 
                 # Check index branch nodes are the sum of their children.
 
                 for pos in range(self._offset):
                     child = (pos << 1) + 1
-                    if child >= len(self._index):
-                        assert self._index[pos] == 0
-                    elif child + 1 == len(self._index):
-                        assert self._index[pos] == self._index[child]
-                    else:
-                        child_sum = self._index[child] + self._index[child + 1]
-                        assert child_sum == self._index[pos]
+                    child_sum = self._index[child] + self._index[child + 1]
+                    assert child_sum == self._index[pos]
         except:
             traceback.print_exc(file=sys.stdout)
             print('len', self._len)
             print('load', self._load)
+            print('auto', self._auto)
+            print('cursor', self._cursor)
             print('offset', self._offset)
             print('len_index', len(self._index))
             print('index', self._index)
+            print('slots', self._slots)
+            print('positions', self._positions)
             print('len_maxes', len(self._maxes))
             print('maxes', self._maxes)
             print('len_lists', len(self._lists))
@@ -1603,6 +2902,7 @@ class SortedKeyList(SortedList):
     Additional methods provided:
 
     * :attr:`SortedKeyList.key`
+    * :func:`SortedKeyList.update_with_keys`
     * :func:`SortedKeyList.bisect_key_left`
     * :func:`SortedKeyList.bisect_key_right`
     * :func:`SortedKeyList.irange_key`
@@ -1617,6 +2917,8 @@ class SortedKeyList(SortedList):
 
     """
 
+    _SUBLISTS = ('_lists', '_keys')
+
     def __init__(self, iterable=None, key=identity):
         """Initialize sorted-key list instance.
 
@@ -1644,11 +2946,16 @@ class SortedKeyList(SortedList):
         self._key = key
         self._len = 0
         self._load = self.DEFAULT_LOAD_FACTOR
+        self._auto = False
+        self._cursor = None
         self._lists = []
         self._keys = []
         self._maxes = []
         self._index = []
         self._offset = 0
+        self._slots = []
+        self._positions = []
+        self._reads = 0
 
         if iterable is not None:
             self._update(iterable)
@@ -1668,6 +2975,7 @@ class SortedKeyList(SortedList):
 
         """
         self._len = 0
+        self._cursor = None
         del self._lists[:]
         del self._keys[:]
         del self._maxes[:]
@@ -1675,6 +2983,44 @@ class SortedKeyList(SortedList):
 
     _clear = clear
 
+    def _rechunk(self, size):
+        """Re-chunk sublists at the cursor to the load-factor.
+
+        Values and keys are re-chunked together. See ``SortedList._rechunk``
+        for details.
+
+        :param int size: minimum count of values to re-chunk
+
+        """
+        _lists = self._lists
+        _keys = self._keys
+        _load = self._load
+        pos = self._cursor
+        len_lists = len(_lists)
+        stop = pos
+        total = 0
+
+        while stop < len_lists and (total < size or total < _load):
+            total += len(_lists[stop])
+            stop += 1
+
+        if pos < stop:
+            values = reduce(iadd, _lists[pos:stop], [])
+            keys = reduce(iadd, _keys[pos:stop], [])
+            starts = list(range(0, total, _load))
+
+            if len(starts) > 1 and total - starts[-1] < (_load >> 1):
+                del starts[-1]
+
+            stops = starts[1:] + [total]
+            _lists[pos:stop] = [values[idx:end] for idx, end in zip(starts, stops)]
+            _keys[pos:stop] = [keys[idx:end] for idx, end in zip(starts, stops)]
+            self._maxes[pos:stop] = [keys[end - 1] for end in stops]
+            self._repair_index(pos, stop - pos)
+            pos += len(starts)
+
+        self._cursor = pos if pos < len(_lists) else None
+
     def add(self, value):
         """Add `value` to sorted-key list.
 
@@ -1690,16 +3036,29 @@ class SortedKeyList(SortedList):
 
         :param value: value to add to sorted-key list
 
+        """
+        self._insert(self._key(value), value)
+
+    def _insert(self, key, value):
+        """Insert `value` with `key` into sorted-key list.
+
+        Used by :func:`SortedKeyList.add` and by ``_update_sorted`` to add few
+        values one at a time.
+
+        :param key: key of `value`
+        :param value: value to add to sorted-key list
+
         """
         _lists = self._lists
         _keys = self._keys
         _maxes = self._maxes
 
-        key = self._key(value)
-
         if _maxes:
             pos = bisect_right(_maxes, key)
 
+            if self._shared:
+                self._unshare(min(pos, len(_maxes) - 1))
+
             if pos == len(_maxes):
                 pos -= 1
                 _lists[pos].append(value)
@@ -1726,12 +3085,18 @@ class SortedKeyList(SortedList):
         leaf node to the root. For an example traversal see
         ``SortedList._loc``.
 
+        Repairs the index when the sublist is split. See
+        ``SortedList._repair_index``.
+
         """
         _lists = self._lists
         _keys = self._keys
         _index = self._index
 
         if len(_keys[pos]) > (self._load << 1):
+            if self._shared:
+                self._unshare(pos)
+
             _maxes = self._maxes
             _load = self._load
 
@@ -1747,10 +3112,16 @@ class SortedKeyList(SortedList):
             _keys.insert(pos + 1, half_keys)
             _maxes.insert(pos + 1, half_keys[-1])
 
-            del _index[:]
+            self._repair_index(pos)
+
+            if self._auto:
+                if self._cursor is not None and pos < self._cursor:
+                    self._cursor += 1
+
+                self._adapt(_load << 1)
         else:
             if _index:
-                child = self._offset + pos
+                child = self._offset + self._slots[pos]
                 while child:
                     _index[child] += 1
                     child = (child - 1) >> 1
@@ -1769,34 +3140,176 @@ class SortedKeyList(SortedList):
 
         :param iterable: iterable of values to add
 
+        """
+        values = list(iterable)
+        keys = list(map(self._key, values))
+        self._update_keys(keys, values)
+
+    _update = update
+
+    def update_with_keys(self, pairs):
+        """Update sorted-key list by adding values with precomputed keys.
+
+        Each pair in `pairs` is a key and a value. The key must equal the
+        result of the key function applied to the value. The key function is
+        not called.
+
+        Runtime complexity: `O(k*log(n))` -- approximate.
+
+        >>> from operator import neg
+        >>> skl = SortedKeyList(key=neg)
+        >>> skl.update_with_keys([(-3, 3), (-1, 1), (-2, 2)])
+        >>> skl
+        SortedKeyList([3, 2, 1], key=<built-in function neg>)
+
+        :param pairs: iterable of key and value pairs
+
+        """
+        keys = []
+        values = []
+
+        for key, value in pairs:
+            keys.append(key)
+            values.append(value)
+
+        self._update_keys(keys, values)
+
+    def _update_keys(self, keys, values):
+        """Update sorted-key list by adding `values` with `keys`.
+
+        Values are sorted by their keys without calling the key function.
+
+        :param list keys: keys of `values`
+        :param list values: values to add
+
+        """
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        keys = list(map(keys.__getitem__, order))
+        values = list(map(values.__getitem__, order))
+        self._update_sorted(values, keys)
+
+    def _update_sorted(self, values, keys=None):
+        """Update sorted-key list by adding all `values` in sorted-key order.
+
+        Optional `keys` are the keys of `values` and are computed from the key
+        function when none. See ``SortedList._update_sorted`` for details.
+
+        :param list values: values in sorted-key order
+        :param list keys: keys of `values` (optional)
+
+        """
+        if keys is None:
+            keys = list(map(self._key, values))
+
+        _maxes = self._maxes
+
+        if _maxes and len(values) * 4 < self._len:
+            _insert = self._insert
+            for key, value in zip(keys, values):
+                _insert(key, value)
+        else:
+            self._merge(values, keys)
+
+            if self._cursor is not None:
+                self._cursor = 0
+
+        if self._auto:
+            self._adapt(len(values))
+
+    def _sorted_keys(self):
+        """Return list of keys of values in sorted order.
+
+        See ``SortedList._sorted_keys``.
+
+        """
+        return reduce(iadd, self._keys, [])
+
+    def _merge(self, values, keys=None):
+        """Merge `values` sorted by key into the sorted-key list.
+
+        Each sublist is extended by the run of `values` that belongs to it and
+        then sorted by key. Sorting two concatenated runs is a linear-time
+        merge so the sorted-key list is never re-sorted as a whole and sublists
+        that receive no values are left untouched. Sublists longer than double
+        the load-factor are split.
+
+        Runtime complexity: `O(n + k)` -- approximate.
+
+        :param list values: values in sorted-key order
+        :param list keys: keys of `values` (optional)
+
         """
         _lists = self._lists
         _keys = self._keys
         _maxes = self._maxes
-        values = sorted(iterable, key=self._key)
+        _load = self._load
 
-        if _maxes:
-            if len(values) * 4 >= self._len:
-                _lists.append(values)
-                values = reduce(iadd, _lists, [])
-                values.sort(key=self._key)
-                self._clear()
-            else:
-                _add = self.add
-                for val in values:
-                    _add(val)
-                return
+        if keys is None:
+            keys = list(map(self._key, values))
 
-        _load = self._load
-        _lists.extend(
-            values[pos : (pos + _load)] for pos in range(0, len(values), _load)
-        )
-        _keys.extend(list(map(self._key, _list)) for _list in _lists)
-        _maxes.extend(sublist[-1] for sublist in _keys)
-        self._len = len(values)
-        del self._index[:]
+        if not _maxes:
+            _lists.extend(
+                values[pos : (pos + _load)] for pos in range(0, len(values), _load)
+            )
+            _keys.extend(
+                keys[pos : (pos + _load)] for pos in range(0, len(keys), _load)
+            )
+            _maxes.extend(sublist[-1] for sublist in _keys)
+            self._len = len(values)
+            del self._index[:]
+            return
 
-    _update = update
+        if not values:
+            return
+
+        lists = []
+        keys_lists = []
+        start = 0
+        last = len(_keys) - 1
+        double = _load << 1
+        half = _load >> 1
+
+        for pos, keys_pos in enumerate(_keys):
+            lists_pos = _lists[pos]
+
+            stop = len(keys) if pos == last else bisect_left(keys, _maxes[pos], start)
+
+            if start < stop:
+                if self._shared:
+                    self._unshare(pos)
+                    keys_pos = _keys[pos]
+                    lists_pos = _lists[pos]
+
+                keys_pos.extend(keys[start:stop])
+                lists_pos.extend(values[start:stop])
+                order = sorted(range(len(keys_pos)), key=keys_pos.__getitem__)
+                keys_pos[:] = map(keys_pos.__getitem__, order)
+                lists_pos[:] = map(lists_pos.__getitem__, order)
+                start = stop
+
+                if len(keys_pos) > double:
+                    indices = range(0, len(keys_pos), _load)
+                    chunks = [lists_pos[idx : (idx + _load)] for idx in indices]
+                    keys_chunks = [keys_pos[idx : (idx + _load)] for idx in indices]
+
+                    if len(keys_chunks[-1]) < half:
+                        tail = chunks.pop()
+                        chunks[-1] += tail
+                        tail = keys_chunks.pop()
+                        keys_chunks[-1] += tail
+
+                    lists.extend(chunks)
+                    keys_lists.extend(keys_chunks)
+                    continue
+
+            lists.append(lists_pos)
+            keys_lists.append(keys_pos)
+
+        _lists[:] = lists
+        _keys[:] = keys_lists
+        _maxes[:] = [sublist[-1] for sublist in keys_lists]
+        self._len += len(values)
+        del self._index[:]
 
     def __contains__(self, value):
         """Return true if `value` is an element of the sorted-key list.
@@ -1949,7 +3462,8 @@ class SortedKeyList(SortedList):
     def _delete(self, pos, idx):
         """Delete value at the given `(pos, idx)`.
 
-        Combines lists that are less than half the load level.
+        Combines lists that are less than half the load level and repairs the
+        index. See ``SortedList._repair_index``.
 
         Updates the index when the sublist length is more than half the load
         level. This requires decrementing the nodes in a traversal from the
@@ -1964,6 +3478,10 @@ class SortedKeyList(SortedList):
         _keys = self._keys
         _maxes = self._maxes
         _index = self._index
+
+        if self._shared:
+            self._unshare(pos)
+
         keys_pos = _keys[pos]
         lists_pos = _lists[pos]
 
@@ -1977,7 +3495,7 @@ class SortedKeyList(SortedList):
             _maxes[pos] = keys_pos[-1]
 
             if _index:
-                child = self._offset + pos
+                child = self._offset + self._slots[pos]
                 while child > 0:
                     _index[child] -= 1
                     child = (child - 1) >> 1
@@ -1987,6 +3505,10 @@ class SortedKeyList(SortedList):
                 pos += 1
 
             prev = pos - 1
+
+            if self._shared:
+                self._unshare(prev)
+
             _keys[prev].extend(_keys[pos])
             _lists[prev].extend(_lists[pos])
             _maxes[prev] = _keys[prev][-1]
@@ -1994,9 +3516,17 @@ class SortedKeyList(SortedList):
             del _lists[pos]
             del _keys[pos]
             del _maxes[pos]
-            del _index[:]
 
-            self._expand(prev)
+            self._repair_index(prev, 2)
+
+            if self._cursor is not None and pos <= self._cursor:
+                self._cursor -= 1
+
+            if len(_keys[prev]) > (self._load << 1):
+                self._expand(prev)
+
+            if self._auto:
+                self._adapt(self._load << 1)
         elif len_keys_pos:
             _maxes[pos] = keys_pos[-1]
         else:
@@ -2005,6 +3535,184 @@ class SortedKeyList(SortedList):
             del _maxes[pos]
             del _index[:]
 
+    def _trim(self, pos, start, stop):
+        """Delete values from `start` to `stop` of the sublist at `pos`.
+
+        Keys are deleted along with values. See ``SortedList._trim`` for
+        details.
+
+        :param int pos: lists index
+        :param int start: sublist index of first value to delete
+        :param int stop: sublist index of value after last value to delete
+
+        """
+        if self._shared:
+            self._unshare(pos)
+
+        keys_pos = self._keys[pos]
+        del keys_pos[start:stop]
+        del self._lists[pos][start:stop]
+        self._maxes[pos] = keys_pos[-1]
+        count = stop - start
+        self._len -= count
+        _index = self._index
+
+        if _index:
+            child = self._offset + self._slots[pos]
+            while child > 0:
+                _index[child] -= count
+                child = (child - 1) >> 1
+            _index[0] -= count
+
+    def _delete_range(self, min_pos, min_idx, max_pos, max_idx):
+        """Delete values between two index pairs.
+
+        Values and keys are deleted together. See
+        ``SortedList._delete_range`` for details.
+
+        :param int min_pos: lists index of first value to delete
+        :param int min_idx: sublist index of first value to delete
+        :param int max_pos: lists index of value after last value to delete
+        :param int max_idx: sublist index of value after last value to delete
+
+        """
+        if min_pos > max_pos or (min_pos == max_pos and min_idx >= max_idx):
+            return
+
+        _lists = self._lists
+        _keys = self._keys
+        _load = self._load
+        start = min_pos
+        stop = max_pos + 1
+        values = _lists[min_pos][:min_idx] + _lists[max_pos][max_idx:]
+        keys = _keys[min_pos][:min_idx] + _keys[max_pos][max_idx:]
+        count = sum(map(len, _keys[start:stop])) - len(keys)
+
+        if len(keys) < (_load >> 1):
+            if start:
+                start -= 1
+                values = _lists[start] + values
+                keys = _keys[start] + keys
+            elif stop < len(_keys):
+                values += _lists[stop]
+                keys += _keys[stop]
+                stop += 1
+
+        if len(keys) > (_load << 1):
+            starts = list(range(0, len(keys), _load))
+
+            if len(keys) - starts[-1] < (_load >> 1):
+                del starts[-1]
+
+            stops = starts[1:] + [len(keys)]
+            chunks = [values[idx:end] for idx, end in zip(starts, stops)]
+            keys_chunks = [keys[idx:end] for idx, end in zip(starts, stops)]
+        elif keys:
+            chunks = [values]
+            keys_chunks = [keys]
+        else:
+            chunks = []
+            keys_chunks = []
+
+        _lists[start:stop] = chunks
+        _keys[start:stop] = keys_chunks
+        self._maxes[start:stop] = [sublist[-1] for sublist in keys_chunks]
+        self._len -= count
+        self._repair_index(start, stop - start)
+
+        cursor = self._cursor
+
+        if cursor is not None and cursor >= start:
+            cursor = start + len(chunks) + max(0, cursor - stop)
+            self._cursor = cursor if cursor < len(_lists) else None
+
+        if self._auto:
+            self._adapt(count)
+
+    def _mark_many(self, iterable):
+        """Locate values in `iterable` in a single sweep of the sublists.
+
+        The key function is called once per value and the values are sorted
+        by their keys. The sweep keeps a position `(pos, idx)` at the start of
+        the run of equal keys. Each value scans the run for an equal value
+        that is not yet marked, continuing after the previous mark in the run
+        and wrapping around to the start of the run. Values removed in the
+        order they were added scan each run once. See
+        ``SortedList._mark_many`` for details.
+
+        :param iterable: iterable of values
+        :return: pair of dict mapping lists index to list of sublist indexes
+            and list of values not found in sorted order of keys
+
+        """
+        values = list(iterable)
+        keys = list(map(self._key, values))
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        _lists = self._lists
+        _keys = self._keys
+        _maxes = self._maxes
+        len_keys = len(_keys)
+        marks = {}
+        marked = set()
+        missing = []
+        pos = idx = 0
+        run = resume = None
+
+        for index in order:
+            key = keys[index]
+            value = values[index]
+
+            if pos < len_keys and _maxes[pos] < key:
+                pos = bisect_left(_maxes, key, pos)
+                idx = 0
+
+            if pos == len_keys:
+                missing.append(value)
+                continue
+
+            idx = bisect_left(_keys[pos], key, idx)
+
+            if run != (pos, idx):
+                run = resume = (pos, idx)
+
+            scan_pos, scan_idx = resume
+            wrapped = False
+
+            while True:
+                if scan_pos == len_keys or _keys[scan_pos][scan_idx] != key:
+                    if wrapped or resume == run:
+                        missing.append(value)
+                        break
+
+                    scan_pos, scan_idx = run
+                    wrapped = True
+
+                loc = (scan_pos, scan_idx)
+
+                if wrapped and loc == resume:
+                    missing.append(value)
+                    break
+
+                if loc not in marked and _lists[scan_pos][scan_idx] == value:
+                    marked.add(loc)
+                    marks.setdefault(scan_pos, []).append(scan_idx)
+                    scan_idx += 1
+
+                    if scan_idx == len(_keys[scan_pos]):
+                        scan_pos += 1
+                        scan_idx = 0
+
+                    resume = (scan_pos, scan_idx)
+                    break
+
+                scan_idx += 1
+
+                if scan_idx == len(_keys[scan_pos]):
+                    scan_pos += 1
+                    scan_idx = 0
+
+        return marks, missing
+
     def irange(self, minimum=None, maximum=None, inclusive=(True, True), reverse=False):
         """Create an iterator of values between `minimum` and `maximum`.
 
@@ -2069,11 +3777,24 @@ class SortedKeyList(SortedList):
         :param bool reverse: yield values in reverse order
         :return: iterator
 
+        """
+        loc = self._irange_key_loc(min_key, max_key, inclusive)
+
+        if loc is None:
+            return iter(())
+
+        return self._islice(*loc, reverse)
+
+    def _irange_key_loc(self, min_key, max_key, inclusive):
+        """Return index pairs of values between `min_key` and `max_key`.
+
+        See ``SortedList._irange_loc`` and :func:`SortedKeyList.irange_key`.
+
         """
         _maxes = self._maxes
 
         if not _maxes:
-            return iter(())
+            return None
 
         _keys = self._keys
 
@@ -2088,14 +3809,14 @@ class SortedKeyList(SortedList):
                 min_pos = bisect_left(_maxes, min_key)
 
                 if min_pos == len(_maxes):
-                    return iter(())
+                    return None
 
                 min_idx = bisect_left(_keys[min_pos], min_key)
             else:
                 min_pos = bisect_right(_maxes, min_key)
 
                 if min_pos == len(_maxes):
-                    return iter(())
+                    return None
 
                 min_idx = bisect_right(_keys[min_pos], min_key)
 
@@ -2123,10 +3844,20 @@ class SortedKeyList(SortedList):
                 else:
                     max_idx = bisect_left(_keys[max_pos], max_key)
 
-        return self._islice(min_pos, min_idx, max_pos, max_idx, reverse)
+        return min_pos, min_idx, max_pos, max_idx
 
     _irange_key = irange_key
 
+    def _irange_loc(self, minimum, maximum, inclusive):
+        """Return index pairs of values between `minimum` and `maximum`.
+
+        See ``SortedList._irange_loc``.
+
+        """
+        min_key = self._key(minimum) if minimum is not None else None
+        max_key = self._key(maximum) if maximum is not None else None
+        return self._irange_key_loc(min_key, max_key, inclusive)
+
     def bisect_left(self, value):
         """Return an index to insert `value` in the sorted-key list.
 
@@ -2171,6 +3902,47 @@ class SortedKeyList(SortedList):
 
     bisect = bisect_right
 
+    def bisect_left_many(self, values):
+        """Return indexes to insert each of `values` in the sorted-key list.
+
+        Equivalent to ``[skl.bisect_left(value) for value in values]`` but the
+        keys are sorted once and the sorted-key list is searched in a single
+        pass.
+
+        Runtime complexity: `O(k*log(k) + k*log(m))` -- approximate.
+
+        >>> from operator import neg
+        >>> skl = SortedKeyList([5, 4, 3, 2, 1], key=neg)
+        >>> skl.bisect_left_many([1, 4, 6])
+        [4, 1, 0]
+
+        :param values: iterable of values
+        :return: list of indexes
+
+        """
+        keys = list(map(self._key, values))
+        return self._bisect_many(self._keys, keys, bisect_left)
+
+    def bisect_right_many(self, values):
+        """Return indexes to insert each of `values` in the sorted-key list.
+
+        Similar to `bisect_left_many`, but if a value is already present, the
+        insertion point will be after (to the right of) any existing values.
+
+        Runtime complexity: `O(k*log(k) + k*log(m))` -- approximate.
+
+        >>> from operator import neg
+        >>> skl = SortedKeyList([5, 4, 3, 2, 1], key=neg)
+        >>> skl.bisect_right_many([1, 4, 6])
+        [5, 2, 0]
+
+        :param values: iterable of values
+        :return: list of indexes
+
+        """
+        keys = list(map(self._key, values))
+        return self._bisect_many(self._keys, keys, bisect_right)
+
     def bisect_key_left(self, key):
         """Return an index to insert `key` in the sorted-key list.
 
@@ -2295,7 +4067,10 @@ class SortedKeyList(SortedList):
         :return: new sorted-key list
 
         """
-        return self.__class__(self, key=self._key)
+        values = reduce(iadd, self._lists, [])
+        result = self.__class__(key=self._key)
+        result._update_sorted(values, self._sorted_keys())
+        return result
 
     __copy__ = copy
 
@@ -2477,46 +4252,60 @@ class SortedKeyList(SortedList):
             for pos in range(len(self._maxes)):
                 assert self._maxes[pos] == self._keys[pos][-1]
 
-            # Check sublist lengths are less than double load-factor.
+            # Check sublist lengths are less than double load-factor and
+            # greater than half load-factor for all but the last sublist.
+            # Sublists after the cursor are not yet re-chunked.
 
             double = self._load << 1
-            assert all(len(sublist) <= double for sublist in self._lists)
+            half = self._load >> 1
+            stop = len(self._lists) if self._cursor is None else self._cursor
 
-            # Check sublist lengths are greater than half load-factor for all
-            # but the last sublist.
+            for pos in range(stop):
+                assert len(self._lists[pos]) <= double
 
-            half = self._load >> 1
-            for pos in range(0, len(self._lists) - 1):
-                assert len(self._lists[pos]) >= half
+                if pos < len(self._lists) - 1:
+                    assert len(self._lists[pos]) >= half
+
+            if self._cursor is not None:
+                assert self._auto
+                assert 0 <= self._cursor < len(self._lists)
 
             if self._index:
                 assert self._len == self._index[0]
-                assert len(self._index) == self._offset + len(self._lists)
+                assert len(self._index) == 2 * self._offset + 1
+                assert len(self._slots) == len(self._lists)
 
-                # Check index leaf nodes equal length of sublists.
+                # Check slots are increasing and index leaf nodes equal length
+                # of sublists or zero for empty slots.
 
-                for pos in range(len(self._lists)):
-                    leaf = self._index[self._offset + pos]
-                    assert leaf == len(self._lists[pos])
+                leaves = [0] * (self._offset + 1)
+
+                for pos, slot in enumerate(self._slots):
+                    assert pos == 0 or self._slots[pos - 1] < slot
+                    leaves[slot] = len(self._lists[pos])
+
+                assert self._index[self._offset :] == leaves
+
+                if self._positions:
+                    assert self._positions == self._slot_positions()
 
                 # Check index branch nodes are the sum of their children.
 
                 for pos in range(self._offset):
                     child = (pos << 1) + 1
-                    if child >= len(self._index):
-                        assert self._index[pos] == 0
-                    elif child + 1 == len(self._index):
-                        assert self._index[pos] == self._index[child]
-                    else:
-                        child_sum = self._index[child] + self._index[child + 1]
-                        assert child_sum == self._index[pos]
+                    child_sum = self._index[child] + self._index[child + 1]
+                    assert child_sum == self._index[pos]
         except:
             traceback.print_exc(file=sys.stdout)
             print('len', self._len)
             print('load', self._load)
+            print('auto', self._auto)
+            print('cursor', self._cursor)
             print('offset', self._offset)
             print('len_index', len(self._index))
             print('index', self._index)
+            print('slots', self._slots)
+            print('positions', self._positions)
             print('len_maxes', len(self._maxes))
             print('maxes', self._maxes)
             print('len_keys', len(self._keys))
@@ -2527,3 +4316,885 @@ class SortedKeyList(SortedList):
 
 
 SortedListWithKey = SortedKeyList
+
+
+class SortedAggregateList(SortedList):
+    """Sorted-aggregate list is a subtype of sorted list.
+
+    The sorted-aggregate list maintains an aggregate of every sublist and a
+    tree of those aggregates that parallels the positional index. Aggregates
+    of a range of values are computed without iterating the range.
+
+    The `aggregate` function combines two values and must be associative, like
+    :func:`operator.add`, :func:`min` or :func:`max`. The optional `project`
+    function extracts the quantity to aggregate from each value.
+
+    All the same methods that are available in :class:`SortedList` are also
+    available in :class:`SortedAggregateList`.
+
+    Additional methods provided:
+
+    * :attr:`SortedAggregateList.aggregate`
+    * :attr:`SortedAggregateList.project`
+    * :func:`SortedAggregateList.range_aggregate`
+    * :func:`SortedAggregateList.irange_aggregate`
+
+    Sublist aggregates are updated lazily. Adding or deleting a value marks its
+    sublist and the next query recomputes the marked sublists and their paths
+    to the root of the tree. Splitting or merging sublists rebuilds the tree
+    of aggregates.
+
+    """
+
+    def __init__(self, iterable=None, aggregate=add, project=None):
+        """Initialize sorted-aggregate list instance.
+
+        Optional `iterable` argument provides an initial iterable of values to
+        initialize the sorted-aggregate list.
+
+        Optional `aggregate` argument defines an associative callable of two
+        arguments used to combine values. The default is :func:`operator.add`.
+
+        Optional `project` argument defines a callable that extracts the
+        quantity to aggregate from each value. The default, none, aggregates
+        values directly.
+
+        Runtime complexity: `O(n*log(n))`
+
+        >>> sal = SortedAggregateList([3, 1, 2, 5, 4])
+        >>> sal
+        SortedAggregateList([1, 2, 3, 4, 5], aggregate=<built-in function add>)
+
+        :param iterable: initial values (optional)
+        :param aggregate: function used to combine values (optional)
+        :param project: function used to extract quantity (optional)
+
+        """
+        self._aggregate = aggregate
+        self._project = project
+        self._aggregates = []
+        self._dirty = set()
+        SortedList.__init__(self, iterable)
+
+    def __new__(cls, iterable=None, aggregate=add, project=None):
+        # pylint: disable=unused-argument
+        return object.__new__(cls)
+
+    @property
+    def aggregate(self):
+        "Function used to combine values."
+        return self._aggregate
+
+    @property
+    def project(self):
+        "Function used to extract the quantity to aggregate from values."
+        return self._project
+
+    def _expand(self, pos):
+        """Split sublists with length greater than double the load-factor.
+
+        Marks the sublist aggregate for update when the index is maintained.
+        See ``SortedList._expand`` for details.
+
+        """
+        SortedList._expand(self, pos)
+
+        if self._index:
+            self._dirty.add(pos)
+
+    def _delete(self, pos, idx):
+        """Delete value at the given `(pos, idx)`.
+
+        Marks the sublist aggregate for update when the index is maintained.
+        See ``SortedList._delete`` for details.
+
+        :param int pos: lists index
+        :param int idx: sublist index
+
+        """
+        SortedList._delete(self, pos, idx)
+
+        if self._index:
+            self._dirty.add(pos)
+
+    def _trim(self, pos, start, stop):
+        """Delete values from `start` to `stop` of the sublist at `pos`.
+
+        Marks the sublist aggregate for update when the index is maintained.
+        See ``SortedList._trim`` for details.
+
+        """
+        SortedList._trim(self, pos, start, stop)
+
+        if self._index:
+            self._dirty.add(pos)
+
+    def _build_index(self):
+        """Build a positional index for indexing the sorted-aggregate list.
+
+        The index is only rebuilt after sublists are replaced or outgrow the
+        index so the tree of aggregates, which shares the layout of the index, is
+        discarded. See ``SortedList._build_index`` for details.
+
+        """
+        SortedList._build_index(self)
+        del self._aggregates[:]
+        self._dirty.clear()
+
+    def _repair_index(self, pos, count=1):
+        """Repair the positional index after sublists change at `pos`.
+
+        Sublists from `pos` are re-assigned slots and marks for update refer to
+        positions before the change so the tree of aggregates is discarded. See
+        ``SortedList._repair_index`` for details.
+
+        :param int pos: lists index
+        :param int count: count of sublists that changed (default 1)
+
+        """
+        SortedList._repair_index(self, pos, count)
+        del self._aggregates[:]
+        self._dirty.clear()
+
+    def _sublist_aggregate(self, sublist, start=0, stop=None):
+        "Return aggregate of `sublist` values from `start` to `stop`."
+        values = islice(sublist, start, stop)
+
+        if self._project is not None:
+            values = map(self._project, values)
+
+        return reduce(self._aggregate, values)
+
+    def _combine(self, alpha, beta):
+        "Combine aggregates where none represents no values."
+        if alpha is None:
+            return beta
+        if beta is None:
+            return alpha
+        return self._aggregate(alpha, beta)
+
+    def _build_aggregates(self):
+        """Build the tree of sublist aggregates.
+
+        The tree uses the dense layout of the positional index described in
+        ``SortedList._build_index``: the aggregate of sublist `pos` is stored
+        at ``_offset + _slots[pos]``, empty slots are none and each branch node
+        combines its two children.
+
+        """
+        _offset = self._offset
+        _combine = self._combine
+        tree = [None] * (2 * _offset + 1)
+
+        for slot, sublist in zip(self._slots, self._lists):
+            tree[_offset + slot] = self._sublist_aggregate(sublist)
+
+        for pos in reversed(range(_offset)):
+            child = (pos << 1) + 1
+            tree[pos] = _combine(tree[child], tree[child + 1])
+
+        self._aggregates[:] = tree
+        self._dirty.clear()
+
+    def _update_aggregates(self):
+        "Update the tree of aggregates for sublists marked by changes."
+        if not self._index:
+            self._build_index()
+
+        _aggregates = self._aggregates
+
+        if not _aggregates:
+            self._build_aggregates()
+            return
+
+        _combine = self._combine
+        _lists = self._lists
+        _offset = self._offset
+        _slots = self._slots
+
+        for pos in self._dirty:
+            child = _offset + _slots[pos]
+            _aggregates[child] = self._sublist_aggregate(_lists[pos])
+
+            while child:
+                child = (child - 1) >> 1
+                left = (child << 1) + 1
+                _aggregates[child] = _combine(_aggregates[left], _aggregates[left + 1])
+
+        self._dirty.clear()
+
+    def range_aggregate(self, start=None, stop=None, initial=None):
+        """Return aggregate of values from index `start` to `stop`.
+
+        The `start` and `stop` index are treated inclusive and exclusive,
+        respectively. Both default to `None` which is automatically inclusive
+        of the beginning and end of the sorted-aggregate list.
+
+        Optional argument `initial` is returned when the range is empty.
+
+        Runtime complexity: `O(log(n))` -- approximate.
+
+        >>> sal = SortedAggregateList(range(10))
+        >>> sal.range_aggregate(2, 5)
+        9
+        >>> sal.range_aggregate(5, 5, initial=0)
+        0
+
+        :param int start: start index (inclusive)
+        :param int stop: stop index (exclusive)
+        :param initial: value for empty range (default None)
+        :return: aggregate of values
+
+        """
+        start, stop, _ = slice(start, stop).indices(self._len)
+
+        if start >= stop:
+            return initial
+
+        min_pos, min_idx = self._pos(start)
+        max_pos, max_idx = self._pos(stop - 1)
+        max_idx += 1
+
+        _lists = self._lists
+        _sublist_aggregate = self._sublist_aggregate
+
+        if min_pos == max_pos:
+            return _sublist_aggregate(_lists[min_pos], min_idx, max_idx)
+
+        self._update_aggregates()
+
+        # Traverse the tree from the leaves between the two partial sublists
+        # towards the root. Positions are one-based so that left-child nodes
+        # are at even positions.
+
+        _aggregates = self._aggregates
+        _combine = self._combine
+        head = _sublist_aggregate(_lists[min_pos], min_idx)
+        tail = _sublist_aggregate(_lists[max_pos], 0, max_idx)
+        lo = self._offset + self._slots[min_pos] + 2
+        hi = self._offset + self._slots[max_pos] + 1
+
+        while lo < hi:
+            if lo & 1:
+                head = _combine(head, _aggregates[lo - 1])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                tail = _combine(_aggregates[hi - 1], tail)
+            lo >>= 1
+            hi >>= 1
+
+        return _combine(head, tail)
+
+    def irange_aggregate(
+        self, minimum=None, maximum=None, inclusive=(True, True), initial=None
+    ):
+        """Return aggregate of values between `minimum` and `maximum`.
+
+        Both `minimum` and `maximum` default to `None` which is automatically
+        inclusive of the beginning and end of the sorted-aggregate list.
+
+        The argument `inclusive` is a pair of booleans that indicates whether
+        the minimum and maximum ought to be included in the range,
+        respectively. The default is ``(True, True)`` such that the range is
+        inclusive of both minimum and maximum.
+
+        Optional argument `initial` is returned when the range is empty.
+
+        Runtime complexity: `O(log(n))` -- approximate.
+
+        >>> from operator import neg
+        >>> sal = SortedAggregateList(range(10), aggregate=max, project=neg)
+        >>> sal.irange_aggregate(3, 6)
+        -3
+        >>> sal.irange_aggregate(3, 6, inclusive=(False, False))
+        -4
+
+        :param minimum: minimum value to start aggregating
+        :param maximum: maximum value to stop aggregating
+        :param inclusive: pair of booleans
+        :param initial: value for empty range (default None)
+        :return: aggregate of values
+
+        """
+        if minimum is None:
+            start = 0
+        elif inclusive[0]:
+            start = self.bisect_left(minimum)
+        else:
+            start = self.bisect_right(minimum)
+
+        if maximum is None:
+            stop = self._len
+        elif inclusive[1]:
+            stop = self.bisect_right(maximum)
+        else:
+            stop = self.bisect_left(maximum)
+
+        return self.range_aggregate(start, stop, initial)
+
+    def copy(self):
+        """Return a shallow copy of the sorted-aggregate list.
+
+        Runtime complexity: `O(n)`
+
+        :return: new sorted-aggregate list
+
+        """
+        return self.__class__(self, self._aggregate, self._project)
+
+    __copy__ = copy
+
+    def snapshot(self):
+        """Return a copy-on-write snapshot of the sorted-aggregate list.
+
+        Aggregates are copied along with the positional index. See
+        :func:`SortedList.snapshot` for details.
+
+        Runtime complexity: `O(n/m)` where `m` is the load-factor
+
+        :return: new sorted-aggregate list
+
+        """
+        result = SortedList.snapshot(self)
+        result._aggregates = self._aggregates[:]
+        result._dirty = set(self._dirty)
+        return result
+
+    def __add__(self, other):
+        """Return new sorted-aggregate list containing all values in both
+        sequences.
+
+        ``sal.__add__(other)`` <==> ``sal + other``
+
+        Values in `other` do not need to be in sorted order.
+
+        Runtime complexity: `O(n*log(n))`
+
+        :param other: other iterable
+        :return: new sorted-aggregate list
+
+        """
+        values = reduce(iadd, self._lists, [])
+        values.extend(other)
+        return self.__class__(values, self._aggregate, self._project)
+
+    __radd__ = __add__
+
+    def __mul__(self, num):
+        """Return new sorted-aggregate list with `num` shallow copies of values.
+
+        ``sal.__mul__(num)`` <==> ``sal * num``
+
+        Runtime complexity: `O(n*log(n))`
+
+        :param int num: count of shallow copies
+        :return: new sorted-aggregate list
+
+        """
+        values = reduce(iadd, self._lists, []) * num
+        return self.__class__(values, self._aggregate, self._project)
+
+    __rmul__ = __mul__
+
+    def __reduce__(self):
+        values = reduce(iadd, self._lists, [])
+        return (type(self), (values, self._aggregate, self._project))
+
+    @recursive_repr()
+    def __repr__(self):
+        """Return string representation of sorted-aggregate list.
+
+        ``sal.__repr__()`` <==> ``repr(sal)``
+
+        :return: string representation
+
+        """
+        type_name = type(self).__name__
+        _project = self._project
+        project = '' if _project is None else f', project={_project!r}'
+        aggregate = f'aggregate={self._aggregate!r}'
+        return f'{type_name}({list(self)!r}, {aggregate}{project})'
+
+    def _check(self):
+        """Check invariants of sorted-aggregate list.
+
+        Runtime complexity: `O(n)`
+
+        """
+        SortedList._check(self)
+
+        _aggregates = self._aggregates
+
+        # The tree of aggregates is stale when the index is not built.
+
+        if _aggregates and self._index:
+            assert len(_aggregates) == 2 * self._offset + 1
+
+            # Check leaf nodes not marked for update equal sublist aggregates.
+
+            for pos, sublist in enumerate(self._lists):
+                if pos not in self._dirty:
+                    leaf = _aggregates[self._offset + self._slots[pos]]
+                    assert leaf == self._sublist_aggregate(sublist)
+
+
+class SortedArrayList(SortedList):
+    """Sorted-array list is a subtype of sorted list.
+
+    The sorted-array list stores values in typed :class:`array.array` sublists
+    rather than Python lists. Values are numbers of a single C type given by
+    the `typecode` which avoids the memory cost of a Python object for every
+    value. With the default typecode, ``'q'``, each value uses eight bytes.
+
+    All the same methods that are available in :class:`SortedList` are also
+    available in :class:`SortedArrayList`. Slices are returned as lists.
+
+    Additional attributes and methods provided:
+
+    * :attr:`SortedArrayList.typecode`
+    * :func:`SortedArrayList.buffers`
+    * :func:`SortedArrayList.islice_buffer`
+
+    """
+
+    def __init__(self, iterable=None, typecode='q'):
+        """Initialize sorted-array list instance.
+
+        Optional `iterable` argument provides an initial iterable of values to
+        initialize the sorted-array list.
+
+        Optional `typecode` argument defines the C type of values. See the
+        :mod:`array` module for available typecodes. The default is ``'q'``
+        for signed 64-bit integers.
+
+        Runtime complexity: `O(n*log(n))`
+
+        >>> sal = SortedArrayList([3, 1, 2, 5, 4])
+        >>> sal
+        SortedArrayList([1, 2, 3, 4, 5], typecode='q')
+
+        :param iterable: initial values (optional)
+        :param str typecode: array typecode of values (optional)
+
+        """
+        self._typecode = typecode
+        SortedList.__init__(self)
+        self._maxes = array(typecode)
+
+        if iterable is not None:
+            self._update(iterable)
+
+    def __new__(cls, iterable=None, typecode='q'):
+        # pylint: disable=unused-argument
+        return object.__new__(cls)
+
+    @property
+    def typecode(self):
+        "Array typecode of values in sorted-array list."
+        return self._typecode
+
+    def add(self, value):
+        """Add `value` to sorted-array list.
+
+        Runtime complexity: `O(log(n))` -- approximate.
+
+        >>> sal = SortedArrayList()
+        >>> sal.add(3)
+        >>> sal.add(1)
+        >>> sal.add(2)
+        >>> sal
+        SortedArrayList([1, 2, 3], typecode='q')
+
+        :param value: value to add to sorted-array list
+
+        """
+        _lists = self._lists
+        _maxes = self._maxes
+
+        if _maxes:
+            pos = bisect_right(_maxes, value)
+
+            if self._shared:
+                self._unshare(min(pos, len(_maxes) - 1))
+
+            if pos == len(_maxes):
+                pos -= 1
+                _lists[pos].append(value)
+                _maxes[pos] = value
+            else:
+                insort(_lists[pos], value)
+
+            self._expand(pos)
+        else:
+            sublist = array(self._typecode, (value,))
+            _lists.append(sublist)
+            _maxes.append(sublist[-1])
+
+        self._len += 1
+
+    def _merge(self, values):
+        """Merge sorted `values` into the sorted-array list.
+
+        Values are converted to an array first so that values of the wrong
+        type raise an error before the sorted-array list is changed. Arrays
+        have no sort method so sublists that receive values are rebuilt from
+        the merge of both runs. See ``SortedList._merge`` for details.
+
+        Runtime complexity: `O(n + k)` -- approximate.
+
+        :param list values: values in sorted order
+
+        """
+        _lists = self._lists
+        _maxes = self._maxes
+        _load = self._load
+        typecode = self._typecode
+        values = array(typecode, values)
+
+        if not _maxes:
+            _lists.extend(
+                values[pos : (pos + _load)] for pos in range(0, len(values), _load)
+            )
+            _maxes.extend(sublist[-1] for sublist in _lists)
+            self._len = len(values)
+            del self._index[:]
+            return
+
+        if not values:
+            return
+
+        lists = []
+        start = 0
+        last = len(_lists) - 1
+        double = _load << 1
+        half = _load >> 1
+
+        for pos, sublist in enumerate(_lists):
+            if pos == last:
+                stop = len(values)
+            else:
+                stop = bisect_left(values, _maxes[pos], start)
+
+            if start < stop:
+                sublist = array(typecode, sorted(chain(sublist, values[start:stop])))
+                start = stop
+
+                if len(sublist) > double:
+                    chunks = [
+                        sublist[idx : (idx + _load)]
+                        for idx in range(0, len(sublist), _load)
+                    ]
+
+                    if len(chunks[-1]) < half:
+                        tail = chunks.pop()
+                        chunks[-1] += tail
+
+                    lists.extend(chunks)
+                    continue
+
+            lists.append(sublist)
+
+        _lists[:] = lists
+        _maxes[:] = array(typecode, [sublist[-1] for sublist in lists])
+        self._len += len(values)
+        del self._index[:]
+
+    def _rechunk(self, size):
+        """Re-chunk sublists at the cursor to the load-factor.
+
+        See ``SortedList._rechunk`` for details.
+
+        :param int size: minimum count of values to re-chunk
+
+        """
+        _lists = self._lists
+        _load = self._load
+        pos = self._cursor
+        len_lists = len(_lists)
+        stop = pos
+        total = 0
+
+        while stop < len_lists and (total < size or total < _load):
+            total += len(_lists[stop])
+            stop += 1
+
+        if pos < stop:
+            values = reduce(iadd, _lists[pos:stop], array(self._typecode))
+            chunks = [values[idx : (idx + _load)] for idx in range(0, total, _load)]
+
+            if len(chunks) > 1 and len(chunks[-1]) < (_load >> 1):
+                tail = chunks.pop()
+                chunks[-1] += tail
+
+            _lists[pos:stop] = chunks
+            maxes = array(self._typecode, [chunk[-1] for chunk in chunks])
+            self._maxes[pos:stop] = maxes
+            self._repair_index(pos, stop - pos)
+            pos += len(chunks)
+
+        self._cursor = pos if pos < len(_lists) else None
+
+    def _delete(self, pos, idx):
+        """Delete value at the given `(pos, idx)`.
+
+        A sublist combined with the sublist at `pos` is copied first because
+        it may have exported buffers. See ``SortedList._delete`` for details.
+
+        :param int pos: lists index
+        :param int idx: sublist index
+
+        """
+        _lists = self._lists
+
+        if pos and len(_lists[pos]) <= (self._load >> 1) + 1:
+            _lists[pos - 1] = _lists[pos - 1][:]
+
+        SortedList._delete(self, pos, idx)
+
+    def _restore(self, values, load, auto):
+        """Restore empty sorted-array list from `values` in sorted order.
+
+        Typed arrays are merged as-is. See ``SortedList._restore``.
+
+        """
+        self._load = load
+        self._merge(values)
+        self._auto = auto
+
+    @classmethod
+    def from_numpy(cls, arr, typecode=None):
+        """Return new sorted-array list with values from NumPy array `arr`.
+
+        Values are sorted with :func:`numpy.sort` and copied into arrays as raw
+        bytes. Values are never converted to Python objects.
+
+        Optional `typecode` argument defines the C type of values. The default
+        is the character code of the dtype of `arr`.
+
+        Requires NumPy which is imported on first use.
+
+        Runtime complexity: `O(n*log(n))`
+
+        :param arr: NumPy array of values
+        :param str typecode: array typecode of values (optional)
+        :return: new sorted-array list
+
+        """
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        values = numpy.sort(arr, axis=None)
+
+        if typecode is None:
+            typecode = values.dtype.char
+        else:
+            values = values.astype(typecode, copy=False)
+
+        result = cls(typecode=typecode)
+        result._merge(array(typecode, values.tobytes()))
+        return result
+
+    def to_numpy(self, start=None, stop=None, dtype=None):
+        """Return NumPy array of values from index `start` to `stop`.
+
+        Sublists are copied into the array through the buffer protocol. The
+        `dtype` defaults to the typecode. See ``SortedList.to_numpy`` for
+        details.
+
+        Requires NumPy which is imported on first use.
+
+        Runtime complexity: `O(log(n) + k)` -- approximate.
+
+        :param int start: start index (inclusive)
+        :param int stop: stop index (exclusive)
+        :param dtype: NumPy dtype of the array (optional)
+        :return: NumPy array of values
+
+        """
+        if dtype is None:
+            dtype = self._typecode
+
+        return SortedList.to_numpy(self, start, stop, dtype)
+
+    def buffers(self):
+        """Return list of memoryviews of sublists.
+
+        The memoryviews share memory with the sublists so no values are
+        copied. The concatenation of the memoryviews is the values of the
+        sorted-array list in sorted order. The memoryviews are read-only so
+        sorted order cannot be broken through them.
+
+        Sublists cannot be resized while memoryviews of them exist. Adding or
+        removing a value in such a sublist raises :exc:`BufferError` and leaves
+        the sorted-array list unchanged. Release memoryviews with
+        :meth:`memoryview.release` or a ``with`` statement before changing the
+        sorted-array list.
+
+        Runtime complexity: `O(n/m)` where `m` is the load-factor
+
+        >>> sal = SortedArrayList(range(5))
+        >>> [view.tolist() for view in sal.buffers()]
+        [[0, 1, 2, 3, 4]]
+
+        :return: list of memoryviews
+
+        """
+        return [memoryview(sublist).toreadonly() for sublist in self._lists]
+
+    def islice_buffer(self, start=None, stop=None):
+        """Return list of memoryviews of values from index `start` to `stop`.
+
+        The `start` and `stop` index are treated inclusive and exclusive,
+        respectively. Both default to `None` which is automatically inclusive
+        of the beginning and end of the sorted-array list.
+
+        The memoryviews are contiguous segments of sublists that together
+        cover the range. No values are copied. See
+        :func:`SortedArrayList.buffers` for restrictions while memoryviews
+        exist.
+
+        Runtime complexity: `O(log(n) + k/m)` where `m` is the load-factor
+        -- approximate.
+
+        >>> sal = SortedArrayList(range(10))
+        >>> [view.tolist() for view in sal.islice_buffer(2, 5)]
+        [[2, 3, 4]]
+
+        :param int start: start index (inclusive)
+        :param int stop: stop index (exclusive)
+        :return: list of memoryviews
+
+        """
+        start, stop, _ = slice(start, stop).indices(self._len)
+        return list(self._segments(start, stop))
+
+    def _segments(self, start, stop):
+        """Yield sublist segments covering index `start` to `stop`.
+
+        Segments are read-only memoryviews of the sublists so no values are
+        copied.
+
+        :param int start: start index (inclusive)
+        :param int stop: stop index (exclusive)
+
+        """
+        if start >= stop:
+            return
+
+        _lists = self._lists
+        pos, idx = self._pos(start)
+        remaining = stop - start
+
+        while remaining:
+            view = memoryview(_lists[pos]).toreadonly()
+            end = min(len(view), idx + remaining)
+            yield view[idx:end]
+            remaining -= end - idx
+            pos += 1
+            idx = 0
+
+    def __getitem__(self, index):
+        """Lookup value at `index` in sorted-array list.
+
+        ``sal.__getitem__(index)`` <==> ``sal[index]``
+
+        Supports slicing. Slices are returned as lists.
+
+        Runtime complexity: `O(log(n))` -- approximate.
+
+        >>> sal = SortedArrayList([1, 2, 3, 4, 5])
+        >>> sal[1]
+        2
+        >>> sal[2:5]
+        [3, 4, 5]
+
+        :param index: integer or slice for indexing
+        :return: value or list of values
+        :raises IndexError: if index out of range
+
+        """
+        result = SortedList.__getitem__(self, index)
+
+        if isinstance(index, slice) and not isinstance(result, list):
+            result = result.tolist()
+
+        return result
+
+    _getitem = __getitem__
+
+    def copy(self):
+        """Return a shallow copy of the sorted-array list.
+
+        Runtime complexity: `O(n)`
+
+        :return: new sorted-array list
+
+        """
+        return self.__class__(self, self._typecode)
+
+    __copy__ = copy
+
+    def __add__(self, other):
+        """Return new sorted-array list containing all values in both
+        sequences.
+
+        ``sal.__add__(other)`` <==> ``sal + other``
+
+        Values in `other` do not need to be in sorted order.
+
+        Runtime complexity: `O(n*log(n))`
+
+        :param other: other iterable
+        :return: new sorted-array list
+
+        """
+        values = reduce(iadd, self._lists, [])
+        values.extend(other)
+        return self.__class__(values, self._typecode)
+
+    __radd__ = __add__
+
+    def __mul__(self, num):
+        """Return new sorted-array list with `num` shallow copies of values.
+
+        ``sal.__mul__(num)`` <==> ``sal * num``
+
+        Runtime complexity: `O(n*log(n))`
+
+        :param int num: count of shallow copies
+        :return: new sorted-array list
+
+        """
+        values = reduce(iadd, self._lists, []) * num
+        return self.__class__(values, self._typecode)
+
+    __rmul__ = __mul__
+
+    def __reduce__(self):
+        values = reduce(iadd, self._lists, array(self._typecode))
+        return (type(self), (values, self._typecode))
+
+    def __repr__(self):
+        """Return string representation of sorted-array list.
+
+        ``sal.__repr__()`` <==> ``repr(sal)``
+
+        :return: string representation
+
+        """
+        type_name = type(self).__name__
+        return f'{type_name}({list(self)!r}, typecode={self._typecode!r})'
+
+    def _check(self):
+        """Check invariants of sorted-array list.
+
+        Runtime complexity: `O(n)`
+
+        """
+        SortedList._check(self)
+        assert isinstance(self._maxes, array)
+        assert self._maxes.typecode == self._typecode
+
+        for sublist in self._lists:
+            assert isinstance(sublist, array)
+            assert sublist.typecode == self._typecode
@@ -14,11 +14,17 @@ Sorted set implementations:
 """
 
 from collections.abc import MutableSet, Sequence, Set
-from itertools import chain
-from operator import eq, ge, gt, le, lt, ne
+from functools import reduce
+from itertools import chain, compress, groupby
+from operator import eq, ge, gt, iadd, le, lt, ne
 from textwrap import dedent
 
-from .sortedlist import SortedList, recursive_repr
+from .sortedlist import (
+    SortedList,
+    _dump_payload,
+    _load_payload,
+    recursive_repr,
+)
 
 
 class SortedSet(MutableSet, Sequence):
@@ -66,6 +72,8 @@ class SortedSet(MutableSet, Sequence):
 
     * :func:`SortedSet.copy`
     * :func:`SortedSet.count`
+    * :func:`SortedSet.dump`
+    * :func:`SortedSet.load`
     * :func:`SortedSet.__repr__`
     * :func:`SortedSet._check`
 
@@ -121,13 +129,14 @@ class SortedSet(MutableSet, Sequence):
         self._key = key
 
         # SortedSet._fromset calls SortedSet.__init__ after initializing the
-        # _set attribute. So only create a new set if the _set attribute is not
-        # already present.
+        # _set attribute and optionally the _list attribute. So only create a
+        # new set and sorted list if the attributes are not already present.
 
         if not hasattr(self, '_set'):
             self._set = set()
 
-        self._list = SortedList(self._set, key=key)
+        if not hasattr(self, '_list'):
+            self._list = SortedList(self._set, key=key)
 
         # Expose some set methods publicly.
 
@@ -157,17 +166,87 @@ class SortedSet(MutableSet, Sequence):
             self._update(iterable)
 
     @classmethod
-    def _fromset(cls, values, key=None):
+    def _fromset(cls, values, key=None, sorted_list=None):
         """Initialize sorted set from existing set.
 
-        Used internally by set operations that return a new set.
+        Used internally by set operations that return a new set. Optional
+        `sorted_list` argument must contain the same values as `values`.
 
         """
         sorted_set = object.__new__(cls)
         sorted_set._set = values
+
+        if sorted_list is not None:
+            sorted_set._list = sorted_list
+
         sorted_set.__init__(key=key)
         return sorted_set
 
+    def _fromsorted(self, values, ordered, keys=None):
+        """Initialize sorted set from set `values` and the same `ordered`.
+
+        Used internally by set operations that return a new set. Optional
+        `keys` are the keys of `ordered` values.
+
+        """
+        key = self._key
+        sorted_list = SortedList(key=key)
+        sorted_list._update_sorted(ordered, keys)
+        return self._fromset(values, key=key, sorted_list=sorted_list)
+
+    def _order(self, values, sources):
+        """Return pair of list of `values` in sorted order and their keys.
+
+        Each sorted set in `sources` must contain all of `values`. Filtering
+        the sorted list of a sorted set with the same key is linear and
+        compares no values so it is used when `values` are more than a quarter
+        of the smallest such sorted set. Otherwise `values` are sorted.
+
+        Keys are none when the key function is none. Otherwise keys are taken
+        from the filtered sorted list or computed once to sort `values`.
+
+        """
+        key = self._key
+        smallest = None
+
+        for source in sources:
+            if (
+                isinstance(source, SortedSet)
+                and source._key == key
+                and (smallest is None or len(source._list) < len(smallest))
+            ):
+                smallest = source._list
+
+        if smallest is not None and (4 * len(values)) > len(smallest):
+            flags = [value in values for value in smallest]
+            ordered = list(compress(smallest, flags))
+
+            if key is None:
+                return ordered, None
+
+            keys = compress(chain.from_iterable(smallest._keys), flags)
+            return ordered, list(keys)
+
+        if key is None:
+            return sorted(values), None
+
+        values = list(values)
+        keys = list(map(key, values))
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        ordered = list(map(values.__getitem__, order))
+        return ordered, list(map(keys.__getitem__, order))
+
+    def _assign(self, ordered, keys=None):
+        """Replace values of sorted list with `ordered` values.
+
+        Used internally by set operations that update the set. Optional `keys`
+        are the keys of `ordered` values.
+
+        """
+        _list = self._list
+        _list.clear()
+        _list._update_sorted(ordered, keys)
+
     @property
     def key(self):
         """Function used to extract comparison key from values.
@@ -356,7 +435,8 @@ class SortedSet(MutableSet, Sequence):
         :return: new sorted set
 
         """
-        return self._fromset(set(self._set), key=self._key)
+        sorted_list = self._list.copy()
+        return self._fromset(set(self._set), key=self._key, sorted_list=sorted_list)
 
     __copy__ = copy
 
@@ -468,7 +548,7 @@ class SortedSet(MutableSet, Sequence):
 
         """
         diff = self._set.difference(*iterables)
-        return self._fromset(diff, key=self._key)
+        return self._fromsorted(diff, *self._order(diff, (self,)))
 
     __sub__ = difference
 
@@ -493,12 +573,11 @@ class SortedSet(MutableSet, Sequence):
         values = set(chain(*iterables))
         if (4 * len(values)) > len(_set):
             _set.difference_update(values)
-            _list.clear()
-            _list.update(_set)
+            self._assign(*self._order(_set, (self,)))
         else:
-            _discard = self._discard
-            for value in values:
-                _discard(value)
+            values = [value for value in values if value in _set]
+            _set.difference_update(values)
+            _list.discard_many(values)
         return self
 
     __isub__ = difference_update
@@ -522,7 +601,8 @@ class SortedSet(MutableSet, Sequence):
 
         """
         intersect = self._set.intersection(*iterables)
-        return self._fromset(intersect, key=self._key)
+        ordered, keys = self._order(intersect, chain((self,), iterables))
+        return self._fromsorted(intersect, ordered, keys)
 
     __and__ = intersection
     __rand__ = __and__
@@ -546,10 +626,8 @@ class SortedSet(MutableSet, Sequence):
 
         """
         _set = self._set
-        _list = self._list
         _set.intersection_update(*iterables)
-        _list.clear()
-        _list.update(_set)
+        self._assign(*self._order(_set, chain((self,), iterables)))
         return self
 
     __iand__ = intersection_update
@@ -572,8 +650,15 @@ class SortedSet(MutableSet, Sequence):
         :return: new sorted set
 
         """
-        diff = self._set.symmetric_difference(other)
-        return self._fromset(diff, key=self._key)
+        _set = self._set
+        values = other._set if isinstance(other, SortedSet) else set(other)
+        added = values.difference(_set)
+        kept = _set.difference(values)
+        sorted_list = SortedList(key=self._key)
+        sorted_list._update_sorted(*self._order(kept, (self,)))
+        sorted_list._update_sorted(*self._order(added, (other,)))
+        kept.update(added)
+        return self._fromset(kept, key=self._key, sorted_list=sorted_list)
 
     __xor__ = symmetric_difference
     __rxor__ = __xor__
@@ -599,9 +684,18 @@ class SortedSet(MutableSet, Sequence):
         """
         _set = self._set
         _list = self._list
-        _set.symmetric_difference_update(other)
-        _list.clear()
-        _list.update(_set)
+        values = other._set if isinstance(other, SortedSet) else set(other)
+        added = values.difference(_set)
+        removed = values.intersection(_set)
+        _set.difference_update(removed)
+
+        if (4 * len(removed)) > len(_list):
+            self._assign(*self._order(_set, (self,)))
+        else:
+            _list.discard_many(removed)
+
+        _set.update(added)
+        _list._update_sorted(*self._order(added, (other,)))
         return self
 
     __ixor__ = symmetric_difference_update
@@ -617,11 +711,54 @@ class SortedSet(MutableSet, Sequence):
         >>> ss.union([4, 5, 6, 7])
         SortedSet([1, 2, 3, 4, 5, 6, 7])
 
+        Values of sorted sets with the same key are already in sorted order so
+        their sorted lists are concatenated as runs and merged by a single
+        sort. Other `iterables` are sorted together as one more run. The set of
+        the new sorted set is the union of the sets of the operands.
+
         :param iterables: iterable arguments
         :return: new sorted set
 
         """
-        return self.__class__(chain(iter(self), *iterables), key=self._key)
+        key = self._key
+        ordered = list(self._list)
+        keys = self._list._sorted_keys()
+        sets = []
+        others = []
+
+        for iterable in iterables:
+            if isinstance(iterable, SortedSet) and iterable._key == key:
+                ordered.extend(iterable._list)
+                sets.append(iterable._set)
+
+                if key is not None:
+                    keys.extend(chain.from_iterable(iterable._list._keys))
+            else:
+                others.append(iterable)
+
+        if others:
+            others = set(chain(*others))
+            others_ordered, others_keys = self._order(others, ())
+            ordered.extend(others_ordered)
+            sets.append(others)
+
+            if key is not None:
+                keys.extend(others_keys)
+
+        if sets:
+            if key is None:
+                ordered.sort()
+                ordered = [value for value, _ in groupby(ordered)]
+            else:
+                order = sorted(range(len(keys)), key=keys.__getitem__)
+                unique = dict(
+                    zip(map(ordered.__getitem__, order), map(keys.__getitem__, order))
+                )
+                ordered = list(unique)
+                keys = list(unique.values())
+
+        values = self._set.union(*sets)
+        return self._fromsorted(values, ordered, keys)
 
     __or__ = union
     __ror__ = __or__
@@ -643,13 +780,12 @@ class SortedSet(MutableSet, Sequence):
 
         """
         _set = self._set
-        _list = self._list
         values = set(chain(*iterables))
         if (4 * len(values)) > len(_set):
-            _list = self._list
-            _set.update(values)
-            _list.clear()
-            _list.update(_set)
+            added = values.difference(_set)
+            _set.update(added)
+            sources = iterables if len(iterables) == 1 else ()
+            self._list._update_sorted(*self._order(added, sources))
         else:
             _add = self._add
             for value in values:
@@ -668,6 +804,48 @@ class SortedSet(MutableSet, Sequence):
         """
         return (type(self), (self._set, self._key))
 
+    def dump(self, fp):
+        """Write sorted set to binary file object `fp`.
+
+        Values are written in sorted order. See :func:`SortedList.dump` for
+        details of the format and :func:`SortedSet.load` to read the sorted
+        set.
+
+        Runtime complexity: `O(n)`
+
+        >>> import io
+        >>> fp = io.BytesIO()
+        >>> SortedSet([3, 1, 2, 1]).dump(fp)
+        >>> _ = fp.seek(0)
+        >>> SortedSet.load(fp)
+        SortedSet([1, 2, 3])
+
+        :param fp: binary file object to write
+
+        """
+        values = reduce(iadd, self._list._lists, [])
+        _dump_payload(fp, type(self), (self._key,), self._list, values)
+
+    @classmethod
+    def load(cls, fp):
+        """Read sorted set from binary file object `fp`.
+
+        Reads the format written by :func:`SortedSet.dump`. Values are chopped
+        into sublists without comparing any values.
+
+        Runtime complexity: `O(n)`
+
+        :param fp: binary file object to read
+        :return: sorted set
+        :raises ValueError: if the format version is not supported
+        :raises TypeError: if the file contains another type
+
+        """
+        kind, (key,), load, auto, values = _load_payload(fp, cls)
+        sorted_list = SortedList(key=key)
+        sorted_list._restore(values, load, auto)
+        return kind._fromset(set(sorted_list), key, sorted_list)
+
     @recursive_repr()
     def __repr__(self):
         """Return string representation of sorted set.
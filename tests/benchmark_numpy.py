@@ -0,0 +1,47 @@
+"""Compare NumPy construction and export of sorted lists.
+
+Construction from a NumPy array through the initializer sorts boxed Python
+objects with `sorted`. SortedList.from_numpy sorts with `numpy.sort` and
+chops the result into sublists. SortedArrayList.from_numpy also avoids boxing
+by copying raw bytes into typed arrays.
+
+Export through `numpy.array(list(sl))` builds an intermediate list.
+SortedList.to_numpy with a dtype copies sublists into a preallocated array
+and SortedArrayList.to_numpy copies through the buffer protocol.
+
+Requires NumPy. Times are the minimum of `REPEAT` runs in seconds.
+
+"""
+
+import timeit
+
+import numpy
+
+import sortedcontainers as sc
+
+SIZE = int(5e7)
+REPEAT = 3
+
+
+def measure(name, func):
+    "Print minimum runtime of `func` in seconds."
+    times = timeit.repeat(func, number=1, repeat=REPEAT)
+    print(name, '%.3f' % min(times))
+
+
+if __name__ == '__main__':
+    arr = numpy.random.default_rng(0).integers(0, 2**62, SIZE)
+
+    measure('SortedList(arr)', lambda: sc.SortedList(arr))
+    measure('SortedList.from_numpy', lambda: sc.SortedList.from_numpy(arr))
+    measure(
+        'SortedArrayList.from_numpy',
+        lambda: sc.SortedArrayList.from_numpy(arr),
+    )
+
+    sl = sc.SortedList.from_numpy(arr)
+    sal = sc.SortedArrayList.from_numpy(arr)
+
+    measure('numpy.array(list(sl))', lambda: numpy.array(list(sl)))
+    measure('sl.to_numpy', lambda: sl.to_numpy(dtype=numpy.int64))
+    measure('sal.to_numpy', lambda: sal.to_numpy())
@@ -0,0 +1,87 @@
+"""Measure repeated pops from either end of a sorted list.
+
+SortedList.popleft and SortedList.popright remove a prefix or suffix. A single
+value is deleted like SortedList.pop. When the end sublist keeps more than half
+the load-factor, a prefix or suffix is deleted from it in place and the index
+is updated like SortedList.pop. Otherwise it is removed with
+SortedList._delete_range.
+
+Each method is timed for `COUNT` calls on a sorted list of `SIZE` random
+values with the positional index built. Batch pops of `BATCH` values are
+compared with as many calls to SortedList.pop. The best time of `REPEAT`
+runs is reported in seconds. Garbage collection is disabled while timing.
+
+Sample output: SIZE = int(1e6), COUNT = int(2e5), BATCH = 10
+
+pop(0) 0.347
+popleft() 0.326
+pop() 0.439
+popright() 0.445
+pop(0) x 10 0.316
+popleft(10) 0.056
+
+When every pop went through SortedList._delete_range, popleft() measured 5.0
+and popright() measured 4.75 seconds for 200K calls.
+
+Conclusion:
+
+Single-value popleft and popright are no slower than pop(0) and pop(). Batch
+pops slice the end sublist once rather than shift it once per value.
+
+"""
+
+import gc
+import random
+import time
+
+import sortedcontainers as sc
+
+SIZE = int(1e6)
+COUNT = int(2e5)
+BATCH = 10
+REPEAT = 5
+
+
+def measure(name, pop, count):
+    "Print best time of `count` calls of `pop` on copies of a sorted list."
+    random.seed(0)
+    values = sc.SortedList(random.random() for _ in range(SIZE))
+    times = []
+
+    for _ in range(REPEAT):
+        sl = values.copy()
+        sl[len(sl) // 2]
+        method = pop(sl)
+        gc.collect()
+        gc.disable()
+
+        try:
+            start = time.perf_counter()
+            for _ in range(count):
+                method()
+            times.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+
+        sl._check()
+
+    print(name, '%.3f' % min(times))
+
+
+def pop_many(sl):
+    "Return function that pops `BATCH` values with `sl.pop(0)`."
+    pop = sl.pop
+
+    def method():
+        return [pop(0) for _ in range(BATCH)]
+
+    return method
+
+
+if __name__ == '__main__':
+    measure('pop(0)', lambda sl: lambda: sl.pop(0), COUNT)
+    measure('popleft()', lambda sl: sl.popleft, COUNT)
+    measure('pop()', lambda sl: sl.pop, COUNT)
+    measure('popright()', lambda sl: sl.popright, COUNT)
+    measure('pop(0) x %d' % BATCH, pop_many, COUNT // BATCH)
+    measure('popleft(%d)' % BATCH, lambda sl: lambda: sl.popleft(BATCH), COUNT // BATCH)
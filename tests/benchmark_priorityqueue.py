@@ -0,0 +1,166 @@
+"""
+Benchmark Priority Queue Datatypes
+"""
+
+import heapq
+from itertools import count
+
+from .benchmark import *
+
+# Tests.
+
+
+@register_test
+def push(func, size):
+    for val in lists[size][::100]:
+        func(val, val)
+
+
+@register_test
+def pop_min(func, size):
+    for val in range(int(size / 100)):
+        assert func()[0] == val
+
+
+@register_test
+def pushpop(func, size):
+    for val in lists[size][::100]:
+        func(val + 0.5, val)
+
+
+@register_test
+def remove(func, size):
+    for handle in range(0, size, 100):
+        func(handle)
+
+
+# Setups.
+
+
+def do_nothing(obj, size):
+    pass
+
+
+def fill_values(obj, size):
+    for val in lists[size]:
+        obj.push(val, val)
+
+
+# Implementation imports.
+
+
+class HeapQueue:
+    "Priority queue of heapq entries with handles removed by list scan."
+
+    def __init__(self):
+        self._heap = []
+        self._entries = {}
+        self._counter = count()
+
+    def push(self, priority, item):
+        handle = next(self._counter)
+        entry = self._entries[handle] = (priority, handle, item)
+        heapq.heappush(self._heap, entry)
+        return handle
+
+    def pushpop(self, priority, item):
+        handle = next(self._counter)
+        entry = (priority, handle, item)
+
+        if self._heap and self._heap[0] < entry:
+            self._entries[handle] = entry
+            entry = heapq.heapreplace(self._heap, entry)
+            del self._entries[entry[1]]
+
+        return entry[0], entry[2]
+
+    def pop_min(self):
+        priority, handle, item = heapq.heappop(self._heap)
+        del self._entries[handle]
+        return priority, item
+
+    def remove(self, handle):
+        entry = self._entries.pop(handle)
+        self._heap.remove(entry)
+        heapq.heapify(self._heap)
+        return entry[0], entry[2]
+
+
+class SortedListQueue:
+    "Priority queue of sorted list entries with handles."
+
+    def __init__(self):
+        self._list = SortedList()
+        self._entries = {}
+        self._counter = count()
+
+    def push(self, priority, item):
+        handle = next(self._counter)
+        entry = self._entries[handle] = (priority, handle, item)
+        self._list.add(entry)
+        return handle
+
+    def pushpop(self, priority, item):
+        self.push(priority, item)
+        return self.pop_min()
+
+    def pop_min(self):
+        priority, handle, item = self._list.pop(0)
+        del self._entries[handle]
+        return priority, item
+
+    def remove(self, handle):
+        entry = self._entries.pop(handle)
+        self._list.remove(entry)
+        return entry[0], entry[2]
+
+    def _reset(self, load):
+        self._list._reset(load)
+
+
+from sortedcontainers import SortedList, SortedPriorityQueue
+
+kinds['SortedPriorityQueue'] = SortedPriorityQueue
+kinds['SortedList'] = SortedListQueue
+kinds['heapq'] = HeapQueue
+
+# Implementation configuration.
+
+for name in tests:
+    impls[name] = OrderedDict()
+
+for name, kind in kinds.items():
+    impls['push'][name] = {
+        'setup': fill_values,
+        'ctor': kind,
+        'func': 'push',
+        'limit': 1000000,
+    }
+
+for name, kind in kinds.items():
+    impls['pop_min'][name] = {
+        'setup': fill_values,
+        'ctor': kind,
+        'func': 'pop_min',
+        'limit': 1000000,
+    }
+
+for name, kind in kinds.items():
+    impls['pushpop'][name] = {
+        'setup': fill_values,
+        'ctor': kind,
+        'func': 'pushpop',
+        'limit': 1000000,
+    }
+
+for name, kind in kinds.items():
+    impls['remove'][name] = {
+        'setup': fill_values,
+        'ctor': kind,
+        'func': 'remove',
+        'limit': 1000000,
+    }
+limit('remove', 'heapq', 10000)
+
+if __name__ == '__main__':
+    main('Priority Queue')
@@ -0,0 +1,221 @@
+import asyncio
+
+from sortedcontainers.aio import AsyncSortedDict, AsyncSortedList
+import pytest
+
+
+def negate(value):
+    return -value
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def settle():
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+def test_list():
+    asl = AsyncSortedList(range(10), key=negate)
+    assert asl.key is negate
+    assert len(asl) == 10
+    assert 5 in asl
+    assert asl[0] == 9
+    assert list(asl) == list(range(9, -1, -1))
+    assert list(reversed(asl)) == list(range(10))
+    assert asl.bisect_left(5) == 4
+    assert asl.bisect_right(5) == 5
+    assert asl.bisect(5) == 5
+    assert asl.index(5) == 4
+    assert asl.count(5) == 1
+    assert list(asl.irange(5, 3)) == [5, 4, 3]
+    assert list(asl.islice(0, 2)) == [9, 8]
+    asl.add(10)
+    asl.update([11, 12])
+    asl.discard(12)
+    asl.discard(12)
+    asl.remove(11)
+
+    with pytest.raises(ValueError):
+        asl.remove(11)
+
+    assert asl.pop() == 0
+    assert asl.pop(0) == 10
+    del asl[0]
+    assert list(asl) == list(range(8, 0, -1))
+    assert repr(asl).startswith('AsyncSortedList(SortedKeyList(')
+    asl.clear()
+    assert not len(asl)
+    asl._check()
+
+
+def test_wait_for_key_le():
+    async def main():
+        asl = AsyncSortedList([10])
+        assert await asl.wait_for_key_le(10) == 10
+        waiters = [
+            asyncio.ensure_future(asl.wait_for_key_le(bound)) for bound in [2, 5, 8]
+        ]
+        await settle()
+        assert len(asl._bound_waiters) == 3
+        asl.add(6)
+        await settle()
+        assert [waiter.done() for waiter in waiters] == [False, False, True]
+        assert waiters[2].result() == 6
+        assert len(asl._bound_waiters) == 2
+        asl.add(4)
+        await settle()
+        assert waiters[1].result() == 4
+        waiters[0].cancel()
+        await settle()
+        assert not asl._bound_waiters
+        asl._check()
+
+    run(main())
+
+
+def test_wait_rewait():
+    async def main():
+        asl = AsyncSortedList()
+        waiter = asyncio.ensure_future(asl.wait_for_key_le(5))
+        await settle()
+        asl.add(1)
+        asl.remove(1)
+        await settle()
+        assert not waiter.done()
+        asl.add(2)
+        assert await waiter == 2
+
+    run(main())
+
+
+def test_pop_when():
+    async def main():
+        asl = AsyncSortedList([5, 6])
+        first = asyncio.ensure_future(asl.pop_when(lambda value: value < 3))
+        second = asyncio.ensure_future(asl.pop_when(lambda value: value < 3))
+        await settle()
+        asl.add(7)
+        await settle()
+        assert not first.done()
+        asl.update([2, 1])
+        await settle()
+        assert sorted([first.result(), second.result()]) == [1, 2]
+        assert list(asl) == [5, 6, 7]
+        assert not asl._front_waiters
+
+    run(main())
+
+
+def test_pop_when_removed():
+    async def main():
+        asl = AsyncSortedList([5, 1])
+        asl.remove(1)
+        waiter = asyncio.ensure_future(asl.pop_when(lambda value: value > 5))
+        await settle()
+        asl.add(8)
+        await settle()
+        assert not waiter.done()
+        asl.pop(0)
+        assert await waiter == 8
+        waiter = asyncio.ensure_future(asl.pop_when(lambda value: True))
+        await settle()
+        waiter.cancel()
+        await settle()
+        assert not asl._front_waiters
+
+    run(main())
+
+
+def test_airange():
+    async def main():
+        asl = AsyncSortedList([1, 5, 9])
+        values = []
+
+        async def consume():
+            iterator = asl.airange(2, 8, inclusive=(False, False))
+
+            async for value in iterator:
+                values.append(value)
+
+                if len(values) == 3:
+                    break
+
+            await iterator.aclose()
+
+        task = asyncio.ensure_future(consume())
+        await settle()
+        assert values == [5]
+        assert len(asl._range_waiters) == 1
+        asl.update([0, 2, 8, 9, 7])
+        asl.add(3)
+        await task
+        assert values == [5, 7, 3]
+        assert not asl._range_waiters
+
+    run(main())
+
+
+def test_airange_open():
+    async def main():
+        asl = AsyncSortedList([1])
+        iterator = asl.airange()
+        assert await iterator.__anext__() == 1
+        assert len(asl._open_waiters) == 1
+        asl.add(0)
+        assert await iterator.__anext__() == 0
+        await iterator.aclose()
+        assert not asl._open_waiters
+
+    run(main())
+
+
+def test_dict():
+    asd = AsyncSortedDict(zip(range(10), range(10)))
+    assert asd.key is None
+    assert len(asd) == 10
+    assert asd[5] == 5
+    assert asd.get(20) is None
+    asd[10] = 10
+    asd[10] = -10
+    del asd[0]
+
+    with pytest.raises(KeyError):
+        del asd[0]
+
+    assert asd.setdefault(11, 11) == 11
+    assert asd.setdefault(11, 0) == 11
+    asd.update({12: 12})
+    assert asd.pop(12) == 12
+    assert asd.pop(12, None) is None
+
+    with pytest.raises(KeyError):
+        asd.pop(12)
+
+    assert asd.popitem() == (11, 11)
+    assert asd.peekitem(0) == (1, 1)
+    assert list(asd.keys()) == list(range(1, 11))
+    assert list(asd.values())[-1] == -10
+    assert list(asd.items())[0] == (1, 1)
+    assert repr(asd).startswith('AsyncSortedDict(SortedDict(')
+    asd._check()
+
+
+def test_dict_scheduler():
+    async def main():
+        asd = AsyncSortedDict()
+        waiter = asyncio.ensure_future(asd.wait_for_key_le(100))
+        popper = asyncio.ensure_future(asd.pop_when(lambda key: key <= 50))
+        await settle()
+        asd[200] = 'late'
+        await settle()
+        assert not waiter.done()
+        asd[40] = 'soon'
+        await settle()
+        assert waiter.result() == (40, 'soon')
+        assert popper.result() == (40, 'soon')
+        assert list(asd) == [200]
+
+    run(main())
@@ -0,0 +1,298 @@
+import threading
+
+from sortedcontainers import SortedColocatedDict, SortedDict, SortedList
+from sortedcontainers.concurrent import (
+    ConcurrentSortedDict,
+    ConcurrentSortedList,
+    RWLock,
+)
+import pytest
+
+
+def negate(value):
+    return -value
+
+
+def test_rwlock_readers():
+    lock = RWLock()
+    barrier = threading.Barrier(3, timeout=5)
+
+    def reader():
+        with lock.read():
+            barrier.wait()
+
+    threads = [threading.Thread(target=reader) for _ in range(2)]
+
+    for thread in threads:
+        thread.start()
+
+    barrier.wait()
+
+    for thread in threads:
+        thread.join()
+
+
+def test_rwlock_writer():
+    lock = RWLock()
+    events = []
+    started = threading.Event()
+
+    def writer():
+        started.set()
+        with lock.write():
+            events.append('write')
+
+    with lock.read():
+        thread = threading.Thread(target=writer)
+        thread.start()
+        started.wait()
+        thread.join(0.05)
+        events.append('read')
+
+    thread.join()
+    assert events == ['read', 'write']
+
+
+def test_rwlock_reentrant():
+    lock = RWLock()
+
+    with lock.write():
+        with lock.write():
+            with lock.read():
+                pass
+
+    assert lock._owner is None
+
+    with lock.read():
+        pass
+
+    assert lock._readers == 0
+
+
+def test_rwlock_release():
+    lock = RWLock()
+
+    with pytest.raises(RuntimeError):
+        lock.release_read()
+
+    with pytest.raises(RuntimeError):
+        lock.release_write()
+
+
+def test_list():
+    csl = ConcurrentSortedList(range(100), key=negate)
+    assert csl.key is negate
+    assert len(csl) == 100
+    assert 5 in csl
+    assert csl[0] == 99
+    assert csl.bisect_left(90) == 9
+    assert csl.bisect_right(90) == 10
+    assert csl.bisect(90) == 10
+    assert csl.bisect_key_left(-90) == 9
+    assert csl.bisect_key_right(-90) == 10
+    assert csl.bisect_key(-90) == 10
+    assert csl.index(90) == 9
+    assert csl.count(90) == 1
+    assert list(csl.irange(10, 5)) == [10, 9, 8, 7, 6, 5]
+    assert list(csl.irange_key(-10, -8)) == [10, 9, 8]
+    assert list(csl.islice(0, 2)) == [99, 98]
+    assert list(csl)[:2] == [99, 98]
+    assert list(reversed(csl))[:2] == [0, 1]
+    csl.add(100)
+    csl.update([101, 102])
+    csl.discard(101)
+    csl.remove(102)
+    assert csl.pop(0) == 100
+    del csl[0]
+    assert csl[0] == 98
+    copy = csl.copy()
+    assert isinstance(copy, SortedList)
+    assert copy == list(range(98, -1, -1))
+    csl.clear()
+    assert len(csl) == 0
+    assert repr(csl).startswith('ConcurrentSortedList(SortedKeyList([], key=')
+    csl._check()
+
+
+def test_list_iter():
+    csl = ConcurrentSortedList(range(10))
+    values = iter(csl)
+    csl.clear()
+    assert list(values) == list(range(10))
+
+
+def test_list_snapshot():
+    csl = ConcurrentSortedList(range(10))
+    snapshot = csl.snapshot()
+    csl.add(5)
+    assert list(snapshot) == list(range(10))
+    assert type(snapshot) is SortedList
+
+
+def test_list_batch():
+    csl = ConcurrentSortedList()
+
+    with csl.write() as sl:
+        sl.update(range(10))
+        sl._reset(4)
+
+    with csl.read() as sl:
+        assert sl == list(range(10))
+        assert sl._index
+
+
+def test_list_index():
+    csl = ConcurrentSortedList(range(100))
+    csl._list._reset(4)
+    assert not csl._list._index
+    assert csl[50] == 50
+    assert csl._list._index
+
+
+def test_list_threads():
+    csl = ConcurrentSortedList()
+    csl._list._reset(4)
+    errors = []
+
+    def writer(start):
+        for value in range(start, 1000, 4):
+            csl.add(value)
+
+        for value in range(start, 1000, 8):
+            csl.remove(value)
+
+    def reader():
+        try:
+            for _ in range(200):
+                length = len(csl)
+
+                if length:
+                    csl[length // 2]
+
+                list(csl.irange(100, 200))
+                csl.bisect_left(500)
+        except IndexError:
+            pass
+        except Exception as exc:  # pragma: no cover
+            errors.append(exc)
+
+    threads = [threading.Thread(target=writer, args=(start,)) for start in range(4)]
+    threads += [threading.Thread(target=reader) for _ in range(4)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert list(csl) == [value for value in range(1000) if value % 8 >= 4]
+    csl._check()
+
+
+def test_dict():
+    csd = ConcurrentSortedDict(zip(range(10), range(10)))
+    assert csd.key is None
+    assert len(csd) == 10
+    assert 5 in csd
+    assert csd[5] == 5
+    assert csd.get(20, -1) == -1
+    csd[10] = 10
+    del csd[0]
+    assert csd.setdefault(11, 11) == 11
+    csd.update({12: 12})
+    assert csd.pop(12) == 12
+    assert csd.popitem() == (11, 11)
+    assert csd.peekitem(0) == (1, 1)
+    assert list(csd.keys()) == list(range(1, 11))
+    assert list(csd.values()) == list(range(1, 11))
+    assert list(csd.items()) == [(val, val) for val in range(1, 11)]
+    assert csd.bisect_left(5) == 4
+    assert csd.index(5) == 4
+    assert list(csd.irange(3, 5)) == [3, 4, 5]
+    assert list(csd.islice(0, 2)) == [1, 2]
+    assert list(csd.irange_items(3, 4)) == [(3, 3), (4, 4)]
+    assert list(csd.irange_values(3, 4)) == [3, 4]
+    assert list(csd.islice_items(0, 1)) == [(1, 1)]
+    assert list(csd.islice_values(0, 1)) == [1]
+    csd.delete_range(1, 3)
+    assert csd.pop_range(4, 5) == [(4, 4), (5, 5)]
+    copy = csd.copy()
+    assert isinstance(copy, SortedDict)
+    assert list(copy) == [6, 7, 8, 9, 10]
+    assert repr(csd) == (
+        'ConcurrentSortedDict(SortedDict({6: 6, 7: 7, 8: 8, 9: 9, 10: 10}))'
+    )
+    csd.clear()
+    assert not len(csd)
+    csd._check()
+
+
+def test_dict_snapshot():
+    csd = ConcurrentSortedDict(zip(range(10), range(10)))
+    items = csd.items()
+    keys = iter(csd)
+    values = csd.irange_values(3, 5)
+    snapshot = csd.snapshot()
+    csd[3] = 30
+    del csd[4]
+    assert type(snapshot) is SortedDict
+    assert list(snapshot.items()) == [(val, val) for val in range(10)]
+    assert list(keys) == list(range(10))
+    assert list(values) == [3, 4, 5]
+    assert items[3] == (3, 30)
+    assert len(items) == 9
+    assert (3, 30) in items
+
+
+def test_dict_views():
+    csd = ConcurrentSortedDict(zip(range(1000), range(1000)))
+    csd._list._reset(7)
+    items = iter(csd.items())
+    values = reversed(csd.values())
+    keys = reversed(csd.keys())
+    del csd[500]
+    csd[998] = -1
+    expected = [(val, val) for val in range(1000) if val != 500]
+    expected[-2] = (998, -1)
+    assert list(items) == expected
+    assert list(values) == [val for key, val in reversed(expected)]
+    assert list(keys) == list(reversed(range(1000)))
+    assert list(csd.keys()) == [key for key, _ in expected]
+    assert csd.keys()[-1] == 999
+    assert csd.values()[-2] == -1
+    del csd.keys()[:10]
+    del csd.items()[0]
+    del csd.values()[-1]
+    assert list(csd.items()) == expected[11:-1]
+    csd._check()
+
+
+def test_dict_colocated_views():
+    class ConcurrentSortedColocatedDict(ConcurrentSortedDict):
+        def _new_dict(self, *args, **kwargs):
+            return SortedColocatedDict(*args, **kwargs)
+
+    csd = ConcurrentSortedColocatedDict(zip(range(1000), range(1000)))
+    assert isinstance(csd.copy(), SortedColocatedDict)
+    csd._list._reset(7)
+    items = iter(csd.items())
+    values = reversed(csd.values())
+    csd[998] = -1
+    del csd[500]
+    csd.update(zip(range(1000, 1100), range(1000, 1100)))
+    assert list(items) == [(val, val) for val in range(1000)]
+    assert list(values) == list(reversed(range(1000)))
+    assert csd.values()[997] == -1
+    assert list(reversed(csd.items()))[1] == (1098, 1098)
+    csd._check()
+
+
+def test_dict_batch():
+    csd = ConcurrentSortedDict(negate)
+
+    with csd.write() as sd:
+        sd.update(zip(range(10), range(10)))
+
+    with csd.read() as sd:
+        assert list(sd) == list(range(9, -1, -1))
@@ -0,0 +1,204 @@
+import pickle
+
+from sortedcontainers import FrozenSortedDict, FrozenSortedList, FrozenSortedSet
+import pytest
+
+
+def negate(value):
+    return -value
+
+
+def modulo(value):
+    return value % 10
+
+
+def test_list():
+    fsl = FrozenSortedList(range(100), key=negate)
+    assert fsl.key is negate
+    assert len(fsl) == 100
+    assert 5 in fsl
+    assert fsl[0] == 99
+    assert fsl[:2] == [99, 98]
+    assert fsl.bisect_left(90) == 9
+    assert fsl.bisect_right(90) == 10
+    assert fsl.bisect(90) == 10
+    assert fsl.count(90) == 1
+    assert fsl.index(90) == 9
+    assert list(fsl.irange(10, 8)) == [10, 9, 8]
+    assert list(fsl.islice(0, 2)) == [99, 98]
+    assert list(reversed(fsl))[:2] == [0, 1]
+    assert repr(fsl).endswith(f'key={negate!r})')
+    fsl._check()
+
+
+def test_list_versions():
+    fsl = FrozenSortedList(range(1000))
+    fsl._list._reset(10)
+    versions = [fsl]
+
+    for value in range(0, 1000, 7):
+        versions.append(versions[-1].discard(value))
+        versions.append(versions[-1].add(value + 0.5))
+
+    assert fsl == list(range(1000))
+    assert versions[2] == [0.5] + list(range(1, 1000))
+
+    for version in versions:
+        version._check()
+
+    last = versions[-1]
+    assert len(last) == 1000
+    assert sum(1 for value in last if value % 1) == len(range(0, 1000, 7))
+
+
+def test_list_shared():
+    fsl = FrozenSortedList(range(100))
+    fsl._list._reset(10)
+    version = fsl.add(55)
+    shared = [one is two for one, two in zip(fsl._list._lists, version._list._lists)]
+    assert shared.count(False) == 1
+    assert '_shared' not in vars(fsl._list)
+    assert '_shared' not in vars(version._list)
+
+
+def test_list_change():
+    fsl = FrozenSortedList([1, 2, 3])
+    assert fsl.update([]) is fsl
+    assert fsl.update([5, 4]) == [1, 2, 3, 4, 5]
+    assert fsl.discard(0) is fsl
+    assert fsl.remove(2) == [1, 3]
+
+    with pytest.raises(ValueError):
+        fsl.remove(0)
+
+    assert fsl == [1, 2, 3]
+    assert fsl != [1, 2]
+    assert fsl != 'abc'
+    assert fsl.__eq__(None) is NotImplemented
+
+
+def test_list_hash():
+    fsl = FrozenSortedList([3, 1, 2])
+    assert hash(fsl) == hash(FrozenSortedList([1, 2, 3]))
+    assert {fsl: 1}[FrozenSortedList([1, 2, 3])] == 1
+
+
+def test_list_pickle():
+    fsl = FrozenSortedList(range(10), key=negate)
+    copy = pickle.loads(pickle.dumps(fsl))
+    assert copy == fsl
+    assert copy.key is negate
+
+
+def test_set():
+    fss = FrozenSortedSet([3, 1, 2, 1, 3])
+    assert fss == {1, 2, 3}
+    assert list(fss) == [1, 2, 3]
+    assert fss.add(2) is fss
+    assert list(fss.add(0)) == [0, 1, 2, 3]
+    assert fss.update([2, 3]) is fss
+    assert list(fss.update([5, 4, 4])) == [1, 2, 3, 4, 5]
+    assert fss.count(1) == 1
+    assert fss.count(0) == 0
+    assert fss <= {1, 2, 3, 4}
+    assert fss < {1, 2, 3, 4}
+    assert fss >= {1}
+    assert fss > {1}
+    assert repr(fss) == 'FrozenSortedSet([1, 2, 3])'
+    fss._check()
+
+
+def test_set_operations():
+    fss = FrozenSortedSet(range(10), key=negate)
+    union = fss | {10}
+    assert isinstance(union, FrozenSortedSet)
+    assert union.key is negate
+    assert list(union) == list(range(10, -1, -1))
+    assert list(fss & {1, 2}) == [2, 1]
+    assert list(fss - set(range(8))) == [9, 8]
+
+
+def test_set_key():
+    fss = FrozenSortedSet([1, 11, 1, 21, 11], key=modulo)
+    assert len(fss) == 3
+    assert len(fss.update([31, 21])) == 4
+    fss._check()
+
+
+def test_set_hash():
+    fss = FrozenSortedSet('abc')
+    assert hash(fss) == hash(FrozenSortedSet('cba'))
+    assert hash(fss) == hash(frozenset('abc'))
+
+
+def test_dict():
+    fsd = FrozenSortedDict(zip(range(10), range(10)))
+    assert fsd.key is None
+    assert len(fsd) == 10
+    assert 5 in fsd
+    assert 10 not in fsd
+    assert fsd[5] == 5
+    assert fsd.get(10) is None
+
+    with pytest.raises(KeyError):
+        fsd[10]
+
+    assert list(fsd) == list(range(10))
+    assert list(reversed(fsd)) == list(range(9, -1, -1))
+    assert list(fsd.items()) == [(val, val) for val in range(10)]
+    assert list(fsd.values()) == list(range(10))
+    assert (5, 5) in fsd.items()
+    assert fsd.peekitem() == (9, 9)
+    assert fsd.peekitem(0) == (0, 0)
+    assert fsd.bisect_left(5) == 5
+    assert fsd.bisect_right(5) == 6
+    assert fsd.bisect(5) == 6
+    assert fsd.index(5) == 5
+    assert list(fsd.irange(3, 5)) == [3, 4, 5]
+    assert list(fsd.islice(0, 2)) == [0, 1]
+    assert fsd == dict(zip(range(10), range(10)))
+    fsd._check()
+
+
+def test_dict_change():
+    fsd = FrozenSortedDict(str.upper, a=1, b=2)
+    assert fsd.key is str.upper
+    version = fsd.set('c', 3).set('a', 0)
+    assert version == {'a': 0, 'b': 2, 'c': 3}
+    assert fsd == {'a': 1, 'b': 2}
+    assert fsd.discard('z') is fsd
+    assert fsd.discard('a') == {'b': 2}
+    assert fsd.remove('b') == {'a': 1}
+
+    with pytest.raises(KeyError):
+        fsd.remove('z')
+
+    assert fsd.update() is fsd
+    assert fsd.update(c=3) == {'a': 1, 'b': 2, 'c': 3}
+    version._check()
+
+
+def test_dict_update():
+    fsd = FrozenSortedDict(zip(range(100), range(100)))
+    fsd._list._reset(10)
+    version = fsd.update({5: -5, 200: 200})
+    assert version[5] == -5
+    assert version[200] == 200
+    assert fsd[5] == 5
+    assert 200 not in fsd
+    shared = [one is two for one, two in zip(fsd._list._values, version._list._values)]
+    assert shared.count(False) == 2
+    version._check()
+    rebuilt = fsd.update(zip(range(50), range(50, 100)))
+    assert rebuilt[0] == 50
+    rebuilt._check()
+
+
+def test_dict_hash_pickle_repr():
+    fsd = FrozenSortedDict(negate, {1: 'a', 2: 'b'})
+    assert hash(fsd) == hash(FrozenSortedDict({2: 'b', 1: 'a'}))
+    copy = pickle.loads(pickle.dumps(fsd))
+    assert copy == fsd
+    assert copy.key is negate
+    assert list(copy) == [2, 1]
+    assert repr(fsd) == f"FrozenSortedDict({negate!r}, {{2: 'b', 1: 'a'}})"
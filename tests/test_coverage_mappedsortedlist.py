@@ -0,0 +1,193 @@
+import bisect
+import random
+from sortedcontainers import MappedSortedList
+import pytest
+
+
+def test_init(tmp_path):
+    path = str(tmp_path / 'values.dat')
+
+    with MappedSortedList(path) as msl:
+        assert msl.path == path
+        assert msl.dtype == 'q'
+        assert msl.capacity == MappedSortedList.DEFAULT_CAPACITY
+        assert len(msl) == 0
+        msl._check()
+
+    with MappedSortedList(path) as msl:
+        assert len(msl) == 0
+        msl._check()
+
+
+def test_init_errors(tmp_path):
+    path = str(tmp_path / 'values.dat')
+
+    with pytest.raises(ValueError):
+        MappedSortedList(path, dtype='u')
+
+    with pytest.raises(ValueError):
+        MappedSortedList(path, capacity=3)
+
+    with pytest.raises(ValueError):
+        MappedSortedList(path, dtype='i', capacity=5)
+
+    MappedSortedList(path, dtype='d', capacity=8).close()
+
+    with pytest.raises(ValueError):
+        MappedSortedList(path, dtype='q')
+
+    with pytest.raises(ValueError):
+        MappedSortedList(path, capacity=16)
+
+    other = tmp_path / 'other.dat'
+    other.write_bytes(b'\x00' * 128)
+
+    with pytest.raises(ValueError):
+        MappedSortedList(str(other))
+
+    other.write_bytes(b'short')
+
+    with pytest.raises(ValueError):
+        MappedSortedList(str(other))
+
+    assert other.read_bytes() == b'short'
+
+    other.write_bytes(b'')
+
+    with MappedSortedList(str(other), dtype='i', capacity=8) as msl:
+        assert msl.dtype == 'i'
+        assert msl.capacity == 8
+
+
+def test_add_discard(tmp_path):
+    random.seed(0)
+    path = str(tmp_path / 'values.dat')
+    msl = MappedSortedList(path, capacity=8)
+    values = []
+
+    for _ in range(2000):
+        if values and random.random() < 0.4:
+            value = random.choice(values)
+            values.remove(value)
+            msl.discard(value)
+        else:
+            value = random.randrange(500)
+            bisect.insort(values, value)
+            msl.add(value)
+
+        msl._check()
+
+    assert list(msl) == values
+    msl.discard(1000)
+    msl.discard(-1)
+
+    with pytest.raises(ValueError):
+        msl.remove(1000)
+
+    msl.remove(values[0])
+    del values[0]
+    assert list(msl) == values
+
+    while values:
+        msl.remove(values.pop())
+
+    assert len(msl) == 0
+    msl.discard(0)
+    msl._check()
+    msl.close()
+    msl.close()
+
+
+def test_reopen(tmp_path):
+    random.seed(0)
+    path = str(tmp_path / 'values.dat')
+    values = sorted(random.random() for _ in range(1000))
+
+    with MappedSortedList(path, dtype='d', capacity=16) as msl:
+        msl.update(values)
+
+    with MappedSortedList(path) as msl:
+        assert msl.dtype == 'd'
+        assert msl.capacity == 16
+        assert list(msl) == values
+        msl._check()
+
+        for value in values[::2]:
+            msl.remove(value)
+
+    with MappedSortedList(path, dtype='d') as msl:
+        assert list(msl) == values[1::2]
+        msl._check()
+
+
+def test_lookup(tmp_path):
+    path = str(tmp_path / 'values.dat')
+    values = sorted(list(range(0, 200, 2)) * 3)
+
+    with MappedSortedList(path, capacity=8) as msl:
+        msl.update(values)
+
+        for value in range(-1, 202):
+            assert msl.bisect_left(value) == bisect.bisect_left(values, value)
+            assert msl.bisect_right(value) == bisect.bisect_right(values, value)
+            assert msl.count(value) == values.count(value)
+            assert (value in msl) == (value in values)
+
+        for index in range(-len(values), len(values)):
+            assert msl[index] == values[index]
+
+        assert msl[10:50] == values[10:50]
+        assert msl[::7] == values[::7]
+        assert msl[50:10:-3] == values[50:10:-3]
+
+        with pytest.raises(IndexError):
+            msl[len(values)]
+
+        with pytest.raises(IndexError):
+            msl[-len(values) - 1]
+
+
+def test_empty(tmp_path):
+    path = str(tmp_path / 'values.dat')
+
+    with MappedSortedList(path) as msl:
+        assert msl.bisect_left(0) == 0
+        assert msl.bisect_right(0) == 0
+        assert 0 not in msl
+        assert list(msl) == []
+        assert list(msl.irange(0, 10)) == []
+
+
+def test_iterate(tmp_path):
+    path = str(tmp_path / 'values.dat')
+    values = list(range(100))
+
+    with MappedSortedList(path, capacity=8) as msl:
+        msl.update(values)
+        assert list(reversed(msl)) == values[::-1]
+        assert list(msl.islice(5, 50)) == values[5:50]
+        assert list(msl.islice(5, 50, reverse=True)) == values[5:50][::-1]
+        assert list(msl.islice(50, 5)) == []
+        assert list(msl.irange(10, 20)) == values[10:21]
+        assert list(msl.irange(10, 20, (False, False))) == values[11:20]
+        assert list(msl.irange(maximum=5, reverse=True)) == values[5::-1]
+        assert list(msl.irange(minimum=95)) == values[95:]
+
+
+def test_repr(tmp_path):
+    path = str(tmp_path / 'values.dat')
+
+    with MappedSortedList(path, dtype='i', capacity=8) as msl:
+        msl.update([3, 1, 2])
+        assert repr(msl) == "MappedSortedList([1, 2, 3], dtype='i')"
+
+
+def test_check(tmp_path):
+    path = str(tmp_path / 'values.dat')
+
+    with MappedSortedList(path, capacity=8) as msl:
+        msl.update(range(100))
+        msl._len = 5
+
+        with pytest.raises(AssertionError):
+            msl._check()
@@ -0,0 +1,133 @@
+import random
+
+from sortedcontainers import SortedPriorityQueue
+import pytest
+
+
+def test_init():
+    spq = SortedPriorityQueue()
+    assert len(spq) == 0
+    assert list(spq) == []
+    spq = SortedPriorityQueue([(3, 'c'), (1, 'a'), (2, 'b')])
+    assert list(spq) == [(1, 'a'), (2, 'b'), (3, 'c')]
+    assert 0 in spq
+    assert 3 not in spq
+    assert repr(spq) == "SortedPriorityQueue([(1, 'a'), (2, 'b'), (3, 'c')])"
+    spq._check()
+
+
+def test_peek_pop():
+    spq = SortedPriorityQueue()
+
+    with pytest.raises(IndexError):
+        spq.peek_min()
+
+    with pytest.raises(IndexError):
+        spq.peek_max()
+
+    with pytest.raises(IndexError):
+        spq.pop_min()
+
+    with pytest.raises(IndexError):
+        spq.pop_max()
+
+    for value in range(10):
+        spq.push(value % 3, value)
+
+    assert spq.peek_min() == (0, 0)
+    assert spq.peek_max() == (2, 8)
+    assert spq.pop_min() == (0, 0)
+    assert spq.pop_min() == (0, 3)
+    assert spq.pop_max() == (2, 8)
+    assert len(spq) == 7
+    spq._check()
+
+
+def test_handles():
+    spq = SortedPriorityQueue()
+    handles = [spq.push(1, item) for item in 'abc']
+    assert spq.priority(handles[1]) == 1
+    spq.update_priority(handles[2], 0)
+    assert spq.peek_min() == (0, 'c')
+    spq.update_priority(handles[2], 1)
+    assert list(spq) == [(1, 'a'), (1, 'b'), (1, 'c')]
+    assert spq.remove(handles[1]) == (1, 'b')
+    assert handles[1] not in spq
+
+    with pytest.raises(KeyError):
+        spq.remove(handles[1])
+
+    with pytest.raises(KeyError):
+        spq.update_priority(handles[1], 0)
+
+    spq.clear()
+    assert not len(spq)
+    spq._check()
+
+
+def test_pushpop():
+    spq = SortedPriorityQueue()
+    assert spq.pushpop(1, 'a') == (1, 'a')
+    assert not len(spq)
+    spq.push(1, 'a')
+    assert spq.pushpop(0, 'z') == (0, 'z')
+    assert spq.pushpop(1, 'b') == (1, 'a')
+    assert spq.pushpop(5, 'c') == (1, 'b')
+    assert list(spq) == [(5, 'c')]
+    spq._check()
+
+
+def test_pushpop_sublists():
+    spq = SortedPriorityQueue((value, value) for value in range(1000))
+    spq._list._reset(10)
+    spq._list._build_index()
+    index = list(spq._list._index)
+    assert spq.pushpop(5.5, 'a') == (0, 0)
+    assert spq._list._index == index
+    assert spq.pushpop(500, 'b') == (1, 1)
+    assert spq.pushpop(-1, 'c') == (-1, 'c')
+    assert list(spq)[:5] == [(2, 2), (3, 3), (4, 4), (5, 5), (5.5, 'a')]
+    spq._check()
+
+
+def test_pushpop_shared():
+    spq = SortedPriorityQueue((value, value) for value in range(100))
+    spq._list._reset(10)
+    snapshot = spq._list.snapshot()
+    spq.pushpop(3.5, 'a')
+    assert list(snapshot)[:5] == [(value, value, value) for value in range(5)]
+    spq._check()
+
+
+def test_random():
+    random.seed(0)
+    spq = SortedPriorityQueue()
+    spq._list._reset(4)
+    expected = {}
+
+    for _ in range(1000):
+        choice = random.random()
+        priority = random.randrange(100)
+
+        if choice < 0.4:
+            handle = spq.push(priority, priority)
+            expected[handle] = priority
+        elif choice < 0.6:
+            result = spq.pushpop(priority, priority)
+            values = sorted(list(expected.values()) + [priority])
+            assert result[0] == values[0]
+            handles = set(spq._entries)
+            added = handles.difference(expected)
+            expected = {handle: expected.get(handle, priority) for handle in handles}
+            assert len(added) <= 1
+        elif choice < 0.8 and expected:
+            handle = random.choice(list(expected))
+            spq.update_priority(handle, priority)
+            expected[handle] = priority
+        elif expected:
+            handle = random.choice(list(expected))
+            assert spq.remove(handle)[0] == expected.pop(handle)
+
+        assert sorted(expected.values()) == [prio for prio, _ in spq]
+
+    spq._check()
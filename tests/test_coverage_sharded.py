@@ -0,0 +1,251 @@
+from operator import neg
+import random
+
+from sortedcontainers import SortedList
+from sortedcontainers.sharded import ShardedSortedList
+import pytest
+
+
+@pytest.fixture
+def ssl():
+    with ShardedSortedList(range(100), shards=4) as ssl:
+        yield ssl
+
+
+def test_init():
+    with ShardedSortedList(shards=2, context='fork') as ssl:
+        assert ssl.shards == 2
+        assert ssl.key is None
+        assert len(ssl) == 0
+        assert list(ssl) == []
+        ssl._check()
+
+    with pytest.raises(ValueError):
+        ShardedSortedList(shards=0)
+
+
+def test_shards(ssl):
+    assert ssl._lens == [25, 25, 25, 25]
+    assert ssl._boundaries == [25, 50, 75]
+    assert list(ssl) == list(range(100))
+    assert list(reversed(ssl)) == list(range(99, -1, -1))
+    ssl._check()
+
+
+def test_lookup(ssl):
+    assert len(ssl) == 100
+    assert 60 in ssl
+    assert 100 not in ssl
+    assert ssl[60] == 60
+    assert ssl[-1] == 99
+    assert ssl[10:70] == list(range(10, 70))
+    assert ssl[::10] == list(range(0, 100, 10))
+
+    with pytest.raises(IndexError):
+        ssl[100]
+
+    assert ssl.bisect_left(60) == 60
+    assert ssl.bisect_right(60) == 61
+    assert ssl.bisect(60) == 61
+    assert ssl.count(60) == 1
+    assert ssl.index(60) == 60
+
+    with pytest.raises(ValueError):
+        ssl.index(100)
+
+
+def test_iterators(ssl):
+    assert list(ssl.irange(20, 80)) == list(range(20, 81))
+    assert list(ssl.irange(20, 80, reverse=True)) == list(range(80, 19, -1))
+    assert list(ssl.irange(inclusive=(False, False))) == list(range(100))
+    assert list(ssl.irange(80, 20)) == []
+    assert list(ssl.islice(20, 80)) == list(range(20, 80))
+    assert list(ssl.islice(20, 80, reverse=True)) == list(range(79, 19, -1))
+    assert list(ssl.islice(-5)) == list(range(95, 100))
+
+
+def test_mutations(ssl):
+    ssl.add(50)
+    assert ssl.count(50) == 2
+    ssl.discard(50)
+    ssl.discard(100)
+    ssl.remove(0)
+
+    with pytest.raises(ValueError):
+        ssl.remove(0)
+
+    assert ssl.pop() == 99
+    assert ssl.pop(0) == 1
+    ssl.update([0, 1, 99, 100, 50])
+    ssl.update([])
+    assert list(ssl) == sorted(list(range(101)) + [50])
+    ssl._check()
+    ssl.clear()
+    assert len(ssl) == 0
+    assert ssl._boundaries == []
+    ssl.update(range(10))
+    assert list(ssl) == list(range(10))
+    ssl._check()
+
+
+def test_delitem(ssl):
+    expected = SortedList(range(100))
+    del ssl[10]
+    del expected[10]
+    del ssl[-1]
+    del expected[-1]
+
+    with pytest.raises(IndexError):
+        del ssl[100]
+
+    for index in [
+        slice(20, 60),
+        slice(5, 70, 3),
+        slice(60, 2, -4),
+        slice(None, None, -7),
+        slice(30, 10),
+    ]:
+        del ssl[index]
+        del expected[index]
+        assert list(ssl) == list(expected)
+        ssl._check()
+
+    del ssl[:]
+    assert len(ssl) == 0
+    ssl._check()
+
+
+def test_key_lookup(ssl):
+    assert list(ssl.irange_key(20, 30, (False, True))) == list(range(21, 31))
+    assert list(ssl.irange_key(70, reverse=True)) == list(range(99, 69, -1))
+    assert ssl.bisect_key_left(60) == 60
+    assert ssl.bisect_key_right(60) == 61
+    assert ssl.bisect_key(60) == 61
+
+    with ShardedSortedList(range(100), key=neg, shards=3) as ssl:
+        assert list(ssl.irange_key(-30, -20)) == list(range(30, 19, -1))
+        assert ssl.bisect_key_left(-60) == 39
+        assert ssl.bisect_key_right(-60) == 40
+
+
+def test_copy(ssl):
+    ssl._load = 10
+    ssl.add(50)
+
+    with ssl.copy() as copy:
+        assert copy._lens == ssl._lens
+        assert copy._boundaries == ssl._boundaries
+        assert copy._load == 10
+        assert copy == ssl
+        copy.add(0)
+        assert copy != ssl
+        assert ssl == sorted(list(range(100)) + [50])
+        copy._check()
+
+
+def test_eq(ssl):
+    assert ssl == list(range(100))
+    assert ssl == SortedList(range(100))
+    assert SortedList(range(100)) == ssl
+    assert ssl != list(range(99))
+    assert ssl != list(range(1, 101))
+    assert ssl != set(range(100))
+
+
+def test_pipeline(ssl):
+    ssl._window = 4
+
+    for value in range(100, 110):
+        ssl.add(value)
+
+    assert len(ssl._pending[3]) == 1
+    assert len(ssl._buffers[3]) == 2
+    ssl.discard(0)
+    ssl.discard(0)
+    assert len(ssl) == 109
+    assert list(ssl) == list(range(1, 110))
+    ssl._check()
+
+
+def test_pipeline_error():
+    with ShardedSortedList(range(10), shards=1) as ssl:
+        ssl.add('a')
+        ssl.add(10)
+
+        with pytest.raises(TypeError):
+            len(ssl)
+
+        assert len(ssl) == 11
+        assert list(ssl) == list(range(11))
+
+
+def test_rebalance():
+    with ShardedSortedList(range(100), shards=4) as ssl:
+        ssl._load = 10
+        ssl.update(range(100, 200))
+        ssl.update(range(200, 300))
+        assert max(ssl._lens) <= 2 * len(ssl) // 4 + 10
+        assert list(ssl) == list(range(300))
+        ssl._check()
+
+        for value in range(200):
+            ssl.remove(value)
+
+        ssl.rebalance()
+        assert ssl._lens == [25, 25, 25, 25]
+        assert list(ssl) == list(range(200, 300))
+        ssl._check()
+
+
+def test_rebalance_runs():
+    with ShardedSortedList([1] * 50 + [2] * 50, shards=4) as ssl:
+        assert sorted(ssl._lens) == [0, 0, 50, 50]
+        assert list(ssl) == [1] * 50 + [2] * 50
+        ssl._check()
+
+
+def test_key():
+    values = [random.random() for _ in range(500)]
+
+    with ShardedSortedList(values, key=neg, shards=3) as ssl:
+        ssl._load = 10
+        assert ssl.key is neg
+        expected = SortedList(values, key=neg)
+        assert list(ssl) == list(expected)
+
+        for value in values[:100]:
+            ssl.add(value + 1)
+            expected.add(value + 1)
+
+        assert list(ssl) == list(expected)
+        assert ssl.bisect_left(0.5) == expected.bisect_left(0.5)
+        ssl._check()
+
+
+def test_repr():
+    with ShardedSortedList([2, 1], shards=2) as ssl:
+        assert repr(ssl) == 'ShardedSortedList([1, 2], shards=2)'
+
+
+def test_random():
+    random.seed(0)
+    expected = SortedList()
+
+    with ShardedSortedList(shards=3) as ssl:
+        ssl._load = 5
+
+        for _ in range(500):
+            value = random.randrange(100)
+
+            if random.random() < 0.6:
+                ssl.add(value)
+                expected.add(value)
+            else:
+                ssl.discard(value)
+                expected.discard(value)
+
+        assert list(ssl) == list(expected)
+        ssl._check()
+        ssl.rebalance()
+        assert list(ssl) == list(expected)
+        ssl._check()
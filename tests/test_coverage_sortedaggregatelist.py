@@ -0,0 +1,211 @@
+import random
+from operator import add, attrgetter, neg
+from sortedcontainers import SortedAggregateList
+import pytest
+
+
+def test_init():
+    sal = SortedAggregateList()
+    assert sal.key is None
+    assert sal.aggregate is add
+    assert sal.project is None
+    sal._check()
+
+    sal = SortedAggregateList(range(10000), aggregate=max, project=neg)
+    assert sal.aggregate is max
+    assert sal.project is neg
+    assert list(sal) == list(range(10000))
+    sal._check()
+
+
+def test_key():
+    with pytest.raises(TypeError):
+        SortedAggregateList(key=neg)
+
+
+def test_range_aggregate():
+    sal = SortedAggregateList(range(1000))
+    sal._reset(7)
+
+    for start in range(0, 1000, 37):
+        for stop in range(start, 1000, 53):
+            expected = sum(range(start, stop)) if start < stop else None
+            assert sal.range_aggregate(start, stop) == expected
+
+    assert sal.range_aggregate() == sum(range(1000))
+    assert sal.range_aggregate(-10) == sum(range(990, 1000))
+    assert sal.range_aggregate(500, 400, initial=0) == 0
+    sal._check()
+
+
+def test_range_aggregate_empty():
+    sal = SortedAggregateList()
+    assert sal.range_aggregate() is None
+    assert sal.range_aggregate(initial=0) == 0
+    assert sal.irange_aggregate(1, 2, initial=0) == 0
+
+
+def test_range_aggregate_single():
+    sal = SortedAggregateList([5])
+    assert sal.range_aggregate() == 5
+    sal._check()
+
+
+def test_irange_aggregate():
+    sal = SortedAggregateList(range(100), aggregate=min, project=neg)
+    sal._reset(7)
+
+    assert sal.irange_aggregate() == -99
+    assert sal.irange_aggregate(10, 20) == -20
+    assert sal.irange_aggregate(10, 20, inclusive=(True, False)) == -19
+    assert sal.irange_aggregate(10, 20, inclusive=(False, True)) == -20
+    assert sal.irange_aggregate(maximum=50) == -50
+    assert sal.irange_aggregate(minimum=50) == -99
+    assert sal.irange_aggregate(200, 300) is None
+    sal._check()
+
+
+def test_mutations():
+    random.seed(0)
+    sal = SortedAggregateList(aggregate=max, project=attrgetter('real'))
+    sal._reset(7)
+    values = []
+
+    for _ in range(2000):
+        if values and random.random() < 0.4:
+            value = values.pop(random.randrange(len(values)))
+            sal.remove(value)
+        else:
+            value = random.randrange(1000)
+            values.append(value)
+            sal.add(value)
+
+        values.sort()
+        start = random.randrange(len(values) + 1)
+        stop = random.randrange(len(values) + 1)
+        expected = max(values[start:stop]) if start < stop else None
+        assert sal.range_aggregate(start, stop) == expected
+        sal._check()
+
+
+def test_update():
+    sal = SortedAggregateList(range(100))
+    sal._reset(7)
+    assert sal.range_aggregate(10, 90) == sum(range(10, 90))
+    sal.update(range(100))
+    assert sal.range_aggregate(10, 90) == sum(sorted(2 * list(range(100)))[10:90])
+    del sal[10:20]
+    sal._check()
+    sal.clear()
+    assert sal.range_aggregate() is None
+    sal._check()
+
+
+def test_delete_range():
+    sal = SortedAggregateList(range(1000))
+    sal._reset(7)
+    assert sal.range_aggregate() == sum(range(1000))
+    sal._delete_range(*sal._irange_loc(100, 899, (True, True)))
+    assert sal.range_aggregate() == sum(range(100)) + sum(range(900, 1000))
+    assert sal.range_aggregate(50, 150) == sum(range(50, 100)) + sum(range(900, 950))
+    sal._check()
+
+
+def test_copy():
+    sal = SortedAggregateList(range(100), aggregate=max, project=neg)
+    other = sal.copy()
+    assert other == sal
+    assert other.aggregate is max
+    assert other.project is neg
+    assert other.range_aggregate() == 0
+
+
+def test_add_mul():
+    sal = SortedAggregateList(range(10), aggregate=max)
+    assert (sal + [20]).range_aggregate() == 20
+    assert (sal * 2).aggregate is max
+    assert len(sal * 2) == 20
+
+
+def test_pickle():
+    import pickle
+
+    sal = SortedAggregateList(range(100), aggregate=max, project=neg)
+    other = pickle.loads(pickle.dumps(sal))
+    assert other == sal
+    assert other.aggregate is max
+    assert other.project is neg
+
+
+def test_repr():
+    sal = SortedAggregateList(range(3), aggregate=max, project=neg)
+    assert repr(sal) == (
+        'SortedAggregateList([0, 1, 2], aggregate=<built-in function max>,'
+        ' project=<built-in function neg>)'
+    )
+
+
+def test_snapshot():
+    random.seed(0)
+    sal = SortedAggregateList(range(100))
+    sal._reset(7)
+    snapshots = []
+
+    for step in range(400):
+        if step % 40 == 0:
+            snapshots.append((sal.snapshot(), list(sal)))
+
+        value = random.randrange(200)
+
+        if random.random() < 0.5:
+            sal.add(value)
+        else:
+            sal.discard(value)
+
+        if step % 100 == 50:
+            sal.update(range(0, 200, 3))
+            del sal[10:20]
+
+    sal._check()
+
+    for snapshot, values in snapshots:
+        assert type(snapshot) is type(sal)
+        assert list(snapshot) == values
+        assert snapshot.range_aggregate() == sum(values)
+        snapshot._check()
+
+    values = list(sal)
+    snapshot = sal.snapshot()
+    snapshot.update(range(50))
+    del snapshot[:10]
+    snapshot._check()
+    assert list(sal) == values
+
+
+def test_popleft_popright():
+    sal = SortedAggregateList(range(100))
+    sal._reset(8)
+    assert sal.range_aggregate(0, 100) == sum(range(100))
+    assert sal.popleft(20) == list(range(20))
+    assert sal.popright(20) == list(range(99, 79, -1))
+    assert sal.range_aggregate(0, 100) == sum(range(20, 80))
+    sal._check()
+
+
+def test_popleft_trim():
+    sal = SortedAggregateList(range(200))
+    sal._reset(10)
+    assert sal.range_aggregate(0, 200) == sum(range(200))
+    assert sal.popleft(3) == [0, 1, 2]
+    assert sal.popright(3) == [199, 198, 197]
+    assert sal.range_aggregate(0, 200) == sum(range(3, 197))
+    sal._check()
+
+
+def test_discard_many():
+    sal = SortedAggregateList(range(100))
+    sal._reset(8)
+    assert sal.range_aggregate(0, 100) == sum(range(100))
+    sal.discard_many(range(0, 100, 2))
+    assert sal.range_aggregate(0, 100) == sum(range(1, 100, 2))
+    sal._check()
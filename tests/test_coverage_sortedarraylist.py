@@ -0,0 +1,325 @@
+import pickle
+import random
+from sortedcontainers import SortedArrayList
+import pytest
+
+
+def test_init():
+    sal = SortedArrayList()
+    assert sal.key is None
+    assert sal.typecode == 'q'
+    sal._check()
+
+    sal = SortedArrayList(range(10000), typecode='d')
+    assert sal.typecode == 'd'
+    assert list(sal) == list(range(10000))
+    sal._check()
+
+    with pytest.raises(ValueError):
+        SortedArrayList(typecode='z')
+
+
+def test_add():
+    random.seed(0)
+    sal = SortedArrayList()
+    sal._reset(7)
+    values = []
+
+    for val in range(1000):
+        value = random.randrange(-1000, 1000)
+        sal.add(value)
+        values.append(value)
+        sal._check()
+
+    assert list(sal) == sorted(values)
+
+
+def test_add_error():
+    sal = SortedArrayList()
+
+    with pytest.raises(TypeError):
+        sal.add(1.5)
+
+    assert len(sal) == 0
+    sal.update(range(100))
+
+    with pytest.raises(TypeError):
+        sal.add(50.5)
+
+    assert len(sal) == 100
+    sal._check()
+
+
+def test_update():
+    random.seed(0)
+    sal = SortedArrayList(typecode='d')
+    sal._reset(7)
+    values = []
+
+    for _ in range(20):
+        batch = [random.random() for _ in range(random.randrange(200))]
+        sal.update(batch)
+        values.extend(batch)
+        sal._check()
+
+    assert list(sal) == sorted(values)
+
+    with pytest.raises(TypeError):
+        sal.update(['a'] * len(sal))
+
+    assert len(sal) == len(values)
+    sal._check()
+
+
+def test_delete():
+    random.seed(0)
+    sal = SortedArrayList(range(1000))
+    sal._reset(7)
+
+    while sal:
+        del sal[random.randrange(len(sal))]
+        sal._check()
+
+    sal = SortedArrayList(range(1000))
+    sal._reset(7)
+
+    for val in range(0, 1000, 3):
+        sal.remove(val)
+        sal._check()
+
+    assert list(sal) == [val for val in range(1000) if val % 3]
+
+
+def test_getitem():
+    sal = SortedArrayList(range(100))
+    sal._reset(7)
+    assert sal[5] == 5
+    assert sal[-1] == 99
+    assert sal[2:5] == [2, 3, 4]
+    assert sal[10:50] == list(range(10, 50))
+    assert sal[50:10:-1] == list(range(50, 10, -1))
+    assert sal[:] == list(range(100))
+    assert sal[::10] == list(range(0, 100, 10))
+
+
+def test_bisect_irange():
+    sal = SortedArrayList(range(0, 200, 2))
+    sal._reset(7)
+    assert sal.bisect_left(51) == 26
+    assert sal.bisect_right(50) == 26
+    assert sal.count(50) == 1
+    assert sal.index(50) == 25
+    assert 50 in sal
+    assert 51 not in sal
+    assert list(sal.irange(10, 20)) == [10, 12, 14, 16, 18, 20]
+    assert list(sal.islice(0, 3)) == [0, 2, 4]
+    assert sal.bisect_left_many([5, 51]) == [3, 26]
+
+
+def test_segments():
+    sal = SortedArrayList(range(100))
+    sal._reset(7)
+    segments = list(sal._segments(5, 60))
+    assert all(isinstance(segment, memoryview) for segment in segments)
+    assert sum((segment.tolist() for segment in segments), []) == list(range(5, 60))
+
+
+def test_buffers():
+    sal = SortedArrayList(range(100))
+    sal._reset(7)
+    views = sal.buffers()
+    assert len(views) == len(sal._lists)
+    assert sum((view.tolist() for view in views), []) == list(range(100))
+    assert all(view.readonly for view in views)
+
+    with pytest.raises(BufferError):
+        sal.add(50)
+
+    with pytest.raises(BufferError):
+        sal.remove(50)
+
+    assert len(sal) == 100
+    sal._check()
+
+    for view in views:
+        view.release()
+
+    sal.add(50)
+    sal.remove(50)
+    sal._check()
+
+
+def test_buffers_merge():
+    sal = SortedArrayList(range(100))
+    sal._reset(8)
+    view = sal.buffers()[0]
+
+    for val in range(8, 13):
+        sal.remove(val)
+        sal._check()
+
+    assert view.tolist() == list(range(8))
+    assert list(sal) == list(range(8)) + list(range(13, 100))
+
+
+def test_delete_range():
+    sal = SortedArrayList(range(100))
+    sal._reset(8)
+    views = sal.buffers()
+    loc = sal._irange_loc(5, 50, (True, False))
+    sal._delete_range(*loc)
+    sal._check()
+    assert list(sal) == list(range(5)) + list(range(50, 100))
+    assert sum((view.tolist() for view in views), []) == list(range(100))
+    assert all(sublist.typecode == 'q' for sublist in sal._lists)
+    assert sal._maxes.typecode == 'q'
+
+
+def test_islice_buffer():
+    sal = SortedArrayList(range(100))
+    sal._reset(7)
+
+    for start in range(0, 100, 9):
+        for stop in range(start, 101, 11):
+            views = sal.islice_buffer(start, stop)
+            values = sum((view.tolist() for view in views), [])
+            assert values == list(range(start, stop))
+
+    assert sal.islice_buffer(50, 10) == []
+    views = sal.islice_buffer(-3)
+    assert sum((view.tolist() for view in views), []) == [97, 98, 99]
+
+
+def test_numpy():
+    numpy = pytest.importorskip('numpy')
+    arr = numpy.random.default_rng(0).random(10000)
+    sal = SortedArrayList.from_numpy(arr)
+    sal._check()
+    assert sal.typecode == 'd'
+    assert list(sal) == sorted(arr.tolist())
+    result = sal.to_numpy()
+    assert result.dtype == numpy.float64
+    assert result.tolist() == sorted(arr.tolist())
+    assert sal.to_numpy(100, 2000).tolist() == sal[100:2000]
+    sal = SortedArrayList.from_numpy(numpy.arange(100)[::-1], typecode='i')
+    assert sal.typecode == 'i'
+    assert list(sal) == list(range(100))
+
+
+def test_reset_auto():
+    class AutoSortedArrayList(SortedArrayList):
+        DEFAULT_LOAD_FACTOR = 4
+        MIN_AUTO_LOAD_FACTOR = 4
+
+    random.seed(0)
+    sal = AutoSortedArrayList(range(100))
+    sal._reset('auto')
+
+    for val in range(1000):
+        sal.add(random.randrange(1000))
+        sal._check()
+
+    assert sal._load == 16
+
+
+def test_copy():
+    sal = SortedArrayList(range(100), typecode='l')
+    that = sal.copy()
+    assert that == sal
+    assert that.typecode == 'l'
+    that._check()
+
+
+def test_add_mul():
+    sal = SortedArrayList(range(10), typecode='i')
+    that = sal + [5]
+    assert that.typecode == 'i'
+    assert list(that) == [0, 1, 2, 3, 4, 5, 5, 6, 7, 8, 9]
+    that = sal * 2
+    assert that.typecode == 'i'
+    assert list(that) == sorted(list(range(10)) * 2)
+    that._check()
+
+
+def test_pickle():
+    sal = SortedArrayList(range(100), typecode='d')
+    that = pickle.loads(pickle.dumps(sal))
+    assert that == sal
+    assert that.typecode == 'd'
+    that._check()
+
+
+def test_dump_load():
+    import io
+
+    sal = SortedArrayList(range(1000), typecode='i')
+    sal._reset(31)
+    fp = io.BytesIO()
+    sal.dump(fp)
+    fp.seek(0)
+    that = SortedArrayList.load(fp)
+    assert that == sal
+    assert that.typecode == 'i'
+    assert that._load == 31
+    assert all(sublist.typecode == 'i' for sublist in that._lists)
+    that._check()
+
+
+def test_repr():
+    sal = SortedArrayList([3, 1, 2])
+    assert repr(sal) == "SortedArrayList([1, 2, 3], typecode='q')"
+
+
+def test_snapshot():
+    random.seed(0)
+    sal = SortedArrayList(range(100))
+    sal._reset(7)
+    snapshots = []
+
+    for step in range(400):
+        if step % 40 == 0:
+            snapshots.append((sal.snapshot(), list(sal)))
+
+        value = random.randrange(200)
+
+        if random.random() < 0.5:
+            sal.add(value)
+        else:
+            sal.discard(value)
+
+        if step % 100 == 50:
+            sal.update(range(0, 200, 3))
+            del sal[10:20]
+
+    sal._check()
+
+    for snapshot, values in snapshots:
+        assert type(snapshot) is type(sal)
+        assert list(snapshot) == values
+        snapshot._check()
+
+    values = list(sal)
+    snapshot = sal.snapshot()
+    snapshot.update(range(50))
+    del snapshot[:10]
+    snapshot._check()
+    assert list(sal) == values
+
+
+def test_popleft_popright():
+    sal = SortedArrayList(range(100), typecode='q')
+    sal._reset(8)
+    assert sal.popleft() == [0]
+    assert sal.popleft(20) == list(range(1, 21))
+    assert sal.popright(20) == list(range(99, 79, -1))
+    assert list(sal) == list(range(21, 80))
+    sal._check()
+
+
+def test_discard_many():
+    sal = SortedArrayList(range(100), typecode='q')
+    sal._reset(8)
+    sal.discard_many(range(0, 100, 3))
+    sal.remove_many([1, 2])
+    assert list(sal) == [val for val in range(4, 100) if val % 3]
+    sal._check()
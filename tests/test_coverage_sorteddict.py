@@ -2,9 +2,10 @@ import platform
 import string
 import warnings
 
-from sortedcontainers import SortedDict
+from sortedcontainers import SortedColocatedDict, SortedDict, SortedSet
 import pytest
 import gc
+from sortedcontainers.sorteddict import SortedKeyValueList
 
 
 def negate(value):
@@ -189,6 +190,45 @@ def test_copy():
     assert len(dup) == 0
 
 
+def test_snapshot():
+    mapping = [(val, pos) for pos, val in enumerate(string.ascii_lowercase)]
+    temp = SortedDict(mapping)
+    temp._reset(4)
+    snapshot = temp.snapshot()
+    assert type(snapshot) is SortedDict
+    temp['a'] = -1
+    del temp['z']
+    temp['~'] = 26
+    assert snapshot == dict(mapping)
+    assert list(snapshot.items()) == mapping
+    assert snapshot.bisect_left('c') == 2
+    snapshot['~'] = 0
+    del snapshot['a']
+    assert temp['a'] == -1
+    assert list(temp)[-1] == '~'
+    temp._check()
+    snapshot._check()
+
+
+def test_snapshot_key():
+    temp = SortedDict(negate, zip(range(10), range(10)))
+    snapshot = temp.snapshot()
+    temp.clear()
+    assert list(snapshot.irange_key(-5, -3)) == [5, 4, 3]
+    snapshot._check()
+
+
+def test_snapshot_colocated():
+    temp = SortedColocatedDict(zip(range(10), range(10)))
+    snapshot = temp.snapshot()
+    assert type(snapshot) is SortedColocatedDict
+    temp[5] = 50
+    assert snapshot.values()[5] == 5
+    assert temp.values()[5] == 50
+    temp._check()
+    snapshot._check()
+
+
 def test_copy_copy():
     import copy
 
@@ -521,6 +561,88 @@ def test_items_view_index():
         items.index(('f', 100))
 
 
+def test_delete_range():
+    mapping = [(val, val) for val in range(1000)]
+    temp = SortedDict(mapping)
+    temp._reset(7)
+    temp.delete_range(100, 200)
+    temp.delete_range(300, 400, inclusive=(False, False))
+    temp.delete_range(2000)
+    temp.delete_range(maximum=10)
+    expected = [
+        val for val in range(11, 1000) if not (100 <= val <= 200 or 300 < val < 400)
+    ]
+    assert list(temp) == expected
+    assert all(temp[val] == val for val in expected)
+    temp._check()
+    temp.delete_range()
+    assert not temp
+    temp._check()
+
+
+def test_delete_many():
+    mapping = [(val, -val) for val in range(1000)]
+    temp = SortedDict(mapping)
+    temp._reset(7)
+    temp.delete_many(list(range(0, 1000, 3)) + [0, 2000])
+    expected = [val for val in range(1000) if val % 3]
+    assert list(temp) == expected
+    assert all(temp[val] == -val for val in expected)
+    temp._check()
+
+
+def test_colocated_delete_many():
+    mapping = [(val, -val) for val in range(1000)]
+    temp = SortedColocatedDict(negate, mapping)
+    temp._reset(7)
+    temp.delete_many(range(0, 1000, 3))
+    expected = [val for val in reversed(range(1000)) if val % 3]
+    assert list(temp) == expected
+    assert list(temp.values()) == [-val for val in expected]
+    temp._check()
+
+
+def test_pop_range():
+    mapping = [(val, -val) for val in range(1000)]
+    temp = SortedDict(negate, mapping)
+    temp._reset(7)
+    items = temp.pop_range(500, 100)
+    assert items == [(val, -val) for val in range(500, 99, -1)]
+    assert len(temp) == 1000 - 401
+    assert temp.pop_range(300, 200) == []
+    temp._check()
+
+
+def test_irange_items():
+    mapping = [(val, -val) for val in range(100)]
+    temp = SortedDict(mapping)
+    temp._reset(7)
+    assert list(temp.irange_items(10, 20)) == mapping[10:21]
+    assert list(temp.irange_items(10, 20, (False, False))) == mapping[11:20]
+    assert list(temp.irange_items(10, 20, reverse=True)) == mapping[20:9:-1]
+    assert list(temp.irange_items(200)) == []
+    assert list(temp.irange_values(90)) == [-val for val in range(90, 100)]
+    assert list(SortedDict().irange_items()) == []
+
+
+def test_irange_items_key():
+    mapping = [(val, str(val)) for val in range(100)]
+    temp = SortedDict(negate, mapping)
+    temp._reset(7)
+    assert list(temp.irange_items(20, 10)) == mapping[20:9:-1]
+    assert list(temp.irange_values(2, 0)) == ['2', '1', '0']
+
+
+def test_islice_items():
+    mapping = [(val, -val) for val in range(100)]
+    temp = SortedDict(mapping)
+    temp._reset(7)
+    assert list(temp.islice_items(10, 20)) == mapping[10:20]
+    assert list(temp.islice_items(-5, reverse=True)) == mapping[:94:-1]
+    assert list(temp.islice_values(stop=3)) == [0, -1, -2]
+    assert list(temp.islice_items(50, 10)) == []
+
+
 def test_pickle():
     import pickle
 
@@ -531,6 +653,230 @@ def test_pickle():
     assert alpha._key == beta._key
 
 
+def test_dump_load():
+    import io
+
+    alpha = SortedDict(negate, zip(range(1000), map(str, range(1000))))
+    alpha._reset(41)
+    fp = io.BytesIO()
+    alpha.dump(fp)
+    fp.seek(0)
+    beta = SortedDict.load(fp)
+    assert alpha == beta
+    assert list(alpha.items()) == list(beta.items())
+    assert beta.key is negate
+    assert beta._list._load == 41
+    beta._check()
+
+    fp = io.BytesIO()
+    SortedSet(range(10)).dump(fp)
+    fp.seek(0)
+    with pytest.raises(TypeError):
+        SortedDict.load(fp)
+
+
+def test_colocated_init():
+    temp = SortedColocatedDict()
+    temp._check()
+    temp = SortedColocatedDict(negate, zip(range(100), range(100)))
+    assert list(temp) == list(reversed(range(100)))
+    temp._check()
+    temp = SortedDict(colocate_values=True)
+    assert type(temp) is SortedDict
+    assert temp == {'colocate_values': True}
+
+
+def test_colocated_random():
+    import random
+
+    random.seed(0)
+    temp = SortedColocatedDict(modulo)
+    temp._reset(4)
+    expected = {}
+
+    for _ in range(5000):
+        key = random.randrange(200)
+        action = random.randrange(6)
+
+        if action < 3:
+            temp[key] = expected[key] = random.random()
+        elif action == 3:
+            assert temp.pop(key, None) == expected.pop(key, None)
+        elif action == 4:
+            assert temp.setdefault(key, key) == expected.setdefault(key, key)
+        else:
+            temp.update({key + offset: offset for offset in range(3)})
+            expected.update({key + offset: offset for offset in range(3)})
+
+    temp._check()
+    assert temp == expected
+
+    for key, value in temp.items():
+        assert expected[key] == value
+
+
+def test_colocated_popleft_trim():
+    temp = SortedColocatedDict(zip(range(200), range(200)))
+    _list = temp._list
+    _list._reset(10)
+    snapshot = temp.snapshot()
+    assert _list.popleft(3) == [0, 1, 2]
+    assert _list.popright(3) == [199, 198, 197]
+    assert _list.value(0) == 3
+    assert _list.value(-1) == 196
+    _list._check()
+    assert snapshot.values()[:3] == [0, 1, 2]
+    snapshot._check()
+
+
+class AutoSortedKeyValueList(SortedKeyValueList):
+    DEFAULT_LOAD_FACTOR = 4
+    MIN_AUTO_LOAD_FACTOR = 4
+
+
+class AutoColocatedDict(SortedColocatedDict):
+    def _new_list(self, key):
+        return AutoSortedKeyValueList(key=modulo)
+
+
+def test_colocated_auto():
+    import random
+
+    random.seed(0)
+    temp = AutoColocatedDict()
+    temp._reset('auto')
+
+    for val in range(1000):
+        temp[random.randrange(2000)] = val
+        temp._check()
+
+    assert temp._list._load == 16
+    temp.update(zip(range(2000), range(2000)))
+    temp._check()
+    temp.delete_range(100, 1900)
+    temp._check()
+
+    while len(temp) > 10:
+        del temp[random.choice(temp.keys())]
+        temp._check()
+
+    assert temp._list._load == 4
+    assert list(temp.values()) == [temp[key] for key in temp]
+
+
+def test_colocated_delete():
+    temp = SortedColocatedDict(zip(range(1000), range(1000)))
+    temp._reset(7)
+    temp.delete_range(100, 200)
+    assert temp.pop_range(300, 400, (False, False)) == [
+        (val, val) for val in range(301, 400)
+    ]
+    del temp.keys()[:5]
+    del temp.keys()[::50]
+    del temp.items()[-1]
+    assert temp.popitem(0) == (6, 6)
+    temp._check()
+    assert all(key == value for key, value in temp.items())
+    temp.clear()
+    temp._check()
+
+
+def test_colocated_lookup():
+    mapping = [(val, -val) for val in range(100)]
+    temp = SortedColocatedDict(mapping)
+    temp._reset(7)
+    values = temp.values()
+    items = temp.items()
+    assert values[0] == 0
+    assert values[-1] == -99
+    assert values[10:20] == [-val for val in range(10, 20)]
+    assert values[20:10:-3] == [-val for val in range(20, 10, -3)]
+    assert values[50:10] == []
+    assert items[5] == (5, -5)
+    assert items[5:8] == mapping[5:8]
+    assert temp.peekitem() == (99, -99)
+    assert temp.peekitem(3) == (3, -3)
+    assert list(temp.irange_items(10, 20)) == mapping[10:21]
+    assert list(temp.irange_items(10, 20, reverse=True)) == mapping[20:9:-1]
+    assert list(temp.irange_items(200)) == []
+    assert list(temp.irange_values(95)) == [-val for val in range(95, 100)]
+    assert list(temp.irange_values(200)) == []
+    assert list(temp.islice_items(10, 20)) == mapping[10:20]
+    assert list(temp.islice_values(-5, reverse=True)) == [-99, -98, -97, -96, -95]
+    assert list(temp.islice_values(5, 5)) == []
+    assert list(temp.islice_items(10, 12)) == mapping[10:12]
+    assert list(temp.irange_items(60, 20)) == []
+    assert list(temp.irange_items(60, 20, reverse=True)) == []
+    assert list(temp.irange_values(60, 20)) == []
+
+    with pytest.raises(IndexError):
+        values[100]
+
+
+def test_colocated_copy():
+    import copy
+    import io
+    import pickle
+
+    alpha = SortedColocatedDict(negate, zip(range(100), map(str, range(100))))
+    alpha._reset(7)
+    beta = alpha.copy()
+    gamma = copy.copy(alpha)
+    delta = pickle.loads(pickle.dumps(alpha))
+    fp = io.BytesIO()
+    alpha.dump(fp)
+    fp.seek(0)
+    epsilon = SortedColocatedDict.load(fp)
+
+    for temp in [beta, gamma, delta, epsilon]:
+        assert type(temp) is SortedColocatedDict
+        assert temp == alpha
+        assert list(temp.items()) == list(alpha.items())
+        temp._check()
+
+    assert epsilon._list._load == 7
+
+
+def test_colocated_list():
+    temp = SortedColocatedDict(zip(range(10), range(10)))
+    _list = temp._list
+
+    with pytest.raises(NotImplementedError):
+        _list.add(10)
+
+    with pytest.raises(NotImplementedError):
+        _list.update([10])
+
+    with pytest.raises(ValueError):
+        _list.set_value(10, 10)
+
+    with pytest.raises(ValueError):
+        _list.set_value(-1, 10)
+
+    with pytest.raises(ValueError):
+        type(_list)().set_value(0, 0)
+
+
+def test_colocated_snapshot():
+    temp = SortedColocatedDict(zip(range(100), range(100)))
+    temp._reset(7)
+    snapshot = temp._list.snapshot()
+
+    for key in range(0, 100, 3):
+        temp[key] = -key
+
+    for key in range(1, 100, 3):
+        del temp[key]
+
+    for key in range(100, 150):
+        temp[key] = key
+
+    temp._check()
+    assert list(snapshot) == list(range(100))
+    assert snapshot.value(slice(None)) == list(range(100))
+    snapshot._check()
+
+
 if platform.python_implementation() == 'CPython':
 
     def test_ref_counts():
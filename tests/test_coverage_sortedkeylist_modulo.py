@@ -120,6 +120,22 @@ def test_update_order_consistency():
     assert slt1 == slt2
 
 
+def test_update_merge():
+    slt = SortedKeyList(key=modulo)
+    slt._reset(4)
+
+    slt.update(range(50))
+    slt._check()
+
+    slt.update(range(50, 100))
+    assert slt == sorted(range(100), key=modulo)
+    slt._check()
+
+    slt.update(range(100, 150))
+    assert slt == sorted(range(150), key=modulo)
+    slt._check()
+
+
 def test_contains():
     slt = SortedKeyList(key=modulo)
     slt._reset(7)
@@ -519,6 +535,18 @@ def test_bisect_right():
     assert slt.bisect_right(0) == 20
 
 
+def test_bisect_many():
+    slt = SortedKeyList(key=modulo)
+    assert slt.bisect_left_many([1, 2]) == [0, 0]
+    slt = SortedKeyList(range(100), key=modulo)
+    slt._reset(17)
+    slt.update(range(100))
+    slt._check()
+    values = [random.randrange(-10, 110) for _ in range(500)]
+    assert slt.bisect_left_many(values) == list(map(slt.bisect_left, values))
+    assert slt.bisect_right_many(values) == list(map(slt.bisect_right, values))
+
+
 def test_bisect_key_left():
     slt = SortedKeyList(key=modulo)
     assert slt.bisect_key_left(10) == 0
@@ -822,9 +850,246 @@ def test_repr_subclass():
     )
 
 
+def test_repair_index():
+    random.seed(0)
+    slt = SortedKeyList(range(100), key=modulo)
+    slt._reset(4)
+    slt._build_index()
+
+    for val in range(25):
+        slt.add(random.randrange(1000))
+        assert slt._index
+        slt._check()
+
+    while len(slt) > 1:
+        del slt[random.randrange(len(slt))]
+        slt._check()
+
+    assert not slt._index
+
+
+class AutoSortedKeyList(SortedKeyList):
+    DEFAULT_LOAD_FACTOR = 4
+    MIN_AUTO_LOAD_FACTOR = 4
+
+
+def test_reset_auto():
+    random.seed(0)
+    slt = AutoSortedKeyList(key=modulo)
+    slt._reset('auto')
+
+    for val in range(1000):
+        slt.add(random.randrange(1000))
+        slt._check()
+
+    assert slt._load == 16
+    slt.update(range(2000))
+    slt._check()
+
+    while len(slt) > 10:
+        del slt[random.randrange(len(slt))]
+        slt._check()
+
+    assert slt._load == 4
+
+
 def test_check():
     slt = SortedKeyList(range(10), key=modulo)
     slt._reset(4)
     slt._len = 5
     with pytest.raises(AssertionError):
         slt._check()
+
+
+def test_dump_load():
+    import io
+
+    slt = SortedKeyList(range(1000), key=modulo)
+    slt._reset(23)
+    fp = io.BytesIO()
+    slt.dump(fp)
+    fp.seek(0)
+    that = SortedList.load(fp)
+    assert isinstance(that, SortedKeyList)
+    assert that.key is modulo
+    assert list(that) == list(slt)
+    assert that._keys == slt._keys
+    assert that._load == 23
+    that._check()
+
+
+def test_update_with_keys():
+    slt = SortedKeyList(key=modulo)
+    slt._reset(7)
+    slt.update_with_keys((modulo(val), val) for val in range(100))
+    slt.update_with_keys([(3, 103)])
+    slt._check()
+    assert list(slt) == sorted(list(range(100)) + [103], key=modulo)
+
+
+def test_key_calls():
+    calls = []
+
+    def key(value):
+        calls.append(value)
+        return -value
+
+    slt = SortedKeyList(range(1000), key=key)
+    assert len(calls) == 1000
+    del calls[:]
+
+    slt._reset(17)
+    that = slt.copy()
+    slt.update(range(1000, 1100))
+    slt.update(range(2000, 4000))
+    assert len(calls) == 2100
+    slt._check()
+    that._check()
+    assert list(that) == list(range(999, -1, -1))
+
+
+def test_delete_range():
+    random.seed(0)
+    slt = SortedKeyList(range(1000), key=modulo)
+    slt._reset(7)
+
+    while slt:
+        values = list(slt)
+        minimum = random.randrange(10)
+        maximum = random.randrange(minimum, 10)
+        loc = slt._irange_loc(minimum, maximum, (True, True))
+        if loc is not None:
+            slt._delete_range(*loc)
+        expected = [val for val in values if not minimum <= val % 10 <= maximum]
+        assert list(slt) == expected
+        slt._check()
+
+
+def test_snapshot():
+    random.seed(0)
+    slt = SortedKeyList(range(100), key=modulo)
+    slt._reset(7)
+    snapshots = []
+
+    for step in range(400):
+        if step % 40 == 0:
+            snapshots.append((slt.snapshot(), list(slt)))
+
+        value = random.randrange(200)
+
+        if random.random() < 0.5:
+            slt.add(value)
+        else:
+            slt.discard(value)
+
+        if step % 100 == 50:
+            slt.update(range(0, 200, 3))
+            del slt[10:20]
+
+    slt._check()
+
+    for snapshot, values in snapshots:
+        assert type(snapshot) is type(slt)
+        assert list(snapshot) == values
+        snapshot._check()
+
+    values = list(slt)
+    snapshot = slt.snapshot()
+    snapshot.update(range(50))
+    del snapshot[:10]
+    snapshot._check()
+    assert list(slt) == values
+
+
+def test_popleft_trim():
+    slt = SortedKeyList(range(200), key=modulo)
+    slt._reset(10)
+    slt._build_index()
+    values = list(slt)
+    assert slt.popleft(3) == values[:3]
+    assert slt.popright(3) == values[-3:][::-1]
+    assert slt._index
+    assert list(slt) == values[3:-3]
+    slt._check()
+
+
+def test_popleft_popright():
+    slt = SortedKeyList(range(100), key=modulo)
+    slt._reset(7)
+    values = list(slt)
+    assert slt.popleft() == values[:1]
+    assert slt.popleft(25) == values[1:26]
+    assert slt.popright() == values[-1:]
+    assert slt.popright(25) == values[-26:-1][::-1]
+    assert list(slt) == values[26:-26]
+    slt._check()
+
+
+def test_discard_range_pop_many():
+    slt = SortedKeyList(range(100), key=modulo)
+    slt._reset(7)
+    removed = set(slt.irange(3, 35))
+    assert len(removed) == 30
+    slt.discard_range(3, 35)
+    assert set(slt) == set(range(100)) - removed
+    assert slt.pop_many(0, 10) == [0, 10, 20, 30, 40, 50, 60, 70, 80, 90]
+    del slt[5:15]
+    assert len(slt) == 50
+    slt._check()
+
+
+def test_discard_remove_many():
+    slt = SortedKeyList(list(range(100)) * 2, key=modulo)
+    slt._reset(7)
+    slt.discard_many([5, 15, 15, 15, 100, 23])
+    values = list(range(100)) * 2
+    for value in [5, 15, 15, 23]:
+        values.remove(value)
+    assert sorted(slt) == sorted(values)
+    slt._check()
+    slt.remove_many([0, 10, 0])
+    assert 0 not in slt and slt.count(10) == 1
+    with pytest.raises(ValueError):
+        slt.remove_many([1, 101])
+    assert slt.count(1) == 2
+    slt._check()
+
+
+def test_discard_many_runs():
+    random.seed(0)
+    values = [random.randrange(50) for _ in range(500)]
+    slt = SortedKeyList(values, key=modulo)
+    slt._reset(7)
+
+    for _ in range(20):
+        removals = [random.randrange(60) for _ in range(100)]
+        expected = sorted(slt, key=repr)
+        for value in removals:
+            if value in expected:
+                expected.remove(value)
+        slt.discard_many(removals)
+        assert sorted(slt, key=repr) == expected
+        slt._check()
+        slt.update(random.randrange(50) for _ in range(100))
+
+    slt = SortedKeyList(range(1000), key=modulo)
+    slt.discard_many(reversed(range(0, 1000, 2)))
+    assert list(slt) == list(SortedKeyList(range(1, 1000, 2), key=modulo))
+    slt.remove_many(range(1, 1000, 2))
+    assert not slt
+    slt._check()
+
+
+def test_discard_many_key_calls():
+    calls = []
+
+    def key(val):
+        calls.append(val)
+        return val % 10
+
+    slt = SortedKeyList(range(100), key=key)
+    del calls[:]
+    slt.discard_many([25, 3, 13, 200])
+    assert sorted(calls) == [3, 13, 25, 200]
+    assert 3 not in slt and 13 not in slt and 25 not in slt
+    slt._check()
@@ -1,5 +1,5 @@
 import random
-from sortedcontainers import SortedList
+from sortedcontainers import SortedList, SortedArrayList
 from itertools import chain
 import pytest
 
@@ -61,6 +61,26 @@ def test_update():
     assert all(tup[0] == tup[1] for tup in zip(slt, values))
 
 
+def test_update_merge():
+    slt = SortedList()
+    slt._reset(4)
+
+    slt.update(range(0, 100, 2))
+    slt._check()
+
+    slt.update(range(1, 100, 2))
+    assert slt == list(range(100))
+    slt._check()
+
+    slt.update(range(100, 200))
+    assert slt == list(range(200))
+    slt._check()
+
+    slt.update(range(50, 100))
+    assert len(slt) == 250
+    slt._check()
+
+
 def test_contains():
     slt = SortedList()
     assert 0 not in slt
@@ -404,6 +424,19 @@ def test_bisect_right():
     assert slt.bisect_right(200) == 200
 
 
+def test_bisect_many():
+    slt = SortedList()
+    assert slt.bisect_left_many([1, 2]) == [0, 0]
+    assert slt.bisect_right_many([]) == []
+    slt = SortedList(range(100))
+    slt._reset(17)
+    slt.update(range(100))
+    slt._check()
+    values = [random.randrange(-10, 110) for _ in range(500)]
+    assert slt.bisect_left_many(values) == list(map(slt.bisect_left, values))
+    assert slt.bisect_right_many(values) == list(map(slt.bisect_right, values))
+
+
 def test_copy():
     alpha = SortedList(range(100))
     alpha._reset(7)
@@ -475,6 +508,205 @@ def test_pop_indexerror3():
         slt.pop()
 
 
+def test_popleft():
+    slt = SortedList(range(100))
+    slt._reset(4)
+    slt._build_index()
+    assert slt.popleft() == [0]
+    assert slt.popleft(0) == []
+    assert slt.popleft(1) == [1]
+    assert slt.popleft(10) == list(range(2, 12))
+    slt._check()
+    assert slt.popleft(38) == list(range(12, 50))
+    assert slt[0] == 50
+    slt._check()
+    assert slt.popleft(50) == list(range(50, 100))
+    assert not slt
+    slt._check()
+
+    with pytest.raises(IndexError):
+        slt.popleft()
+
+    with pytest.raises(IndexError):
+        slt.popleft(1)
+
+
+def test_popright():
+    slt = SortedList(range(100))
+    slt._reset(4)
+    slt._build_index()
+    assert slt.popright() == [99]
+    assert slt.popright(0) == []
+    assert slt.popright(1) == [98]
+    assert slt.popright(10) == list(range(97, 87, -1))
+    slt._check()
+    assert slt.popright(38) == list(range(87, 49, -1))
+    assert slt[-1] == 49
+    slt._check()
+    assert slt.popright(50) == list(range(49, -1, -1))
+    assert not slt
+    slt._check()
+
+    with pytest.raises(IndexError):
+        slt.popright()
+
+    with pytest.raises(IndexError):
+        slt.popright(-1)
+
+
+def test_popleft_random():
+    random.seed(0)
+    slt = SortedList(random.random() for _ in range(1000))
+    slt._reset(7)
+    values = list(slt)
+
+    while slt:
+        k = random.randrange(min(len(slt), 50) + 1)
+
+        if random.random() < 0.5:
+            assert slt.popleft(k) == values[:k]
+            del values[:k]
+        else:
+            assert slt.popright(k) == values[::-1][:k]
+            del values[len(values) - k :]
+
+        assert slt == values
+        slt._check()
+
+
+def test_popleft_snapshot():
+    slt = SortedList(range(100))
+    slt._reset(4)
+    snapshot = slt.snapshot()
+    slt.popleft(30)
+    slt.popright(30)
+    assert snapshot == list(range(100))
+    assert slt == list(range(30, 70))
+    slt._check()
+    snapshot._check()
+
+
+def test_popleft_trim():
+    slt = SortedList(range(200))
+    slt._reset(10)
+    slt._build_index()
+    snapshot = slt.snapshot()
+    assert slt.popleft(3) == [0, 1, 2]
+    assert slt.popright(3) == [199, 198, 197]
+    assert slt._index
+    assert slt[0] == 3
+    assert slt[-1] == 196
+    slt._check()
+    assert snapshot == list(range(200))
+    snapshot._check()
+
+
+def test_delitem_slice_bulk():
+    random.seed(0)
+
+    for _ in range(100):
+        slt = SortedList(range(200))
+        slt._reset(7)
+
+        if random.random() < 0.5:
+            slt._build_index()
+
+        values = list(range(200))
+        start = random.randrange(-210, 210)
+        stop = random.randrange(-210, 210)
+        del slt[start:stop]
+        del values[start:stop]
+        assert slt == values
+        slt._check()
+
+
+def test_pop_many():
+    slt = SortedList(range(100))
+    slt._reset(7)
+    assert slt.pop_many(10, 10) == []
+    assert slt.pop_many(10, 5) == []
+    assert slt.pop_many(10, 20) == list(range(10, 20))
+    assert slt.pop_many(-10) == list(range(90, 100))
+    assert slt.pop_many(stop=5) == list(range(5))
+    assert slt == list(range(5, 10)) + list(range(20, 90))
+    slt._check()
+    assert slt.pop_many() == list(range(5, 10)) + list(range(20, 90))
+    assert slt.pop_many() == []
+    slt._check()
+
+
+def test_discard_range():
+    slt = SortedList(list(range(100)) * 2)
+    slt._reset(7)
+    slt.discard_range(10, 19)
+    slt.discard_range(30, 40, inclusive=(False, False))
+    slt.discard_range(200, 300)
+    slt.discard_range(maximum=4)
+    expected = [val for val in range(100) if 5 <= val < 10 or 19 < val <= 30]
+    expected += [val for val in range(40, 100)]
+    assert slt == sorted(expected * 2)
+    slt._check()
+    slt.discard_range()
+    assert not slt
+    slt.discard_range()
+    slt._check()
+
+
+def test_discard_many():
+    random.seed(0)
+    slt = SortedList(random.randrange(100) for rpt in range(1000))
+    slt._reset(7)
+    values = list(slt)
+
+    for rpt in range(20):
+        removals = [random.randrange(-10, 110) for rpt in range(50)]
+        slt.discard_many(removals)
+        for value in removals:
+            if value in values:
+                values.remove(value)
+        assert slt == values
+        slt._check()
+
+    slt.discard_many(values)
+    assert not slt
+    slt.discard_many([1, 2, 3])
+    slt._check()
+
+
+def test_discard_many_snapshot():
+    slt = SortedList(range(200))
+    slt._reset(8)
+    snapshot = slt.snapshot()
+    slt.discard_many(range(0, 200, 3))
+    assert slt == [val for val in range(200) if val % 3]
+    assert snapshot == list(range(200))
+    slt._check()
+    snapshot._check()
+
+
+def test_discard_many_auto():
+    slt = AutoSortedList(range(1000))
+    slt._reset('auto')
+    assert slt._cursor is not None
+    slt.discard_many(range(0, 1000, 2))
+    assert slt == list(range(1, 1000, 2))
+    slt._check()
+
+
+def test_remove_many():
+    slt = SortedList([1, 2, 2, 3, 4, 5])
+    slt._reset(4)
+    slt.remove_many([2, 5, 2])
+    assert slt == [1, 3, 4]
+    with pytest.raises(ValueError):
+        slt.remove_many([1, 1])
+    with pytest.raises(ValueError):
+        slt.remove_many([10])
+    assert slt == [1, 3, 4]
+    slt.remove_many([])
+    slt._check()
+
+
 def test_index():
     slt = SortedList(range(100))
     slt._reset(17)
@@ -659,6 +891,54 @@ def test_pickle():
     assert beta._load == 1000
 
 
+def test_dump_load():
+    import io
+    import pickle
+
+    for values in (
+        list(range(1000)),
+        [value / 7 for value in range(1000)],
+        [str(value) for value in range(1000)],
+        [2**70, 0, -(2**70)],
+        [],
+    ):
+        alpha = SortedList(values)
+        alpha._reset(17)
+        fp = io.BytesIO()
+        alpha.dump(fp)
+        fp.seek(0)
+        beta = SortedList.load(fp)
+        assert alpha == beta
+        assert beta._load == 17
+        assert [len(sublist) for sublist in beta._lists] == [
+            len(sublist) for sublist in alpha._lists
+        ]
+        assert all(type(sublist) is list for sublist in beta._lists)
+        beta._check()
+
+    alpha = SortedList(range(1000))
+    alpha._reset('auto')
+    fp = io.BytesIO()
+    alpha.dump(fp)
+    fp.seek(0)
+    beta = SortedList.load(fp)
+    assert beta._auto
+    beta.update(range(10000))
+    beta._check()
+
+    fp = io.BytesIO()
+    pickle.dump((0, SortedList, (), 1000, False, []), fp)
+    fp.seek(0)
+    with pytest.raises(ValueError):
+        SortedList.load(fp)
+
+    fp = io.BytesIO()
+    SortedList(range(10)).dump(fp)
+    fp.seek(0)
+    with pytest.raises(TypeError):
+        SortedArrayList.load(fp)
+
+
 def test_build_index():
     slt = SortedList([0])
     slt._reset(4)
@@ -666,9 +946,231 @@ def test_build_index():
     slt._check()
 
 
+def test_repair_index():
+    random.seed(0)
+    slt = SortedList(range(100))
+    slt._reset(4)
+    slt._build_index()
+
+    for val in range(25):
+        slt.add(random.random() * 10)
+        assert slt._index
+        slt._check()
+
+    while len(slt) > 1:
+        del slt[random.randrange(len(slt))]
+        slt._check()
+
+    assert not slt._index
+
+
+def test_repair_index_window():
+    slt = SortedList(range(100))
+    slt._reset(4)
+    slt._build_index()
+    size = slt._offset + 1
+
+    for val in range(100, 160):
+        slt.add(val)
+        assert slt._index
+        assert slt[-1] == val
+        slt._check()
+
+    assert slt._offset + 1 == size
+    assert len(slt._lists) * 4 > size * 3 // 2
+
+    for val in range(160, 400):
+        slt.add(val)
+        assert slt[val] == val
+        slt._check()
+
+    assert slt._offset + 1 > size
+
+
+def test_index_positions():
+    slt = SortedList(range(100))
+    slt._reset(4)
+    slt._build_index()
+    assert slt._positions
+
+    for val in range(100, 105):
+        slt.add(val)
+
+    assert slt._index
+    assert not slt._positions
+
+    for val in range(10, 10 + len(slt._lists)):
+        assert slt[val] == val
+        assert not slt._positions
+        slt._check()
+
+    assert slt[60] == 60
+    assert slt._positions
+    slt._check()
+
+
+def test_segments():
+    slt = SortedList(range(100))
+    slt._reset(7)
+
+    for start in range(0, 100, 9):
+        for stop in range(start, 101, 11):
+            segments = list(slt._segments(start, stop))
+            assert sum(segments, []) == list(range(start, stop))
+
+
+def test_numpy():
+    numpy = pytest.importorskip('numpy')
+    arr = numpy.array([5, 3, 1, 4, 2] * 1000)
+    slt = SortedList.from_numpy(arr)
+    slt._check()
+    assert list(slt) == sorted(arr.tolist())
+    assert slt.to_numpy().tolist() == sorted(arr.tolist())
+    result = slt.to_numpy(1000, 3500, dtype=numpy.int64)
+    assert result.dtype == numpy.int64
+    assert result.tolist() == slt[1000:3500]
+    assert slt.to_numpy(10, 5, dtype=float).shape == (0,)
+
+
+class AutoSortedList(SortedList):
+    DEFAULT_LOAD_FACTOR = 4
+    MIN_AUTO_LOAD_FACTOR = 4
+
+
+def test_reset_auto():
+    random.seed(0)
+    slt = AutoSortedList()
+    slt._reset('auto')
+    assert slt._load == 4
+
+    for val in range(1000):
+        slt.add(random.random())
+        if val % 10 == 0:
+            slt[random.randrange(len(slt))]
+        slt._check()
+
+    assert slt._load == 16
+
+    while slt._cursor is not None:
+        slt.add(random.random())
+        slt._check()
+
+    while len(slt) > 10:
+        del slt[random.randrange(len(slt))]
+        slt._check()
+
+    assert slt._load == 4
+
+
+def test_reset_auto_update():
+    slt = AutoSortedList(range(1000))
+    slt._reset('auto')
+    assert slt._load == 16
+    assert slt._cursor is not None
+    slt._check()
+    slt.update(range(1000, 2000))
+    slt._check()
+    assert slt._load == 16
+    slt.update(range(10))
+    slt._check()
+    slt._reset(8)
+    assert not slt._auto
+    assert slt._cursor is None
+    assert all(len(sublist) == 8 for sublist in slt._lists[:-1])
+    slt._check()
+
+
+def test_reset_auto_tracks_size():
+    slt = SortedList(range(100))
+    slt._reset('auto')
+    assert slt._load == SortedList.MIN_AUTO_LOAD_FACTOR == 16
+    slt._check()
+    slt.update(range(100, 5000))
+    assert slt._load == 32
+    slt.update(range(5000, 40000))
+    assert slt._load == 64
+    slt._check()
+    loads = {slt._load}
+
+    while len(slt) > 1000:
+        del slt[-100:]
+        loads.add(slt._load)
+
+    assert loads == {16, 32, 64}
+    assert slt._load == 16
+    slt._check()
+
+
 def test_check():
     slt = SortedList(range(10))
     slt._reset(4)
     slt._len = 5
     with pytest.raises(AssertionError):
         slt._check()
+
+
+def test_delete_range():
+    random.seed(0)
+
+    for load in (4, 7, 'auto'):
+        slt = SortedList(range(1000))
+        slt._reset(load)
+        values = list(range(1000))
+
+        while values:
+            start = random.randrange(len(values))
+            stop = random.randrange(start, min(len(values), start + 300) + 1)
+            slt[len(slt) // 2]
+            min_pos, min_idx = slt._pos(start)
+            if stop < len(values):
+                max_pos, max_idx = slt._pos(stop)
+            else:
+                max_pos = len(slt._lists) - 1
+                max_idx = len(slt._lists[max_pos])
+            slt._delete_range(min_pos, min_idx, max_pos, max_idx)
+            del values[start:stop]
+            assert list(slt) == values
+            slt._check()
+
+            if random.random() < 0.3:
+                for value in random.sample(range(1000, 2000), 50):
+                    slt.add(value)
+                    values.append(value)
+                values.sort()
+                slt._check()
+
+
+def test_snapshot():
+    random.seed(0)
+    slt = SortedList(range(100))
+    slt._reset(7)
+    snapshots = []
+
+    for step in range(400):
+        if step % 40 == 0:
+            snapshots.append((slt.snapshot(), list(slt)))
+
+        value = random.randrange(200)
+
+        if random.random() < 0.5:
+            slt.add(value)
+        else:
+            slt.discard(value)
+
+        if step % 100 == 50:
+            slt.update(range(0, 200, 3))
+            del slt[10:20]
+
+    slt._check()
+
+    for snapshot, values in snapshots:
+        assert type(snapshot) is type(slt)
+        assert list(snapshot) == values
+        snapshot._check()
+
+    values = list(slt)
+    snapshot = slt.snapshot()
+    snapshot.update(range(50))
+    del snapshot[:10]
+    snapshot._check()
+    assert list(slt) == values
@@ -341,6 +341,14 @@ def test_difference_update():
     assert all((val + 20) == temp[val] for val in range(80))
 
 
+def test_difference_update_small():
+    temp = SortedSet(range(100))
+    temp._reset(7)
+    temp.difference_update([5, 50, 500], [50, 95])
+    assert temp == set(range(100)) - {5, 50, 95}
+    temp._check()
+
+
 def test_isub():
     temp = SortedSet(range(100))
     temp._reset(7)
@@ -448,6 +456,85 @@ def test_symmetric_difference_update():
     assert all(temp[val + 25] == (val + 75) for val in range(25))
 
 
+def test_set_algebra_sorted():
+    import random
+
+    random.seed(0)
+
+    for key in (None, negate):
+        for size in (0, 10, 100, 1000):
+            for other_size in (0, 10, 100, 1000):
+                values = random.sample(range(2000), size)
+                others = random.sample(range(2000), other_size)
+                expected = sorted(set(values), key=key)
+
+                for other in (others, SortedSet(others, key=key), SortedSet(others)):
+                    temp = SortedSet(values, key=key)
+                    temp._reset(7)
+
+                    result = temp & other
+                    assert list(result) == sorted(set(values) & set(others), key=key)
+                    result._check()
+                    result = temp - other
+                    assert list(result) == sorted(set(values) - set(others), key=key)
+                    result._check()
+                    result = temp ^ other
+                    assert list(result) == sorted(set(values) ^ set(others), key=key)
+                    result._check()
+                    result = temp | other
+                    assert list(result) == sorted(set(values) | set(others), key=key)
+                    result._check()
+                    assert list(temp) == expected
+
+                    for name in (
+                        'intersection_update',
+                        'difference_update',
+                        'symmetric_difference_update',
+                        'update',
+                    ):
+                        temp = SortedSet(values, key=key)
+                        temp._reset(7)
+                        getattr(temp, name)(other)
+                        lhs = set(values)
+                        getattr(lhs, name)(others)
+                        assert list(temp) == sorted(lhs, key=key)
+                        temp._check()
+
+
+def test_union_many():
+    temp = SortedSet(range(0, 100, 3), key=negate)
+    temp._reset(7)
+    shards = [SortedSet(range(start, 100, 5), key=negate) for start in range(5)]
+    result = temp.union(*shards, iter(range(90, 110)), SortedSet([200]))
+    assert list(result) == [200] + list(range(109, -1, -1))
+    assert result.key is negate
+    result._check()
+    assert temp.union() == temp
+    assert list(temp.copy()) == list(temp)
+    temp.copy()._check()
+
+
+def test_set_algebra_key_calls():
+    calls = []
+
+    def key(value):
+        calls.append(value)
+        return -value
+
+    alpha = SortedSet(range(1000), key=key)
+    beta = SortedSet(range(500, 1500), key=key)
+    del calls[:]
+
+    assert list(alpha & beta) == list(range(999, 499, -1))
+    assert list(alpha - beta) == list(range(499, -1, -1))
+    assert list(alpha ^ beta) == list(range(1499, 999, -1)) + list(range(499, -1, -1))
+    assert list(alpha | beta) == list(range(1499, -1, -1))
+    assert list(alpha.copy()) == list(alpha)
+    alpha.intersection_update(beta)
+    assert not calls
+    alpha._check()
+
+
 def test_pop():
     temp = SortedSet(range(0, 100))
     temp._reset(7)
@@ -535,3 +622,21 @@ def test_pickle():
     beta = pickle.loads(data)
     assert alpha == beta
     assert alpha._key == beta._key
+
+
+def test_dump_load():
+    import io
+
+    alpha = SortedSet(range(1000), key=negate)
+    alpha._reset(37)
+    fp = io.BytesIO()
+    alpha.dump(fp)
+    fp.seek(0)
+    beta = SortedSet.load(fp)
+    assert alpha == beta
+    assert list(alpha) == list(beta)
+    assert beta.key is negate
+    assert beta._list._load == 37
+    beta.add(-1)
+    assert beta[-1] == -1
+    beta._check()